@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from .constants import *
+from .math import *
+
+
+class AggregatorNotSupportedError(Exception):
+    pass
+
+
+class Aggregator(object):
+    # ================================================
+    #  Aggregators
+    # ================================================
+    MEDIAN = 'median'
+    WEIGHTED_MEDIAN = 'weighted_median'
+    WEIGHTED_MEAN = 'weighted_mean'
+    TRIMMED_MEAN = 'trimmed_mean'
+    MAD_FILTERED_MEAN = 'mad_filtered_mean'
+
+    _SUPPORTED = (MEDIAN, WEIGHTED_MEDIAN, WEIGHTED_MEAN, TRIMMED_MEAN, MAD_FILTERED_MEAN)
+
+    # Aggregators depending on the weight of the feeds
+    _WEIGHTED = (WEIGHTED_MEDIAN, WEIGHTED_MEAN)
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def check_supported(aggregator: str) -> None:
+        if aggregator not in Aggregator._SUPPORTED:
+            raise AggregatorNotSupportedError(aggregator)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def is_weighted(aggregator: str) -> bool:
+        return aggregator in Aggregator._WEIGHTED
+
+    @staticmethod
+    def aggregate(aggregator: str, values: list, weights: list = None) -> int:
+        """ Aggregate the feed values. The weights are only
+            required by the weighted aggregators """
+        if aggregator == Aggregator.MEDIAN:
+            return Math.median(values)
+        if aggregator == Aggregator.WEIGHTED_MEDIAN:
+            return Math.weighted_median(values, weights)
+        if aggregator == Aggregator.WEIGHTED_MEAN:
+            return Math.weighted_mean(values, weights)
+        if aggregator == Aggregator.TRIMMED_MEAN:
+            return Math.trimmed_mean(values, TRIMMED_MEAN_PERCENT)
+        if aggregator == Aggregator.MAD_FILTERED_MEAN:
+            return Math.mad_filtered_mean(values, MAD_FILTER_THRESHOLD)
+
+        raise AggregatorNotSupportedError(aggregator)
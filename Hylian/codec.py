@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class InvalidRecordError(Exception):
+    pass
+
+
+class Codec(object):
+    """ Compact RLP-like encoding of a record made of integers and strings.
+
+        A record is the concatenation of its items, each item being prefixed
+        by its length as a little-endian base-128 varint :
+         - integers are stored as minimal two's complement big-endian bytes,
+           so a zero value doesn't take more than its length prefix
+         - strings are stored as UTF-8 bytes
+
+        When a record is decoded, the items missing at its end take the
+        default value of their type, so new fields can be appended to
+        a record layout without migrating the existing records.
+    """
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    @staticmethod
+    def _encode_length(length: int) -> bytes:
+        encoded = bytearray()
+        while length >= 0x80:
+            encoded.append((length & 0x7f) | 0x80)
+            length >>= 7
+        encoded.append(length)
+        return bytes(encoded)
+
+    @staticmethod
+    def _decode_length(data: bytes, offset: int) -> tuple:
+        length = 0
+        shift = 0
+        while True:
+            if offset >= len(data):
+                raise InvalidRecordError(offset)
+            byte = data[offset]
+            offset += 1
+            length |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return length, offset
+            shift += 7
+
+    @staticmethod
+    def _encode_int(value: int) -> bytes:
+        if value == 0:
+            return b''
+        return value.to_bytes((value.bit_length() + 8) // 8, 'big', signed=True)
+
+    @staticmethod
+    def _decode_int(data: bytes) -> int:
+        return int.from_bytes(data, 'big', signed=True)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def encode(layout: tuple, values: list) -> bytes:
+        """ Encode the values, `layout` being the type (int or str) of each value.
+            A None value is decoded as the default value of its type. """
+        encoded = bytearray()
+        for value_type, value in zip(layout, values):
+            if value is None:
+                # Stored as an empty item, decoded as the default value
+                item = b''
+            elif value_type == str:
+                item = value.encode('utf-8')
+            else:
+                item = Codec._encode_int(value)
+            encoded += Codec._encode_length(len(item))
+            encoded += item
+        return bytes(encoded)
+
+    @staticmethod
+    def decode(layout: tuple, data: bytes) -> list:
+        """ Decode a record, `layout` being the type (int or str) of each value """
+        values = []
+        offset = 0
+        data = data or b''
+
+        for value_type in layout:
+            if offset == len(data):
+                # Missing items take the default value of their type
+                values.append('' if value_type == str else 0)
+                continue
+
+            length, offset = Codec._decode_length(data, offset)
+            item = data[offset:offset + length]
+            if len(item) != length:
+                raise InvalidRecordError(offset)
+            offset += length
+
+            if value_type == str:
+                values.append(item.decode('utf-8'))
+            else:
+                values.append(Codec._decode_int(item))
+
+        return values
@@ -18,6 +18,84 @@ from iconservice import *
 from .constants import *
 
 
+class ConfigurationSnapshotImmutableError(Exception):
+    pass
+
+
+class InvalidQuorumToleranceError(Exception):
+    pass
+
+
+class InvalidDeviationThresholdError(Exception):
+    pass
+
+
+class InvalidHeartbeatError(Exception):
+    pass
+
+
+class ConfigurationSnapshot(object):
+    """ Immutable copy of the configuration, read once from the DB
+        and shared by all the checks performed during a call """
+
+    __slots__ = (
+        'minimum_feeds_available',
+        'timeout_price_update',
+        'ticker_name',
+        'aggregator',
+        'evaluation_mode',
+        'quorum_tolerance',
+        'quorum_order',
+        'deviation_threshold',
+        'heartbeat'
+    )
+
+    # ================================================
+    #  Initialization
+    # ================================================
+    def __init__(self,
+                 minimum_feeds_available: int,
+                 timeout_price_update: int,
+                 ticker_name: str,
+                 aggregator: str,
+                 evaluation_mode: str,
+                 quorum_tolerance: int,
+                 quorum_order: str,
+                 deviation_threshold: int,
+                 heartbeat: int) -> None:
+        object.__setattr__(self, 'minimum_feeds_available', minimum_feeds_available)
+        object.__setattr__(self, 'timeout_price_update', timeout_price_update)
+        object.__setattr__(self, 'ticker_name', ticker_name)
+        object.__setattr__(self, 'aggregator', aggregator)
+        object.__setattr__(self, 'evaluation_mode', evaluation_mode)
+        object.__setattr__(self, 'quorum_tolerance', quorum_tolerance)
+        object.__setattr__(self, 'quorum_order', quorum_order)
+        object.__setattr__(self, 'deviation_threshold', deviation_threshold)
+        object.__setattr__(self, 'heartbeat', heartbeat)
+
+    def __setattr__(self, name: str, value) -> None:
+        raise ConfigurationSnapshotImmutableError(name)
+
+    def __delattr__(self, name: str) -> None:
+        raise ConfigurationSnapshotImmutableError(name)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    def serialize(self) -> dict:
+        return {
+            'minimum_feeds_available': self.minimum_feeds_available,
+            'timeout_price_update': self.timeout_price_update,
+            'ticker_name': self.ticker_name,
+            'aggregator': self.aggregator,
+            'evaluation_mode': self.evaluation_mode,
+            'quorum_tolerance': self.quorum_tolerance,
+            'quorum_order': self.quorum_order,
+            'deviation_threshold': self.deviation_threshold,
+            'heartbeat': self.heartbeat
+        }
+
+
 class Configuration(object):
     # ================================================
     #  DB Variables
@@ -35,9 +113,66 @@ class Configuration(object):
     # price consensus
     _TICKER_NAME = 'TICKER_NAME'
 
+    # The function used to aggregate the values of the price feeds
+    _AGGREGATOR = 'AGGREGATOR'
+
+    # Either peek all the price feeds, or stop as soon as
+    # a quorum of price feeds agree on the price
+    _EVALUATION_MODE = 'EVALUATION_MODE'
+
+    # Maximum spread between the values of a quorum, in basis points
+    _QUORUM_TOLERANCE = 'QUORUM_TOLERANCE'
+
+    # The order in which the quorum evaluation peeks the price feeds
+    _QUORUM_ORDER = 'QUORUM_ORDER'
+
+    # Minimum change of the aggregated value, in basis points,
+    # for a new cached value to be stored
+    _DEVIATION_THRESHOLD = 'DEVIATION_THRESHOLD'
+
+    # The amount of time after which a new cached value is stored,
+    # even if it didn't change enough
+    _HEARTBEAT = 'HEARTBEAT'
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def check_quorum_tolerance(quorum_tolerance: int) -> None:
+        if quorum_tolerance < 0:
+            raise InvalidQuorumToleranceError(quorum_tolerance)
+
+    @staticmethod
+    def check_deviation_threshold(deviation_threshold: int) -> None:
+        if deviation_threshold < 0:
+            raise InvalidDeviationThresholdError(deviation_threshold)
+
+    @staticmethod
+    def check_heartbeat(heartbeat: int) -> None:
+        if heartbeat <= 0:
+            raise InvalidHeartbeatError(heartbeat)
+
     # ================================================
     #  Public Methods
     # ================================================
+    @staticmethod
+    def initialize(db: IconScoreDatabase, ticker_name: str, minimum_feeds_available: int) -> None:
+        Configuration.minimum_feeds_available(db).set(minimum_feeds_available)
+        Configuration.ticker_name(db).set(ticker_name)
+        Configuration.timeout_price_update(db).set(DEFAULT_TIMEOUT_PRICE_UPDATE)
+        Configuration.aggregator(db).set(DEFAULT_AGGREGATOR)
+        Configuration.evaluation_mode(db).set(DEFAULT_EVALUATION_MODE)
+        Configuration.quorum_tolerance(db).set(DEFAULT_QUORUM_TOLERANCE)
+        Configuration.quorum_order(db).set(DEFAULT_QUORUM_ORDER)
+        Configuration.deviation_threshold(db).set(DEFAULT_DEVIATION_THRESHOLD)
+        Configuration.heartbeat(db).set(DEFAULT_HEARTBEAT)
+
+    @staticmethod
+    def migrate(db: IconScoreDatabase) -> None:
+        """ Store the default quorum tolerance on the deployments older than
+            the setting, whose missing value would read as a null tolerance """
+        Configuration.quorum_tolerance(db).set(DEFAULT_QUORUM_TOLERANCE)
+
     @staticmethod
     def minimum_feeds_available(db: IconScoreDatabase) -> VarDB:
         return VarDB(Configuration._MINIMUM_FEEDS_AVAILABLE, db, value_type=int)
@@ -50,16 +185,58 @@ class Configuration(object):
     def ticker_name(db: IconScoreDatabase) -> VarDB:
         return VarDB(Configuration._TICKER_NAME, db, value_type=str)
 
+    @staticmethod
+    def aggregator(db: IconScoreDatabase) -> VarDB:
+        return VarDB(Configuration._AGGREGATOR, db, value_type=str)
+
+    @staticmethod
+    def evaluation_mode(db: IconScoreDatabase) -> VarDB:
+        return VarDB(Configuration._EVALUATION_MODE, db, value_type=str)
+
+    @staticmethod
+    def quorum_tolerance(db: IconScoreDatabase) -> VarDB:
+        return VarDB(Configuration._QUORUM_TOLERANCE, db, value_type=int)
+
+    @staticmethod
+    def quorum_order(db: IconScoreDatabase) -> VarDB:
+        return VarDB(Configuration._QUORUM_ORDER, db, value_type=str)
+
+    @staticmethod
+    def deviation_threshold(db: IconScoreDatabase) -> VarDB:
+        return VarDB(Configuration._DEVIATION_THRESHOLD, db, value_type=int)
+
+    @staticmethod
+    def heartbeat(db: IconScoreDatabase) -> VarDB:
+        return VarDB(Configuration._HEARTBEAT, db, value_type=int)
+
+    @staticmethod
+    def snapshot(db: IconScoreDatabase) -> ConfigurationSnapshot:
+        return ConfigurationSnapshot(
+            Configuration.minimum_feeds_available(db).get(),
+            Configuration.timeout_price_update(db).get(),
+            Configuration.ticker_name(db).get(),
+            # Deployments older than the aggregator setting use the median
+            Configuration.aggregator(db).get() or DEFAULT_AGGREGATOR,
+            Configuration.evaluation_mode(db).get() or DEFAULT_EVALUATION_MODE,
+            Configuration.quorum_tolerance(db).get(),
+            Configuration.quorum_order(db).get() or DEFAULT_QUORUM_ORDER,
+            Configuration.deviation_threshold(db).get(),
+            # A null heartbeat is rejected, so it was never set
+            Configuration.heartbeat(db).get() or DEFAULT_HEARTBEAT
+        )
+
     @staticmethod
     def serialize(db: IconScoreDatabase) -> dict:
-        return {
-            'minimum_feeds_available': Configuration.minimum_feeds_available(db).get(),
-            'timeout_price_update': Configuration.timeout_price_update(db).get(),
-            'ticker_name': Configuration.ticker_name(db).get()
-        }
+        return Configuration.snapshot(db).serialize()
 
     @staticmethod
     def delete(db: IconScoreDatabase) -> None:
         Configuration.minimum_feeds_available(db).remove()
         Configuration.timeout_price_update(db).remove()
         Configuration.ticker_name(db).remove()
+        Configuration.aggregator(db).remove()
+        Configuration.evaluation_mode(db).remove()
+        Configuration.quorum_tolerance(db).remove()
+        Configuration.quorum_order(db).remove()
+        Configuration.deviation_threshold(db).remove()
+        Configuration.heartbeat(db).remove()
@@ -18,8 +18,60 @@
 #  Constants
 # ================================================
 TAG = 'Hylian'
-VERSION = '1.2.0'
+VERSION = '1.5.0'
 
 # After 6 hours, the price from the feed is considered
 # as invalid if it isn't updated
 DEFAULT_TIMEOUT_PRICE_UPDATE = 6 * 60 * 60 * 1000 * 1000
+
+# The aggregation used by default to compute the price
+DEFAULT_AGGREGATOR = 'median'
+
+# The weight of a price feed if not specified
+DEFAULT_FEED_WEIGHT = 1
+
+# Percent of the lowest and highest values discarded by the trimmed mean
+TRIMMED_MEAN_PERCENT = 10
+
+# Values further than this multiple of the median absolute
+# deviation are discarded by the MAD filtered mean
+MAD_FILTER_THRESHOLD = 3
+
+# Consecutive failures after which the circuit breaker of a
+# price feed opens, and the feed stops being peeked
+BREAKER_FAILURE_THRESHOLD = 3
+
+# Amount of blocks to wait before peeking again a price feed whose
+# circuit breaker is open. It doubles for each new failure.
+BREAKER_PROBE_INTERVAL = 30
+
+# Maximum amount of times the probe interval is doubled
+BREAKER_MAX_BACKOFF = 10
+
+# The way the price feeds are evaluated by default
+DEFAULT_EVALUATION_MODE = 'full'
+
+# Maximum spread between the values of a quorum, in basis points
+# of their median, for the quorum evaluation to stop early
+DEFAULT_QUORUM_TOLERANCE = 100
+
+# The order in which the quorum evaluation peeks the price feeds by default
+DEFAULT_QUORUM_ORDER = 'weight'
+
+# Amount of aggregated values kept in the price history
+PRICE_HISTORY_CAPACITY = 1024
+
+# Minimum change of the aggregated value, in basis points, for a new
+# cached value to be stored. Every new value is stored if null.
+DEFAULT_DEVIATION_THRESHOLD = 0
+
+# Maximum age of the cached value : a new value is stored after
+# this time even if it didn't change enough (1 hour)
+DEFAULT_HEARTBEAT = 60 * 60 * 1000 * 1000
+
+# Count the storage accesses and the price feeds calls of each
+# external method. Only meant for debugging, as it costs steps.
+INSTRUMENTATION_ENABLED = False
+
+# Fixed point precision of the feeds deviation statistics
+DEVIATION_STATS_PRECISION = 10 ** 6
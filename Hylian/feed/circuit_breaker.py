@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from ..constants import *
+
+
+class BreakerState(object):
+    # The feed works correctly and is peeked on every call
+    CLOSED = 0
+    # The feed failed too many times and isn't peeked anymore
+    OPEN = 1
+    # The feed is open, but is peeked again to check if it recovered
+    HALF_OPEN = 2
+
+
+class CircuitBreaker(object):
+    """ Health state machine of a price feed :
+         - CLOSED -> OPEN : after BREAKER_FAILURE_THRESHOLD consecutive failures
+         - OPEN -> HALF_OPEN : once the probe interval has elapsed since the last failure
+         - HALF_OPEN -> CLOSED : the probe succeeds
+         - HALF_OPEN -> OPEN : the probe fails, and the probe interval doubles
+
+        The transitions from CLOSED and HALF_OPEN are recorded by the write
+        paths only, the read paths just skip the feeds whose breaker is OPEN.
+    """
+
+    @staticmethod
+    def probe_interval(failures: int) -> int:
+        backoff = min(max(failures - BREAKER_FAILURE_THRESHOLD, 0), BREAKER_MAX_BACKOFF)
+        return BREAKER_PROBE_INTERVAL << backoff
+
+    @staticmethod
+    def next_probe(failures: int, last_failure: int) -> int:
+        return last_failure + CircuitBreaker.probe_interval(failures)
+
+    @staticmethod
+    def is_tripped(failures: int) -> bool:
+        return failures >= BREAKER_FAILURE_THRESHOLD
+
+    @staticmethod
+    def state(failures: int, last_failure: int, block_height: int) -> int:
+        if not CircuitBreaker.is_tripped(failures):
+            return BreakerState.CLOSED
+
+        if block_height < CircuitBreaker.next_probe(failures, last_failure):
+            return BreakerState.OPEN
+
+        return BreakerState.HALF_OPEN
@@ -16,6 +16,32 @@
 
 from iconservice import *
 from ..constants import *
+from ..codec import *
+from ..math import *
+from .circuit_breaker import *
+
+
+class InvalidFeedWeightError(Exception):
+    pass
+
+
+class InvalidFeedFieldsError(Exception):
+    pass
+
+
+class FeedFields(object):
+    """ Fields returned when serializing a list of feeds """
+    # Only the SCORE address of the feeds
+    ADDRESS = 'address'
+    # The address and the name of the feeds
+    NAME = 'name'
+    # All the information stored about the feeds
+    FULL = 'full'
+
+    @staticmethod
+    def check(fields: str) -> None:
+        if fields not in (FeedFields.ADDRESS, FeedFields.NAME, FeedFields.FULL):
+            raise InvalidFeedFieldsError(fields)
 
 
 class FeedFactory(object):
@@ -27,8 +53,11 @@ class FeedFactory(object):
 
         feed = Feed(db, address)
 
-        feed._registration.set(now)
-        feed._name.set(name)
+        feed._update({
+            Feed._REGISTRATION: now,
+            Feed._NAME: name,
+            Feed._WEIGHT: DEFAULT_FEED_WEIGHT
+        })
 
         return address
 
@@ -37,25 +66,197 @@ class Feed(object):
     # ================================================
     #  DB Variables
     # ================================================
-    _REGISTRATION = 'FEED_REGISTRATION'
-    _NAME = 'FEED_NAME'
+    # All the information about a feed is packed in a single record
+    _RECORD = 'FEED_RECORD'
+
+    # ================================================
+    #  Record Layout
+    # ================================================
+    # New fields must be appended at the end of the layout
+    _LAYOUT = (int, str, int, int, int, int, int, int, int, int, int, int)
+    _REGISTRATION = 0
+    _NAME = 1
+    # Weight of the feed, used by the weighted aggregators
+    _WEIGHT = 2
+    # Latest price stored for the feed, either submitted
+    # by the feed itself or refreshed by a keeper
+    _VALUE = 3
+    _TIMESTAMP = 4
+    # Health of the feed, used by its circuit breaker :
+    # consecutive failures, block of the last success and of the last failure
+    _FAILURES = 5
+    _LAST_SUCCESS = 6
+    _LAST_FAILURE = 7
+    # Streaming statistics of the deviation of the feed prices from the
+    # aggregated value in basis points : amount of deviations, mean and sum
+    # of squared differences in fixed point, and maximum absolute deviation
+    _DEVIATION_COUNT = 8
+    _DEVIATION_MEAN = 9
+    _DEVIATION_M2 = 10
+    _DEVIATION_MAX = 11
+
+    # ================================================
+    #  Legacy DB Variables
+    # ================================================
+    # Before 1.4.0, each field was stored in its own VarDB
+    _LEGACY_VARIABLES = (
+        ('FEED_REGISTRATION', int),
+        ('FEED_NAME', str),
+        ('FEED_WEIGHT', int),
+        ('FEED_VALUE', int),
+        ('FEED_TIMESTAMP', int)
+    )
+
+    __slots__ = ('_records', '_address', '_record')
 
     # ================================================
     #  Initialization
     # ================================================
     def __init__(self, db: IconScoreDatabase, address: Address) -> None:
-        self._registration = VarDB(f'{Feed._REGISTRATION}_{address}', db, value_type=int)
-        self._name = VarDB(f'{Feed._NAME}_{address}', db, value_type=str)
+        self._records = DictDB(Feed._RECORD, db, value_type=bytes)
+        self._address = address
+        # The record is only read and decoded when accessed
+        self._record = None
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    def _get(self, field: int):
+        if self._record is None:
+            self._record = Codec.decode(Feed._LAYOUT, self._records[self._address])
+        return self._record[field]
+
+    def _update(self, fields: dict) -> None:
+        self._get(Feed._REGISTRATION)
+        for field, value in fields.items():
+            self._record[field] = value
+        self._records[self._address] = Codec.encode(Feed._LAYOUT, self._record)
+
+    def _deviation_fields(self, value: int, aggregated: int) -> dict:
+        """ Return the deviation statistics updated with a price of the feed,
+            compared to the aggregated value it contributed to, in O(1) """
+        deviation = Math.deviation(value, aggregated)
+        count, mean, m2 = Math.welford(
+            self._get(Feed._DEVIATION_COUNT),
+            self._get(Feed._DEVIATION_MEAN),
+            self._get(Feed._DEVIATION_M2),
+            deviation,
+            DEVIATION_STATS_PRECISION)
+
+        return {
+            Feed._DEVIATION_COUNT: count,
+            Feed._DEVIATION_MEAN: mean,
+            Feed._DEVIATION_M2: m2,
+            Feed._DEVIATION_MAX: max(self._get(Feed._DEVIATION_MAX), abs(deviation))
+        }
+
+    def _serialize_health(self) -> dict:
+        failures = self._get(Feed._FAILURES)
+        last_failure = self._get(Feed._LAST_FAILURE)
+        health = {
+            'failures': failures,
+            'last_success': self._get(Feed._LAST_SUCCESS),
+            'last_failure': last_failure,
+            'tripped': CircuitBreaker.is_tripped(failures)
+        }
+        if health['tripped']:
+            health['next_probe'] = CircuitBreaker.next_probe(failures, last_failure)
+        return health
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def _check_weight(weight: int) -> None:
+        if weight <= 0:
+            raise InvalidFeedWeightError(weight)
 
     # ================================================
     #  Public Methods
     # ================================================
+    def set_weight(self, weight: int) -> None:
+        Feed._check_weight(weight)
+        self._update({Feed._WEIGHT: weight})
+
+    def name(self) -> str:
+        return self._get(Feed._NAME)
+
+    def weight(self) -> int:
+        # Feeds registered before the weights were introduced
+        # don't have any weight stored
+        return self._get(Feed._WEIGHT) or DEFAULT_FEED_WEIGHT
+
+    def submit(self, value: int, timestamp: int, block_height: int, aggregated: int = 0) -> None:
+        """ Store the latest price of the feed, which also proves the feed works.
+            If the price contributed to a new `aggregated` value, its deviation
+            statistics are updated in the same write. """
+        fields = {
+            Feed._VALUE: value,
+            Feed._TIMESTAMP: timestamp,
+            Feed._FAILURES: 0,
+            Feed._LAST_SUCCESS: block_height
+        }
+        if aggregated != 0:
+            fields.update(self._deviation_fields(value, aggregated))
+        self._update(fields)
+
+    def record_failure(self, block_height: int) -> None:
+        """ Count at most one failure per block, so calling refresh()
+            repeatedly cannot open the circuit breaker of a feed """
+        if self._get(Feed._LAST_FAILURE) == block_height:
+            return
+
+        self._update({
+            Feed._FAILURES: self._get(Feed._FAILURES) + 1,
+            Feed._LAST_FAILURE: block_height
+        })
+
+    def failures(self) -> int:
+        return self._get(Feed._FAILURES)
+
+    def breaker_state(self, block_height: int) -> int:
+        return CircuitBreaker.state(self._get(Feed._FAILURES), self._get(Feed._LAST_FAILURE), block_height)
+
+    def deviation_stats(self) -> dict:
+        """ Return the statistics of the deviation of the feed prices from the
+            aggregated value, in basis points. The mean and the variance are
+            fixed point numbers with the given precision. """
+        count = self._get(Feed._DEVIATION_COUNT)
+        return {
+            'count': count,
+            'mean': self._get(Feed._DEVIATION_MEAN),
+            'variance': self._get(Feed._DEVIATION_M2) // count if count > 0 else 0,
+            'max': self._get(Feed._DEVIATION_MAX),
+            'precision': DEVIATION_STATS_PRECISION
+        }
+
+    def value(self) -> int:
+        return self._get(Feed._VALUE)
+
+    def timestamp(self) -> int:
+        return self._get(Feed._TIMESTAMP)
+
     def serialize(self) -> dict:
         return {
-            'registration': self._registration.get(),
-            'name': self._name.get()
+            'registration': self._get(Feed._REGISTRATION),
+            'name': self.name(),
+            'weight': self.weight(),
+            'last_value': self.value(),
+            'last_timestamp': self.timestamp(),
+            'health': self._serialize_health(),
+            'deviation': self.deviation_stats()
         }
 
     def delete(self) -> None:
-        self._registration.remove()
-        self._name.remove()
+        self._records.remove(self._address)
+
+    @staticmethod
+    def migrate(db: IconScoreDatabase, address: Address) -> None:
+        """ Pack the feed fields stored in separate VarDBs into a single record """
+        record = []
+        for name, value_type in Feed._LEGACY_VARIABLES:
+            variable = VarDB(f'{name}_{address}', db, value_type=value_type)
+            record.append(variable.get())
+            variable.remove()
+
+        DictDB(Feed._RECORD, db, value_type=bytes)[address] = Codec.encode(Feed._LAYOUT, record)
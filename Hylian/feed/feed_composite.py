@@ -18,6 +18,7 @@ from iconservice import *
 from .feed import *
 from ..utils import *
 from ..configuration import *
+from ..linked_list import *
 
 
 class TooMuchFeedsError(Exception):
@@ -32,6 +33,14 @@ class FeedNotExistsError(Exception):
     pass
 
 
+class DuplicateFeedError(Exception):
+    pass
+
+
+class InvalidPaginationError(Exception):
+    pass
+
+
 class FeedComposite(object):
     # ================================================
     #  Constants
@@ -42,38 +51,77 @@ class FeedComposite(object):
     # ================================================
     #  DB Variables
     # ================================================
-    # Feeds are indexed by their SCORE address
-    _INDEX = 'FEED_COMPOSITE_INDEX'
+    # Feeds SCORE addresses, in the order of their registration
+    # unless moved by the owner
+    _REGISTRY = 'FEED_COMPOSITE_REGISTRY'
+
+    # ================================================
+    #  Legacy DB Variables
+    # ================================================
+    # Before 1.5.0, the feeds were indexed in an array, with the position
+    # of each feed in the array starting from 1
+    _LEGACY_INDEX = 'FEED_COMPOSITE_INDEX'
+    _LEGACY_POSITION = 'FEED_COMPOSITE_POSITION'
 
     # ================================================
     #  Private Methods
     # ================================================
     @staticmethod
-    def feeds(db: IconScoreDatabase) -> ArrayDB:
-        return ArrayDB(FeedComposite._INDEX, db, value_type=Address)
+    def feeds(db: IconScoreDatabase) -> LinkedList:
+        return LinkedList(FeedComposite._REGISTRY, db)
+
+    @staticmethod
+    def _add(db: IconScoreDatabase, address: Address, name: str, now: int) -> Address:
+        # Add new feed object
+        feed = FeedFactory.create(db, address, name, now)
+        FeedComposite.feeds(db).append(feed)
+
+        return feed
+
+    @staticmethod
+    def _remove(db: IconScoreDatabase, address: Address) -> None:
+        FeedComposite.feeds(db).remove(address)
+        Feed(db, address).delete()
 
     # ================================================
     #  Checks
     # ================================================
     @staticmethod
-    def _check_maximum_amount_feeds(db: IconScoreDatabase) -> None:
-        feeds_count = len(FeedComposite.feeds(db))
+    def _check_maximum_amount_feeds(db: IconScoreDatabase, additional: int = 1) -> None:
+        feeds_count = len(FeedComposite.feeds(db)) + additional
         if feeds_count > FeedComposite._MAXIMUM_FEEDS:
             raise TooMuchFeedsError(feeds_count)
 
     @staticmethod
     def _check_feed_not_already_exists(db: IconScoreDatabase, address: Address) -> None:
-        if address in FeedComposite.feeds(db):
+        if FeedComposite.exists(db, address):
             raise FeedAlreadyExistsError(str(address))
 
     @staticmethod
     def _check_feed_already_exists(db: IconScoreDatabase, address: Address) -> None:
-        if address not in FeedComposite.feeds(db):
+        if not FeedComposite.exists(db, address):
             raise FeedNotExistsError(str(address))
 
+    @staticmethod
+    def _check_pagination(offset: int, limit: int) -> None:
+        if offset < 0 or limit < 0:
+            raise InvalidPaginationError(offset, limit)
+
+    @staticmethod
+    def _check_no_duplicate(addresses: list) -> None:
+        seen = set()
+        for address in addresses:
+            if address in seen:
+                raise DuplicateFeedError(str(address))
+            seen.add(address)
+
     # ================================================
     #  Public Methods
     # ================================================
+    @staticmethod
+    def exists(db: IconScoreDatabase, address: Address) -> bool:
+        return address in FeedComposite.feeds(db)
+
     @staticmethod
     def add(db: IconScoreDatabase,
             address: Address,
@@ -81,17 +129,60 @@ class FeedComposite(object):
             now: int) -> Address:
         FeedComposite._check_maximum_amount_feeds(db)
         FeedComposite._check_feed_not_already_exists(db, address)
+        return FeedComposite._add(db, address, name, now)
 
-        # Add new feed object
-        feed = FeedFactory.create(db, address, name, now)
-        FeedComposite.feeds(db).put(feed)
+    @staticmethod
+    def add_many(db: IconScoreDatabase, feeds: list, now: int) -> None:
+        """ Add a list of (address, name) price feeds.
+            All the feeds are checked before any of them is added. """
+        FeedComposite._check_no_duplicate([address for address, name in feeds])
+        FeedComposite._check_maximum_amount_feeds(db, len(feeds))
+        for address, name in feeds:
+            FeedComposite._check_feed_not_already_exists(db, address)
 
-        return feed
+        for address, name in feeds:
+            FeedComposite._add(db, address, name, now)
 
     @staticmethod
     def remove(db: IconScoreDatabase, address: Address) -> None:
         FeedComposite._check_feed_already_exists(db, address)
-        Utils.array_db_remove(FeedComposite.feeds(db), address, False)
+        FeedComposite._remove(db, address)
+
+    @staticmethod
+    def remove_many(db: IconScoreDatabase, addresses: list) -> None:
+        """ Remove a list of price feeds.
+            All the feeds are checked before any of them is removed. """
+        FeedComposite._check_no_duplicate(addresses)
+        for address in addresses:
+            FeedComposite._check_feed_already_exists(db, address)
+
+        for address in addresses:
+            FeedComposite._remove(db, address)
+
+    @staticmethod
+    def replace(db: IconScoreDatabase, feeds: list, now: int) -> tuple:
+        """ Replace the registered price feeds with a list of (address, name) feeds.
+            The feeds already registered are kept as they are.
+            Return the addresses of the removed feeds and the added (address, name) feeds. """
+        FeedComposite._check_no_duplicate([address for address, name in feeds])
+        kept = set(address for address, name in feeds)
+
+        removed = [address for address in FeedComposite.feeds(db) if address not in kept]
+        added = [(address, name) for address, name in feeds if not FeedComposite.exists(db, address)]
+        FeedComposite._check_maximum_amount_feeds(db, len(added) - len(removed))
+
+        for address in removed:
+            FeedComposite._remove(db, address)
+        for address, name in added:
+            FeedComposite._add(db, address, name, now)
+
+        return removed, added
+
+    @staticmethod
+    def move(db: IconScoreDatabase, address: Address, position: int) -> None:
+        """ Move a feed to a position of the registry, starting from 0 """
+        FeedComposite._check_feed_already_exists(db, address)
+        FeedComposite.feeds(db).move(address, position)
 
     @staticmethod
     def get(db: IconScoreDatabase, address: Address) -> Feed:
@@ -99,15 +190,57 @@ class FeedComposite(object):
         return Feed(db, address)
 
     @staticmethod
-    def serialize(db: IconScoreDatabase) -> list:
-        return list(map(lambda address: {
-            'address': address,
-            'feed': Feed(db, address).serialize()
-        }, FeedComposite.feeds(db)))
+    def count(db: IconScoreDatabase) -> int:
+        return len(FeedComposite.feeds(db))
+
+    @staticmethod
+    def page(db: IconScoreDatabase, offset: int = 0, limit: int = 0) -> list:
+        """ Return the addresses of the feeds registered from `offset`,
+            up to `limit` feeds. A null limit returns all the remaining feeds. """
+        FeedComposite._check_pagination(offset, limit)
+        return FeedComposite.feeds(db).range(offset, limit)
+
+    @staticmethod
+    def serialize_feed(db: IconScoreDatabase, address: Address, fields: str = FeedFields.FULL) -> dict:
+        if fields == FeedFields.ADDRESS:
+            return {'address': address}
+
+        if fields == FeedFields.NAME:
+            return {'address': address, 'name': Feed(db, address).name()}
+
+        return {'address': address, 'feed': Feed(db, address).serialize()}
+
+    @staticmethod
+    def serialize(db: IconScoreDatabase,
+                  offset: int = 0,
+                  limit: int = 0,
+                  fields: str = FeedFields.FULL) -> list:
+        FeedFields.check(fields)
+        return [
+            FeedComposite.serialize_feed(db, address, fields)
+            for address in FeedComposite.page(db, offset, limit)
+        ]
+
+    @staticmethod
+    def pack_records(db: IconScoreDatabase) -> None:
+        for address in ArrayDB(FeedComposite._LEGACY_INDEX, db, value_type=Address):
+            Feed.migrate(db, address)
+
+    @staticmethod
+    def build_registry(db: IconScoreDatabase) -> None:
+        """ Move the feeds from the legacy array to the registry, keeping their order """
+        index = ArrayDB(FeedComposite._LEGACY_INDEX, db, value_type=Address)
+        positions = DictDB(FeedComposite._LEGACY_POSITION, db, value_type=int)
+        feeds = FeedComposite.feeds(db)
+
+        for address in index:
+            feeds.append(address)
+            positions.remove(address)
+        Utils.array_db_clear(index)
 
     @staticmethod
     def delete(db: IconScoreDatabase) -> None:
         feeds = FeedComposite.feeds(db)
-        while feeds:
-            address = feeds.pop()
+        for address in feeds:
             Feed(db, address).delete()
+        feeds.clear()
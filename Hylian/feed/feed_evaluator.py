@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .feed import *
+from .feed_composite import *
+from ..interfaces import *
+from ..configuration import *
+from ..time import *
+from ..math import *
+from ..instrumentation import *
+from ..tx_cache import *
+
+
+class WrongTickerName(Exception):
+    pass
+
+
+class PriceFeedTimeout(Exception):
+    pass
+
+
+class CircuitBreakerOpen(Exception):
+    pass
+
+
+class EvaluationModeNotSupportedError(Exception):
+    pass
+
+
+class QuorumOrderNotSupportedError(Exception):
+    pass
+
+
+class EvaluationMode(object):
+    # Peek every registered price feed
+    FULL = 'full'
+    # Peek the price feeds by priority, and stop as soon as enough
+    # of them are operational and agree on the price
+    QUORUM = 'quorum'
+
+    @staticmethod
+    def check_supported(evaluation_mode: str) -> None:
+        if evaluation_mode not in (EvaluationMode.FULL, EvaluationMode.QUORUM):
+            raise EvaluationModeNotSupportedError(evaluation_mode)
+
+
+class QuorumOrder(object):
+    # Decreasing weight, then increasing amount of consecutive failures
+    WEIGHT = 'weight'
+    # Increasing amount of consecutive failures, then decreasing weight
+    HEALTH = 'health'
+    # Order of the registry, which the owner can change with move_feed
+    REGISTRY = 'registry'
+
+    @staticmethod
+    def check_supported(quorum_order: str) -> None:
+        if quorum_order not in (QuorumOrder.WEIGHT, QuorumOrder.HEALTH, QuorumOrder.REGISTRY):
+            raise QuorumOrderNotSupportedError(quorum_order)
+
+    @staticmethod
+    def sort(quorum_order: str, feeds: list) -> None:
+        """ Sort a list of (address, Feed) by priority. The sort is stable,
+            so the registry order breaks the ties. """
+        if quorum_order == QuorumOrder.WEIGHT:
+            feeds.sort(key=lambda item: (-item[1].weight(), item[1].failures()))
+        elif quorum_order == QuorumOrder.HEALTH:
+            feeds.sort(key=lambda item: (item[1].failures(), -item[1].weight()))
+
+
+class FeedStatus(object):
+    OPERATIONAL = 'OPERATIONAL'
+    MALFUNCTIONING = 'MALFUNCTIONING'
+    # The feed circuit breaker is open, so it hasn't been peeked
+    SKIPPED = 'SKIPPED'
+
+
+class FeedEvaluation(object):
+    """ Result of a single price feed evaluation """
+
+    # ================================================
+    #  Initialization
+    # ================================================
+    def __init__(self,
+                 address: Address,
+                 status: str,
+                 value: int = 0,
+                 timestamp: int = 0,
+                 reason: str = None) -> None:
+        self.address = address
+        self.status = status
+        self.value = value
+        self.timestamp = timestamp
+        self.reason = reason
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    def is_operational(self) -> bool:
+        return self.status == FeedStatus.OPERATIONAL
+
+    def is_skipped(self) -> bool:
+        return self.status == FeedStatus.SKIPPED
+
+    def serialize(self, db: IconScoreDatabase, fields: str = FeedFields.FULL) -> dict:
+        result = FeedComposite.serialize_feed(db, self.address, fields)
+        result['status'] = self.status
+
+        if self.is_operational():
+            result['value'] = self.value
+            result['timestamp'] = self.timestamp
+        else:
+            result['reason'] = self.reason
+
+        return result
+
+
+class FeedEvaluator(object):
+    """ Peek every registered price feed once and check its result """
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def _check_ticker_name(config: ConfigurationSnapshot, ticker_name: str) -> None:
+        if config.ticker_name != ticker_name:
+            raise WrongTickerName(ticker_name)
+
+    @staticmethod
+    def _check_timeout(config: ConfigurationSnapshot, now: int, timestamp: int) -> None:
+        if Time.is_timeout(now, timestamp, config.timeout_price_update):
+            raise PriceFeedTimeout(timestamp)
+
+    @staticmethod
+    def _call_peek(score: IconScoreBase, address: Address):
+        """ Return the result of the price feed, or the error it raised """
+        try:
+            Instrumentation.count_score_call(score)
+            return score.create_interface_score(address, PriceFeedInterface).peek()
+        except Exception as error:
+            return error
+
+    @staticmethod
+    def _peek(score: IconScoreBase, address: Address) -> dict:
+        """ Peek a price feed once per transaction """
+        result = TxCache.get(score, ('peek', address), lambda: FeedEvaluator._call_peek(score, address))
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def evaluate_feed(score: IconScoreBase,
+                      db: IconScoreDatabase,
+                      config: ConfigurationSnapshot,
+                      address: Address,
+                      feed: Feed = None) -> FeedEvaluation:
+        if feed is None:
+            feed = Feed(db, address)
+
+        # Don't waste a call on a feed failing repeatedly until its next probe
+        if feed.breaker_state(score.block_height) == BreakerState.OPEN:
+            return FeedEvaluation(address, FeedStatus.SKIPPED, reason=repr(CircuitBreakerOpen(str(address))))
+
+        try:
+            # Retrieve the price
+            feed_result = FeedEvaluator._peek(score, address)
+            # Price Feed Checks
+            FeedEvaluator._check_ticker_name(config, feed_result['ticker_name'])
+            FeedEvaluator._check_timeout(config, score.now(), feed_result['timestamp'])
+        except Exception as error:
+            # A pricefeed SCORE may not work as expected anymore,
+            # keep track of the reason instead of failing
+            return FeedEvaluation(address, FeedStatus.MALFUNCTIONING, reason=repr(error))
+
+        return FeedEvaluation(address,
+                              FeedStatus.OPERATIONAL,
+                              value=feed_result['value'],
+                              timestamp=feed_result['timestamp'])
+
+    @staticmethod
+    def evaluate(score: IconScoreBase,
+                 db: IconScoreDatabase,
+                 config: ConfigurationSnapshot,
+                 offset: int = 0,
+                 limit: int = 0) -> list:
+        """ Evaluate the feeds registered from `offset`, up to `limit` feeds.
+            A null limit evaluates all the remaining feeds. """
+        return [
+            FeedEvaluator.evaluate_feed(score, db, config, address)
+            for address in FeedComposite.page(db, offset, limit)
+        ]
+
+    @staticmethod
+    def evaluate_quorum(score: IconScoreBase,
+                        db: IconScoreDatabase,
+                        config: ConfigurationSnapshot) -> list:
+        """ Evaluate the feeds in the configured quorum order. Stop as soon as
+            `minimum_feeds_available` feeds are operational, if their values
+            spread is within the quorum tolerance. Otherwise, evaluate all
+            the remaining feeds. """
+        feeds = [(address, Feed(db, address)) for address in FeedComposite.feeds(db)]
+        QuorumOrder.sort(config.quorum_order, feeds)
+
+        quorum = max(config.minimum_feeds_available, 1)
+        evaluations = []
+        values = []
+
+        for address, feed in feeds:
+            evaluation = FeedEvaluator.evaluate_feed(score, db, config, address, feed)
+            evaluations.append(evaluation)
+            if not evaluation.is_operational():
+                continue
+
+            values.append(evaluation.value)
+            # Only check the quorum once : if the first sample disagrees,
+            # all the remaining feeds are evaluated
+            if len(values) == quorum and Math.is_within_tolerance(values, config.quorum_tolerance):
+                break
+
+        return evaluations
+
+    @staticmethod
+    def evaluate_value(score: IconScoreBase,
+                       db: IconScoreDatabase,
+                       config: ConfigurationSnapshot) -> list:
+        """ Evaluate the feeds required to compute the value,
+            depending on the configured evaluation mode """
+        if config.evaluation_mode == EvaluationMode.QUORUM:
+            return FeedEvaluator.evaluate_quorum(score, db, config)
+        return FeedEvaluator.evaluate(score, db, config)
+
+    @staticmethod
+    def operational(evaluations: list) -> list:
+        return [evaluation for evaluation in evaluations if evaluation.is_operational()]
+
+    @staticmethod
+    def malfunctioning(evaluations: list) -> list:
+        return [evaluation for evaluation in evaluations if not evaluation.is_operational()]
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .constants import *
+from .checks import *
+
+
+class Instrumentation(object):
+    """ Counters of the storage accesses and price feeds calls of
+        each instrumented method. The counters are kept in memory
+        by the SCORE instance and are lost when it is reloaded. """
+
+    # Only the debug builds count the storage accesses, as it costs steps.
+    # The simulator may enable it before deploying the SCORE.
+    enabled = INSTRUMENTATION_ENABLED
+
+    # A SCORE cannot read the time : the simulator may set a function
+    # returning the current time in seconds, so the methods are timed too
+    clock = None
+
+    def __init__(self) -> None:
+        # Counters by method name
+        self._counters = {}
+        # Methods being executed, the innermost last
+        self._stack = []
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    def _counter(self, method: str) -> dict:
+        if method not in self._counters:
+            self._counters[method] = {'calls': 0, 'reads': 0, 'writes': 0, 'score_calls': 0, 'time': 0.0}
+        return self._counters[method]
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def create() -> 'Instrumentation':
+        """ Return new counters, or None if the instrumentation is disabled """
+        return Instrumentation() if Instrumentation.enabled else None
+
+    @staticmethod
+    def database(db: IconScoreDatabase, instrumentation: 'Instrumentation') -> IconScoreDatabase:
+        """ Return a database counting its accesses, if the instrumentation is enabled """
+        return InstrumentedDatabase(db, instrumentation) if instrumentation else db
+
+    @staticmethod
+    def count_score_call(score: IconScoreBase) -> None:
+        if score._instrumentation:
+            score._instrumentation.count('score_calls')
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """ Add to a counter of every method being executed """
+        for method in self._stack:
+            self._counter(method)[name] += amount
+
+    def enter(self, method: str) -> None:
+        self._stack.append(method)
+        self._counter(method)['calls'] += 1
+
+    def leave(self, method: str, elapsed: float) -> None:
+        self._stack.pop()
+        self._counter(method)['time'] += elapsed
+
+    def reset(self) -> None:
+        self._counters.clear()
+        self._stack.clear()
+
+    def serialize(self) -> dict:
+        return {method: dict(counter) for method, counter in self._counters.items()}
+
+
+class InstrumentedDatabase(object):
+    """ Database counting the reads and writes done through it.
+        Every VarDB, ArrayDB and DictDB access ends up here, so
+        the storage classes of iconservice are used unchanged. """
+
+    def __init__(self, db: IconScoreDatabase, instrumentation: Instrumentation) -> None:
+        self._db = db
+        self._instrumentation = instrumentation
+
+    def get(self, key: bytes):
+        self._instrumentation.count('reads')
+        return self._db.get(key)
+
+    def put(self, key: bytes, value) -> None:
+        self._instrumentation.count('writes')
+        self._db.put(key, value)
+
+    def delete(self, key: bytes) -> None:
+        self._instrumentation.count('writes')
+        self._db.delete(key)
+
+    def get_sub_db(self, prefix: bytes) -> 'InstrumentedDatabase':
+        return InstrumentedDatabase(self._db.get_sub_db(prefix), self._instrumentation)
+
+    def __getattr__(self, name: str):
+        return getattr(self._db, name)
+
+
+def instrumented(func):
+    """ Count the storage accesses and price feeds calls of a method.
+        May be composed with the other decorators such as catch_error. """
+    if not isfunction(func):
+        raise NotAFunctionError
+
+    @wraps(func)
+    def __wrapper(self: object, *args, **kwargs):
+        instrumentation = self._instrumentation
+        if not instrumentation:
+            return func(self, *args, **kwargs)
+
+        clock = Instrumentation.clock
+        start = clock() if clock else 0
+        instrumentation.enter(func.__name__)
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            instrumentation.leave(func.__name__, clock() - start if clock else 0)
+
+    return __wrapper
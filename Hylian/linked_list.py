@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+
+
+class ItemAlreadyExistsError(Exception):
+    pass
+
+
+class ItemNotExistsError(Exception):
+    pass
+
+
+class InvalidPositionError(Exception):
+    pass
+
+
+class LinkedList(object):
+    """ Ordered set of addresses stored in a DictDB, as a doubly linked list :
+        the insertion and the removal of an item cost O(1) and keep the order
+        of the other items, iterating over the items costs O(n).
+        The items are addresses, as a missing address reads as None, which
+        marks the ends of the list. Other types read as a default value
+        such as 0, that could not be told apart from a stored item. """
+
+    # ================================================
+    #  Initialization
+    # ================================================
+    def __init__(self, name: str, db: IconScoreDatabase) -> None:
+        # Item => next item, and item => previous item
+        self._next = DictDB(f'{name}_NEXT', db, value_type=Address)
+        self._prev = DictDB(f'{name}_PREV', db, value_type=Address)
+        self._head = VarDB(f'{name}_HEAD', db, value_type=Address)
+        self._tail = VarDB(f'{name}_TAIL', db, value_type=Address)
+        self._count = VarDB(f'{name}_COUNT', db, value_type=int)
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    def _link(self, prev, item, next) -> None:
+        """ Insert an unlinked item between two adjacent items """
+        if prev is None:
+            self._head.set(item)
+        else:
+            self._next[prev] = item
+            self._prev[item] = prev
+
+        if next is None:
+            self._tail.set(item)
+        else:
+            self._prev[next] = item
+            self._next[item] = next
+
+    def _unlink(self, item) -> None:
+        """ Remove an item and join its neighbours. None is never stored,
+            the missing entries mark the ends of the list. """
+        prev = self._prev[item]
+        next = self._next[item]
+
+        if prev is None:
+            if next is None:
+                self._head.remove()
+            else:
+                self._head.set(next)
+        else:
+            self._prev.remove(item)
+            if next is None:
+                self._next.remove(prev)
+            else:
+                self._next[prev] = next
+
+        if next is None:
+            if prev is None:
+                self._tail.remove()
+            else:
+                self._tail.set(prev)
+        else:
+            self._next.remove(item)
+            if prev is None:
+                self._prev.remove(next)
+            else:
+                self._prev[next] = prev
+
+    def _at(self, position: int, count: int):
+        """ Return the item at a position, walking from the nearest end of the list """
+        if position < count // 2:
+            item = self._head.get()
+            for _ in range(position):
+                item = self._next[item]
+        else:
+            item = self._tail.get()
+            for _ in range(count - 1 - position):
+                item = self._prev[item]
+        return item
+
+    # ================================================
+    #  Checks
+    # ================================================
+    def _check_not_exists(self, item) -> None:
+        if item in self:
+            raise ItemAlreadyExistsError(str(item))
+
+    def _check_exists(self, item) -> None:
+        if item not in self:
+            raise ItemNotExistsError(str(item))
+
+    def _check_position(self, position: int) -> None:
+        if not 0 <= position < len(self):
+            raise InvalidPositionError(position)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    def __len__(self) -> int:
+        return self._count.get()
+
+    def __contains__(self, item) -> bool:
+        return self._prev[item] is not None or self._head.get() == item
+
+    def __iter__(self):
+        item = self._head.get()
+        while item is not None:
+            yield item
+            item = self._next[item]
+
+    def append(self, item) -> None:
+        self._check_not_exists(item)
+        self._link(self._tail.get(), item, None)
+        self._count.set(len(self) + 1)
+
+    def remove(self, item) -> None:
+        self._check_exists(item)
+        self._unlink(item)
+        self._count.set(len(self) - 1)
+
+    def move(self, item, position: int) -> None:
+        """ Move an item to a position of the list, starting from 0 """
+        self._check_exists(item)
+        self._check_position(position)
+
+        count = len(self)
+        self._unlink(item)
+
+        # The position is now among the other items
+        if position == count - 1:
+            self._link(self._tail.get(), item, None)
+        else:
+            next = self._at(position, count - 1)
+            self._link(self._prev[next], item, next)
+
+    def range(self, offset: int, limit: int) -> list:
+        """ Return up to `limit` items from `offset`. A null limit returns all the remaining items. """
+        count = len(self)
+        if offset >= count:
+            return []
+
+        items = []
+        item = self._at(offset, count)
+        while item is not None and (limit == 0 or len(items) < limit):
+            items.append(item)
+            item = self._next[item]
+        return items
+
+    def clear(self) -> None:
+        item = self._head.get()
+        while item is not None:
+            next = self._next[item]
+            self._next.remove(item)
+            self._prev.remove(item)
+            item = next
+
+        self._head.remove()
+        self._tail.remove()
+        self._count.remove()
@@ -22,18 +22,21 @@ from .version import *
 from .math import *
 from .time import *
 from .feed.feed_composite import *
+from .feed.feed_evaluator import *
 from .configuration import *
-
-
-class WrongTickerName(Exception):
-    pass
+from .price_cache import *
+from .aggregator import *
+from .ticker_composite import *
+from .price_history import *
+from .instrumentation import *
+from .tx_cache import *
 
 
 class NotEnoughFeedsAvailable(Exception):
     pass
 
 
-class PriceFeedTimeout(Exception):
+class MulticallMethodNotSupportedError(Exception):
     pass
 
 
@@ -44,7 +47,9 @@ class Hylian(IconScoreBase):
     #  Initialization
     # ================================================
     def __init__(self, db: IconScoreDatabase) -> None:
-        super().__init__(db)
+        # The storage accesses are only counted if the instrumentation is enabled
+        self._instrumentation = Instrumentation.create()
+        super().__init__(Instrumentation.database(db, self._instrumentation))
 
     def on_install(self,
                    ticker_name: str,
@@ -52,179 +57,702 @@ class Hylian(IconScoreBase):
         super().on_install()
 
         # Set configuration
-        Configuration.minimum_feeds_available(self.db).set(minimum_feeds_available)
-        Configuration.ticker_name(self.db).set(ticker_name)
-        Configuration.timeout_price_update(self.db).set(DEFAULT_TIMEOUT_PRICE_UPDATE)
+        Configuration.initialize(self.db, ticker_name, minimum_feeds_available)
+        self._ticker_added(self.db, minimum_feeds_available)
 
         # Set Version
         Version.set(self.db, VERSION)
 
     def on_update(self) -> None:
         super().on_update()
+
+        # Migrate the storage of the previous versions
+        last_version = Version.get(self.db) or '0.0.0'
+        if Version.is_less_than_target_version(last_version, '1.4.0'):
+            for db in TickerComposite.databases(self.db):
+                FeedComposite.pack_records(db)
+                Configuration.migrate(db)
+        if Version.is_less_than_target_version(last_version, '1.5.0'):
+            for db in TickerComposite.databases(self.db):
+                FeedComposite.build_registry(db)
+
         Version.set(self.db, VERSION)
 
     # ================================================
-    #  Checks
+    #  Event Logs
     # ================================================
-    def _check_ticker_name(self, ticker_name: str) -> None:
-        if Configuration.ticker_name(self.db).get() != ticker_name:
-            raise WrongTickerName(ticker_name)
+    @eventlog(indexed=1)
+    def TickerAdded(self, ticker: str, minimum_feeds_available: int):
+        pass
+
+    @eventlog(indexed=1)
+    def TickerRemoved(self, ticker: str):
+        pass
+
+    @eventlog(indexed=2)
+    def FeedAdded(self, ticker: str, address: Address, name: str):
+        pass
+
+    @eventlog(indexed=2)
+    def FeedRemoved(self, ticker: str, address: Address):
+        pass
 
-    def _check_timeout(self, timestamp: int) -> None:
-        if Time.is_timeout(self.now(), timestamp, Configuration.timeout_price_update(self.db).get()):
-            raise PriceFeedTimeout(timestamp)
+    @eventlog(indexed=2)
+    def FeedMoved(self, ticker: str, address: Address, position: int):
+        pass
 
-    def _check_enough_feeds_available(self, values: list) -> None:
-        if len(values) < Configuration.minimum_feeds_available(self.db).get():
+    @eventlog(indexed=2)
+    def FeedWeightChanged(self, ticker: str, address: Address, weight: int):
+        pass
+
+    @eventlog(indexed=2)
+    def ConfigChanged(self, ticker: str, name: str, value: str):
+        pass
+
+    @eventlog(indexed=1)
+    def PriceUpdated(self, ticker: str, value: int, timestamp: int):
+        pass
+
+    # ================================================
+    #  Checks
+    # ================================================
+    def _check_enough_feeds_available(self, config: ConfigurationSnapshot, values: list) -> None:
+        if len(values) < config.minimum_feeds_available:
             raise NotEnoughFeedsAvailable(len(values))
 
+    # ================================================
+    #  Private Methods
+    # ================================================
+    def _operational(self, config: ConfigurationSnapshot, evaluations: list) -> list:
+        operational = []
+
+        for evaluation in evaluations:
+            if not evaluation.is_operational():
+                # A pricefeed SCORE may not work as expected anymore,
+                # but we want to keep running Hylian as long as
+                # there is a minimum amount of pricefeed available
+                Logger.warning(f'{evaluation.address} didnt work correctly:' +
+                               f'{evaluation.reason}', TAG)
+                continue
+            operational.append(evaluation)
+
+        self._check_enough_feeds_available(config, operational)
+        return operational
+
+    def _value(self, db: IconScoreDatabase, config: ConfigurationSnapshot, evaluations: list) -> int:
+        operational = self._operational(config, evaluations)
+        values = [evaluation.value for evaluation in operational]
+
+        weights = None
+        if Aggregator.is_weighted(config.aggregator):
+            weights = [Feed(db, evaluation.address).weight() for evaluation in operational]
+
+        # Compute the aggregated value
+        return Aggregator.aggregate(config.aggregator, values, weights)
+
+    def _live_value(self, db: IconScoreDatabase) -> int:
+        config = Configuration.snapshot(db)
+        return self._value(db, config, FeedEvaluator.evaluate_value(self, db, config))
+
+    def _transaction_value(self, ticker: str) -> int:
+        """ Compute the aggregated value once per transaction """
+        return TxCache.get(self, ('value', ticker), lambda: self._live_value(TickerComposite.db(self.db, ticker)))
+
+    def _serialize_evaluations(self,
+                               db: IconScoreDatabase,
+                               evaluations: list,
+                               fields: str = FeedFields.FULL) -> list:
+        return [evaluation.serialize(db, fields) for evaluation in evaluations]
+
+    @staticmethod
+    def _load_addresses(addresses: str) -> list:
+        return [Address.from_string(address) for address in json_loads(addresses)]
+
+    @staticmethod
+    def _ticker(db: IconScoreDatabase) -> str:
+        return Configuration.ticker_name(db).get()
+
+    def _feeds_added(self, db: IconScoreDatabase, feeds: list) -> None:
+        ticker = self._ticker(db)
+        for address, name in feeds:
+            self.FeedAdded(ticker, address, name)
+
+    def _feeds_removed(self, db: IconScoreDatabase, addresses: list) -> None:
+        ticker = self._ticker(db)
+        for address in addresses:
+            PriceCache.discard(db, address)
+            self.FeedRemoved(ticker, address)
+
+    def _config_changed(self, db: IconScoreDatabase, name: str, value) -> None:
+        self.ConfigChanged(self._ticker(db), name, str(value))
+
+    def _ticker_added(self, db: IconScoreDatabase, minimum_feeds_available: int) -> None:
+        """ Emit the initial configuration of a ticker, so its state
+            can be rebuilt from the event logs only """
+        self.TickerAdded(self._ticker(db), minimum_feeds_available)
+        for name, value in Configuration.serialize(db).items():
+            if name != 'ticker_name':
+                self._config_changed(db, name, value)
+
+    @staticmethod
+    def _load_feeds(feeds: str) -> list:
+        return [(Address.from_string(feed['address']), feed['name']) for feed in json_loads(feeds)]
+
+    def _getter(self, db: IconScoreDatabase, config: ConfigurationSnapshot, method: str):
+        """ Return the result of a readonly method, reusing the configuration snapshot """
+        configuration = config.serialize()
+        if method in configuration:
+            return configuration[method]
+        if method == 'configuration':
+            return configuration
+        if method == 'version':
+            return Version.get(self.db)
+        if method == 'feeds_count':
+            return FeedComposite.count(db)
+        if method == 'cached_value':
+            return PriceCache.serialize(db)
+        if method == 'value':
+            return self._value(db, config, FeedEvaluator.evaluate_value(self, db, config))
+        raise MulticallMethodNotSupportedError(method)
+
+    def _update_cached_value(self, db: IconScoreDatabase, config: ConfigurationSnapshot) -> int:
+        """ Aggregate the latest prices and store the result.
+            Return the new aggregated value, or 0 if it wasn't updated. """
+        count, value = PriceCache.compute(db, config, self.now())
+        if value is None:
+            # Keep the previous aggregated value until enough feeds submit a price
+            Logger.warning(f'Cached value not updated: {repr(NotEnoughFeedsAvailable(count))}', TAG)
+            return 0
+
+        if not PriceCache.should_update(db, config, value, self.now()):
+            # The cached value is still recent and close enough
+            return 0
+
+        PriceCache.set(db, value, self.now())
+        PriceHistory.append(db, self.now(), value)
+        self.PriceUpdated(config.ticker_name, value, self.now())
+        return value
+
     # ================================================
     #  External methods
     # ================================================
     @external
     @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def add_ticker(self, ticker_name: str, minimum_feeds_available: int) -> None:
+        """ Add a new ticker served by Hylian, with its own set of price feeds """
+        TickerComposite.add(self.db, ticker_name, minimum_feeds_available)
+        self._ticker_added(TickerComposite.db(self.db, ticker_name), minimum_feeds_available)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def remove_ticker(self, ticker_name: str) -> None:
+        """ Remove a ticker and its price feeds from Hylian """
+        TickerComposite.remove(self.db, ticker_name)
+        self.TickerRemoved(ticker_name)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
     @catch_error
-    def add_feed(self, address: Address, name: str) -> None:
+    def add_feed(self, address: Address, name: str, ticker: str = None) -> None:
         """ Add a price feed to Hylian """
-        FeedComposite.add(self.db, address, name, self.now())
+        db = TickerComposite.db(self.db, ticker)
+        FeedComposite.add(db, address, name, self.now())
+        self._feeds_added(db, [(address, name)])
 
     @external
     @only_owner
+    @invalidates_cache
+    @instrumented
     @catch_error
-    def remove_feed(self, address: Address) -> None:
+    def remove_feed(self, address: Address, ticker: str = None) -> None:
         """ Remove a price feed from Hylian """
-        FeedComposite.remove(self.db, address)
+        db = TickerComposite.db(self.db, ticker)
+        FeedComposite.remove(db, address)
+        self._feeds_removed(db, [address])
+        self._update_cached_value(db, Configuration.snapshot(db))
 
     @external
     @only_owner
+    @invalidates_cache
+    @instrumented
     @catch_error
-    def set_timeout_price_update(self, timeout_price_update: int) -> None:
-        Configuration.timeout_price_update(self.db).set(timeout_price_update)
+    def add_feeds(self, feeds: str, ticker: str = None) -> None:
+        """ Add several price feeds to Hylian at once.
+            `feeds` is a JSON list such as '[{"address": "cx...", "name": "..."}]' """
+        db = TickerComposite.db(self.db, ticker)
+        feeds = self._load_feeds(feeds)
+        FeedComposite.add_many(db, feeds, self.now())
+        self._feeds_added(db, feeds)
 
     @external
     @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def remove_feeds(self, addresses: str, ticker: str = None) -> None:
+        """ Remove several price feeds from Hylian at once.
+            `addresses` is a JSON list such as '["cx...", "cx..."]' """
+        db = TickerComposite.db(self.db, ticker)
+        addresses = self._load_addresses(addresses)
+        FeedComposite.remove_many(db, addresses)
+        self._feeds_removed(db, addresses)
+        self._update_cached_value(db, Configuration.snapshot(db))
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def replace_feeds(self, feeds: str, ticker: str = None) -> None:
+        """ Replace the price feeds registered to Hylian with a new list of feeds.
+            `feeds` is a JSON list such as '[{"address": "cx...", "name": "..."}]' """
+        db = TickerComposite.db(self.db, ticker)
+        removed, added = FeedComposite.replace(db, self._load_feeds(feeds), self.now())
+        self._feeds_removed(db, removed)
+        self._feeds_added(db, added)
+        self._update_cached_value(db, Configuration.snapshot(db))
+
+    @external
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def submit_value(self, value: int, ticker: str = None) -> None:
+        """ Store the price submitted by a registered price feed SCORE
+            and update the cached aggregated value """
+        db = TickerComposite.db(self.db, ticker)
+        # Only the registered price feeds are allowed to submit a price
+        feed = FeedComposite.get(db, self.msg.sender)
+        PriceCache.submit(db, self.msg.sender, value, self.now())
+        # The feed record is written once, with the deviation from the new aggregated value
+        aggregated = self._update_cached_value(db, Configuration.snapshot(db))
+        feed.submit(value, self.now(), self.block_height, aggregated)
+
+    @external
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def refresh(self, ticker: str = None) -> None:
+        """ Peek every price feed, store their prices and health,
+            then update the cached aggregated value """
+        db = TickerComposite.db(self.db, ticker)
+        config = Configuration.snapshot(db)
+
+        prices = []
+        for evaluation in FeedEvaluator.evaluate(self, db, config):
+            if evaluation.is_operational():
+                prices.append((evaluation.address, evaluation.value, evaluation.timestamp))
+            elif not evaluation.is_skipped():
+                # Record the failure so the feed circuit breaker may open
+                Feed(db, evaluation.address).record_failure(self.block_height)
+
+        # Store all the prices at once
+        PriceCache.submit_all(db, prices)
+        aggregated = self._update_cached_value(db, config)
+
+        # Each feed record is written once, with the deviation from the new aggregated value
+        for address, value, timestamp in prices:
+            Feed(db, address).submit(value, timestamp, self.block_height, aggregated)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def move_feed(self, address: Address, position: int, ticker: str = None) -> None:
+        """ Move a price feed to a position of the registry, starting from 0.
+            The feeds are listed and evaluated in the order of the registry. """
+        db = TickerComposite.db(self.db, ticker)
+        FeedComposite.move(db, address, position)
+        self.FeedMoved(self._ticker(db), address, position)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_feed_weight(self, address: Address, weight: int, ticker: str = None) -> None:
+        """ Set the weight of a price feed, used by the weighted aggregators """
+        db = TickerComposite.db(self.db, ticker)
+        FeedComposite.get(db, address).set_weight(weight)
+        self.FeedWeightChanged(self._ticker(db), address, weight)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_aggregator(self, aggregator: str, ticker: str = None) -> None:
+        """ Set the function used to aggregate the values of the price feeds """
+        Aggregator.check_supported(aggregator)
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.aggregator(db).set(aggregator)
+        self._config_changed(db, 'aggregator', aggregator)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_evaluation_mode(self, evaluation_mode: str, ticker: str = None) -> None:
+        """ Set how the price feeds are evaluated by value() : either "full"
+            to peek all of them, or "quorum" to stop as soon as enough
+            price feeds agree on the price """
+        EvaluationMode.check_supported(evaluation_mode)
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.evaluation_mode(db).set(evaluation_mode)
+        self._config_changed(db, 'evaluation_mode', evaluation_mode)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_quorum_tolerance(self, quorum_tolerance: int, ticker: str = None) -> None:
+        """ Set the maximum spread of a quorum, in basis points of its median """
+        Configuration.check_quorum_tolerance(quorum_tolerance)
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.quorum_tolerance(db).set(quorum_tolerance)
+        self._config_changed(db, 'quorum_tolerance', quorum_tolerance)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_quorum_order(self, quorum_order: str, ticker: str = None) -> None:
+        """ Set the order in which the quorum evaluation peeks the price feeds :
+            "weight" by decreasing weight then increasing consecutive failures,
+            "health" by increasing consecutive failures then decreasing weight,
+            or "registry" in the order of the registry """
+        QuorumOrder.check_supported(quorum_order)
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.quorum_order(db).set(quorum_order)
+        self._config_changed(db, 'quorum_order', quorum_order)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_deviation_threshold(self, deviation_threshold: int, ticker: str = None) -> None:
+        """ Set the minimum change of the aggregated value, in basis points,
+            for a new cached value to be stored. 0 stores every new value. """
+        Configuration.check_deviation_threshold(deviation_threshold)
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.deviation_threshold(db).set(deviation_threshold)
+        self._config_changed(db, 'deviation_threshold', deviation_threshold)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_heartbeat(self, heartbeat: int, ticker: str = None) -> None:
+        """ Set the maximum age of the cached value before a new value is stored """
+        Configuration.check_heartbeat(heartbeat)
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.heartbeat(db).set(heartbeat)
+        self._config_changed(db, 'heartbeat', heartbeat)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
+    @catch_error
+    def set_timeout_price_update(self, timeout_price_update: int, ticker: str = None) -> None:
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.timeout_price_update(db).set(timeout_price_update)
+        self._config_changed(db, 'timeout_price_update', timeout_price_update)
+
+    @external
+    @only_owner
+    @invalidates_cache
+    @instrumented
     @catch_error
     def set_ticker_name(self, ticker_name: str) -> None:
-        Configuration.ticker_name(self.db).set(ticker_name)
+        previous = self._ticker(self.db)
+        TickerComposite.rename_primary(self.db, ticker_name)
+        self.ConfigChanged(previous, 'ticker_name', ticker_name)
 
     @external
     @only_owner
+    @invalidates_cache
+    @instrumented
     @catch_error
-    def set_minimum_feeds_available(self, minimum_feeds_available: int) -> None:
-        Configuration.minimum_feeds_available(self.db).set(minimum_feeds_available)
+    def set_minimum_feeds_available(self, minimum_feeds_available: int, ticker: str = None) -> None:
+        db = TickerComposite.db(self.db, ticker)
+        Configuration.minimum_feeds_available(db).set(minimum_feeds_available)
+        self._config_changed(db, 'minimum_feeds_available', minimum_feeds_available)
 
     # ==== ReadOnly methods =============================================
     @external(readonly=True)
+    @instrumented
+    @catch_error
+    def tickers(self) -> list:
+        """ Return the tickers served by Hylian, starting with the primary ticker """
+        return TickerComposite.serialize(self.db)
+
+    @external(readonly=True)
+    @instrumented
     @catch_error
-    def feeds(self) -> list:
-        """ Return a list of price feeds registered to Hylian """
-        return FeedComposite.serialize(self.db)
+    def feeds(self,
+              ticker: str = None,
+              offset: int = 0,
+              limit: int = 0,
+              fields: str = FeedFields.FULL) -> list:
+        """ Return a list of price feeds registered to Hylian, starting from `offset`,
+            up to `limit` feeds (all of them if null). `fields` is either
+            "address", "name" or "full" """
+        return FeedComposite.serialize(TickerComposite.db(self.db, ticker), offset, limit, fields)
 
     @external(readonly=True)
+    @instrumented
     @catch_error
-    def feed(self, address: Address) -> dict:
+    def feeds_count(self, ticker: str = None) -> int:
+        """ Return the amount of price feeds registered to Hylian """
+        return FeedComposite.count(TickerComposite.db(self.db, ticker))
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def feed(self, address: Address, ticker: str = None) -> dict:
         """ Return a single price feed registered to Hylian """
-        return FeedComposite.get(self.db, address).serialize()
+        return FeedComposite.get(TickerComposite.db(self.db, ticker), address).serialize()
 
     @external(readonly=True)
+    @instrumented
     @catch_error
-    def value(self) -> int:
-        """ Return the median value of price feeds, computed dynamically """
-        values = []
+    def feed_stats(self, address: Address, ticker: str = None) -> dict:
+        """ Return the statistics of the deviation of a price feed from the
+            aggregated value, in basis points """
+        return FeedComposite.get(TickerComposite.db(self.db, ticker), address).deviation_stats()
 
-        for address in FeedComposite.feeds(self.db):
-            try:
-                feed_score = self.create_interface_score(address, PriceFeedInterface)
-                # Retrieve the price
-                feed_result = feed_score.peek()
-                # Price Feed Checks
-                self._check_ticker_name(feed_result['ticker_name'])
-                self._check_timeout(feed_result['timestamp'])
-                # Process
-                values.append(feed_result['value'])
-            except Exception as error:
-                # A pricefeed SCORE may not work as expected anymore,
-                # but we want to keep running Hylian as long as
-                # there is a minimum amount of pricefeed available
-                Logger.warning(f'{address} didnt work correctly:' +
-                               f'{type(error)} : {str(error)}', TAG)
-                continue
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def value(self, ticker: str = None) -> int:
+        """ Return the aggregated value of price feeds, computed dynamically.
+            The value is computed once per transaction. """
+        return self._transaction_value(ticker)
 
-        self._check_enough_feeds_available(values)
-        # Compute the median value
-        return Math.median(values)
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def values(self, tickers: str) -> dict:
+        """ Return the aggregated values of several tickers, computed dynamically.
+            `tickers` is a JSON list of ticker names, such as '["ICXUSD", "ICXBTC"]' """
+        result = {}
+        for ticker in json_loads(tickers):
+            result[ticker] = self._transaction_value(ticker)
+        return result
 
     @external(readonly=True)
+    @instrumented
     @catch_error
-    def operational_feeds(self) -> list:
-        """ Return the operational feeds """
-        operational = []
+    def quantiles(self, points: str, ticker: str = None) -> dict:
+        """ Return the quantiles of the price feeds values, computed dynamically.
+            `points` is a JSON list of percents, such as "[10, 50, 90]" """
+        db = TickerComposite.db(self.db, ticker)
+        config = Configuration.snapshot(db)
+        operational = self._operational(config, FeedEvaluator.evaluate(self, db, config))
+        values = [evaluation.value for evaluation in operational]
+        points = json_loads(points)
+        return dict(zip(map(str, points), Math.quantiles(values, points)))
 
-        for feed in self.feeds():
-            try:
-                address = feed['address']
-                feed_score = self.create_interface_score(address, PriceFeedInterface)
-                # Retrieve the price
-                feed_result = feed_score.peek()
-                # Price Feed Checks
-                self._check_ticker_name(feed_result['ticker_name'])
-                self._check_timeout(feed_result['timestamp'])
-                # Process
-                feed['value'] = feed_result['value']
-                operational.append(feed)
-            except Exception as error:
-                # Don't count the malfunctioning feed
-                continue
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def cached_value(self, ticker: str = None) -> dict:
+        """ Return the aggregated value computed from the latest submitted
+            prices, along with the time it has been computed """
+        return PriceCache.serialize(TickerComposite.db(self.db, ticker))
 
-        # Return the number of feeds operational
-        return operational
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def twap(self, window: int, ticker: str = None) -> int:
+        """ Return the time weighted average of the cached aggregated
+            values over the last `window` microseconds """
+        return PriceHistory.twap(TickerComposite.db(self.db, ticker), window, self.now())
 
     @external(readonly=True)
+    @instrumented
     @catch_error
-    def malfunctioning_feeds(self) -> list:
-        """ Return the malfunctioning feeds """
-        malfunctioning = []
-
-        for feed in self.feeds():
-            try:
-                address = feed['address']
-                feed_score = self.create_interface_score(address, PriceFeedInterface)
-                # Retrieve the price
-                feed_result = feed_score.peek()
-                # Price Feed Checks
-                self._check_ticker_name(feed_result['ticker_name'])
-                self._check_timeout(feed_result['timestamp'])
-                value = feed_result['value']
-                # Don't count the operational feed
-            except Exception as error:
-                feed['reason'] = repr(error)
-                malfunctioning.append(feed)
-                continue
+    def history(self, from_timestamp: int, to_timestamp: int, ticker: str = None) -> list:
+        """ Return the cached aggregated values computed between two timestamps """
+        return PriceHistory.serialize(TickerComposite.db(self.db, ticker), from_timestamp, to_timestamp)
 
-        # Return the number of feeds malfunctioning
-        return malfunctioning
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def operational_feeds(self,
+                          ticker: str = None,
+                          offset: int = 0,
+                          limit: int = 0,
+                          fields: str = FeedFields.FULL) -> list:
+        """ Return the operational feeds among the registered feeds starting
+            from `offset`, up to `limit` feeds (all of them if null).
+            `fields` is either "address", "name" or "full" """
+        FeedFields.check(fields)
+        db = TickerComposite.db(self.db, ticker)
+        evaluations = FeedEvaluator.evaluate(self, db, Configuration.snapshot(db), offset, limit)
+        return self._serialize_evaluations(db, FeedEvaluator.operational(evaluations), fields)
 
     @external(readonly=True)
+    @instrumented
+    @catch_error
+    def malfunctioning_feeds(self,
+                             ticker: str = None,
+                             offset: int = 0,
+                             limit: int = 0,
+                             fields: str = FeedFields.FULL) -> list:
+        """ Return the malfunctioning feeds among the registered feeds starting
+            from `offset`, up to `limit` feeds (all of them if null).
+            `fields` is either "address", "name" or "full" """
+        FeedFields.check(fields)
+        db = TickerComposite.db(self.db, ticker)
+        evaluations = FeedEvaluator.evaluate(self, db, Configuration.snapshot(db), offset, limit)
+        return self._serialize_evaluations(db, FeedEvaluator.malfunctioning(evaluations), fields)
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def multicall(self, methods: str, ticker: str = None) -> dict:
+        """ Return the results of several readonly methods at once, by method name.
+            `methods` is a JSON list such as '["ticker_name", "version", "value"]'.
+            The configuration getters, "configuration", "version", "feeds_count",
+            "cached_value" and "value" are supported. """
+        db = TickerComposite.db(self.db, ticker)
+        config = Configuration.snapshot(db)
+        return {method: self._getter(db, config, method) for method in json_loads(methods)}
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def state(self, ticker: str = None) -> dict:
+        """ Return the configuration, the version and the aggregated value """
+        db = TickerComposite.db(self.db, ticker)
+        config = Configuration.snapshot(db)
+        result = {
+            'configuration': config.serialize(),
+            'version': Version.get(self.db)
+        }
+
+        try:
+            result['value'] = self._getter(db, config, 'value')
+        except NotEnoughFeedsAvailable as error:
+            # Still return the configuration, as snapshot() does
+            result['reason'] = repr(error)
+
+        return result
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def snapshot(self, ticker: str = None) -> dict:
+        """ Return the aggregated value, the operational and the malfunctioning
+            feeds, while peeking every price feed only once """
+        db = TickerComposite.db(self.db, ticker)
+        config = Configuration.snapshot(db)
+        evaluations = FeedEvaluator.evaluate(self, db, config)
+        result = {
+            'operational': self._serialize_evaluations(db, FeedEvaluator.operational(evaluations)),
+            'malfunctioning': self._serialize_evaluations(db, FeedEvaluator.malfunctioning(evaluations))
+        }
+
+        try:
+            result['value'] = self._value(db, config, evaluations)
+        except NotEnoughFeedsAvailable as error:
+            # Still return the feeds status so the issue can be diagnosed
+            result['reason'] = repr(error)
+
+        return result
+
+    # Only the debug builds expose the instrumentation counters
+    if INSTRUMENTATION_ENABLED:
+        @external(readonly=True)
+        @catch_error
+        def instrumentation(self) -> dict:
+            """ Return the storage accesses and price feeds calls counted
+                for each method since the SCORE was loaded """
+            return self._instrumentation.serialize()
+
+    @external(readonly=True)
+    @instrumented
     @catch_error
     def version(self) -> str:
         """ Return the Hylian version """
         return Version.get(self.db)
 
     @external(readonly=True)
+    @instrumented
     @catch_error
-    def minimum_feeds_available(self) -> int:
+    def minimum_feeds_available(self, ticker: str = None) -> int:
         """ Return the minimum amount of available price feeds required
             for Hylian to work """
-        return Configuration.minimum_feeds_available(self.db).get()
+        return Configuration.minimum_feeds_available(TickerComposite.db(self.db, ticker)).get()
 
     @external(readonly=True)
+    @instrumented
     @catch_error
-    def timeout_price_update(self) -> int:
+    def timeout_price_update(self, ticker: str = None) -> int:
         """ Return the value of the price feed timeout """
-        return Configuration.timeout_price_update(self.db).get()
+        return Configuration.timeout_price_update(TickerComposite.db(self.db, ticker)).get()
 
     @external(readonly=True)
+    @instrumented
     @catch_error
     def ticker_name(self) -> str:
         """ Return the ticker name of Hylian """
         return Configuration.ticker_name(self.db).get()
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def evaluation_mode(self, ticker: str = None) -> str:
+        """ Return how the price feeds are evaluated by value() """
+        return Configuration.evaluation_mode(TickerComposite.db(self.db, ticker)).get() or DEFAULT_EVALUATION_MODE
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def quorum_tolerance(self, ticker: str = None) -> int:
+        """ Return the maximum spread of a quorum, in basis points of its median """
+        return Configuration.quorum_tolerance(TickerComposite.db(self.db, ticker)).get()
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def quorum_order(self, ticker: str = None) -> str:
+        """ Return the order in which the quorum evaluation peeks the price feeds """
+        return Configuration.quorum_order(TickerComposite.db(self.db, ticker)).get() or DEFAULT_QUORUM_ORDER
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def deviation_threshold(self, ticker: str = None) -> int:
+        """ Return the minimum change of the aggregated value, in basis points,
+            for a new cached value to be stored """
+        return Configuration.deviation_threshold(TickerComposite.db(self.db, ticker)).get()
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def heartbeat(self, ticker: str = None) -> int:
+        """ Return the maximum age of the cached value before a new value is stored """
+        return Configuration.heartbeat(TickerComposite.db(self.db, ticker)).get() or DEFAULT_HEARTBEAT
+
+    @external(readonly=True)
+    @instrumented
+    @catch_error
+    def aggregator(self, ticker: str = None) -> str:
+        """ Return the function used to aggregate the values of the price feeds """
+        return Configuration.aggregator(TickerComposite.db(self.db, ticker)).get() or DEFAULT_AGGREGATOR
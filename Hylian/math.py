@@ -15,14 +15,213 @@
 # limitations under the License.
 
 
+class InvalidQuantilePointError(Exception):
+    pass
+
+
 class Math():
 
+    # Below this size, a range is simply sorted
+    _SELECT_SORT_THRESHOLD = 16
+
+    # Size of the groups used by the median of medians
+    _SELECT_GROUP_SIZE = 5
+
+    @staticmethod
+    def _median_of_three(values: list, left: int, right: int) -> int:
+        a, b, c = values[left], values[(left + right) // 2], values[right]
+        if a < b:
+            if b < c:
+                return b
+            return c if a < c else a
+        if a < c:
+            return a
+        return c if b < c else b
+
+    @staticmethod
+    def _median_of_medians(values: list, left: int, right: int) -> int:
+        size = Math._SELECT_GROUP_SIZE
+        medians = []
+        for start in range(left, right + 1, size):
+            group = sorted(values[start:min(start + size, right + 1)])
+            medians.append(group[(len(group) - 1) // 2])
+        return Math.select(medians, (len(medians) - 1) // 2)
+
+    @staticmethod
+    def _partition(values: list, left: int, right: int, pivot: int) -> tuple:
+        """ Three-way partition of values[left:right + 1] around the pivot.
+            Return (lt, gt) such as :
+             - values[left:lt] < pivot
+             - values[lt:gt + 1] == pivot
+             - values[gt + 1:right + 1] > pivot """
+        lt, index, gt = left, left, right
+        while index <= gt:
+            value = values[index]
+            if value < pivot:
+                values[lt], values[index] = value, values[lt]
+                lt += 1
+                index += 1
+            elif value > pivot:
+                values[gt], values[index] = value, values[gt]
+                gt -= 1
+            else:
+                index += 1
+        return lt, gt
+
+    @staticmethod
+    def multiselect(values: list, ranks: list) -> dict:
+        """ Return the k-th smallest values for each k in ranks (starting from 0),
+            without sorting the whole list. Costs O(n log m) for m ranks on
+            average, and falls back to a median of medians pivot when the
+            partitions are unbalanced so the worst case remains bounded. """
+        values = list(values)
+        result = {}
+        # Allow about twice the depth of a balanced partitioning
+        max_depth = 2 * len(values).bit_length()
+        pending = [(0, len(values) - 1, sorted(set(ranks)), 0)]
+
+        while pending:
+            left, right, wanted, depth = pending.pop()
+            if not wanted:
+                continue
+
+            if right - left < Math._SELECT_SORT_THRESHOLD:
+                values[left:right + 1] = sorted(values[left:right + 1])
+                for rank in wanted:
+                    result[rank] = values[rank]
+                continue
+
+            if depth < max_depth:
+                pivot = Math._median_of_three(values, left, right)
+            else:
+                pivot = Math._median_of_medians(values, left, right)
+
+            lt, gt = Math._partition(values, left, right, pivot)
+            lower = []
+            upper = []
+            for rank in wanted:
+                if rank < lt:
+                    lower.append(rank)
+                elif rank > gt:
+                    upper.append(rank)
+                else:
+                    result[rank] = pivot
+
+            pending.append((left, lt - 1, lower, depth + 1))
+            pending.append((gt + 1, right, upper, depth + 1))
+
+        return result
+
+    @staticmethod
+    def select(values: list, rank: int) -> int:
+        """ Return the k-th smallest value (starting from 0) """
+        if not 0 <= rank < len(values):
+            raise IndexError(rank)
+        return Math.multiselect(values, [rank])[rank]
+
+    @staticmethod
+    def quantiles(values: list, points: list) -> list:
+        """ Return the quantiles of the values for each point, expressed
+            in percents from 0 to 100. The quantiles are linearly
+            interpolated between the closest ranks, so the 50th point
+            is equal to the median. """
+        length = len(values)
+        if length == 0:
+            raise IndexError(0)
+
+        ranks = []
+        for point in points:
+            if not isinstance(point, int) or not 0 <= point <= 100:
+                raise InvalidQuantilePointError(point)
+            rank = (point * (length - 1)) // 100
+            ranks.append(rank)
+            if rank + 1 < length:
+                ranks.append(rank + 1)
+
+        selected = Math.multiselect(values, ranks)
+
+        result = []
+        for point in points:
+            rank, remainder = divmod(point * (length - 1), 100)
+            lower = selected[rank]
+            if remainder == 0:
+                result.append(lower)
+            else:
+                result.append(lower + (selected[rank + 1] - lower) * remainder // 100)
+        return result
+
     @staticmethod
     def median(values: list) -> int:
+        return Math.quantiles(values, [50])[0]
+
+    @staticmethod
+    def mean(values: list) -> int:
+        return sum(values) // len(values)
+
+    @staticmethod
+    def weighted_mean(values: list, weights: list) -> int:
+        return sum(value * weight for value, weight in zip(values, weights)) // sum(weights)
+
+    @staticmethod
+    def weighted_median(values: list, weights: list) -> int:
+        """ Return the value where the cumulated weight reaches the half of the
+            total weight. When the half is reached exactly between two values,
+            they are averaged, so equal weights give the same result than `median` """
+        pairs = sorted(zip(values, weights))
+        total = sum(weights)
+        cumulated = 0
+        for index, (value, weight) in enumerate(pairs):
+            cumulated += weight
+            if 2 * cumulated > total:
+                return value
+            if 2 * cumulated == total:
+                return (value + pairs[index + 1][0]) // 2
+        return pairs[-1][0]
+
+    @staticmethod
+    def trimmed_mean(values: list, percent: int) -> int:
+        """ Return the mean of the values, after discarding the given
+            percent of the lowest and of the highest values """
+        length = len(values)
+        trimmed = length * percent // 100
+        # Always keep at least one value
+        trimmed = min(trimmed, (length - 1) // 2)
         sorted_values = sorted(values)
-        length = len(sorted_values)
-        if length % 2 == 0:
-            return (sorted_values[length // 2] +
-                    sorted_values[length // 2 - 1]) // 2
-        else:
-            return sorted_values[length // 2]
+        return Math.mean(sorted_values[trimmed:length - trimmed])
+
+    @staticmethod
+    def mad_filtered_mean(values: list, threshold: int) -> int:
+        """ Return the mean of the values whose distance to the median is lower
+            than `threshold` times the median absolute deviation (MAD) """
+        median = Math.median(values)
+        mad = Math.median([abs(value - median) for value in values])
+        return Math.mean([value for value in values if abs(value - median) <= threshold * mad])
+
+    @staticmethod
+    def is_within_tolerance(values: list, tolerance: int) -> bool:
+        """ Check if the spread between the lowest and the highest value is
+            lower than `tolerance` basis points of the median """
+        spread = max(values) - min(values)
+        return spread * 10000 <= tolerance * abs(Math.median(values))
+
+    @staticmethod
+    def deviates(previous: int, value: int, threshold: int) -> bool:
+        """ Check if the value moved away from the previous value
+            by at least `threshold` basis points """
+        return abs(value - previous) * 10000 >= threshold * abs(previous)
+
+    @staticmethod
+    def deviation(value: int, reference: int) -> int:
+        """ Return the signed deviation of a value from a reference, in basis points """
+        return (value - reference) * 10000 // reference
+
+    @staticmethod
+    def welford(count: int, mean: int, m2: int, value: int, precision: int) -> tuple:
+        """ Add a value to the streaming mean and sum of squared differences of
+            the previous values, with Welford's algorithm. The mean and the sum
+            are fixed point numbers with the given precision. """
+        count += 1
+        delta = value * precision - mean
+        mean += delta // count
+        m2 += delta * (value * precision - mean) // precision
+        return count, mean, m2
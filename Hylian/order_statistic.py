@@ -0,0 +1,308 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+class EmptyHeapError(Exception):
+    pass
+
+
+class MemoryArray(list):
+    """ In-memory replacement of an ArrayDB """
+
+    def put(self, value) -> None:
+        self.append(value)
+
+
+class MemoryDict(dict):
+    """ In-memory replacement of a DictDB """
+
+    def __getitem__(self, key):
+        return self.get(key, 0)
+
+    def remove(self, key) -> None:
+        self.pop(key, None)
+
+
+class IndexedHeap(object):
+    """ Binary heap of keys ordered by their value, supporting the
+        update and the removal of any key in O(log n).
+
+        The storage is provided by the caller, so the same algorithm runs
+        either on an ArrayDB / DictDB or on a MemoryArray / MemoryDict :
+         - items : the heap itself, an array of keys
+         - positions : key => position of the key in the heap, starting from 1
+         - values : key => value of the key
+    """
+
+    # ================================================
+    #  Initialization
+    # ================================================
+    def __init__(self, items, positions, values, is_max: bool = False) -> None:
+        self._items = items
+        self._positions = positions
+        self._values = values
+        self._is_max = is_max
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    def _before(self, left, right) -> bool:
+        if self._is_max:
+            return left > right
+        return left < right
+
+    def _place(self, index: int, key) -> None:
+        self._items[index] = key
+        self._positions[key] = index + 1
+
+    def _sift_up(self, index: int) -> None:
+        start = index
+        key = self._items[index]
+        value = self._values[key]
+
+        while index > 0:
+            parent = (index - 1) // 2
+            parent_key = self._items[parent]
+            if not self._before(value, self._values[parent_key]):
+                break
+            self._place(index, parent_key)
+            index = parent
+
+        if index != start:
+            self._place(index, key)
+
+    def _sift_down(self, index: int) -> None:
+        start = index
+        length = len(self._items)
+        key = self._items[index]
+        value = self._values[key]
+
+        while True:
+            child = 2 * index + 1
+            if child >= length:
+                break
+            child_key = self._items[child]
+            child_value = self._values[child_key]
+            # Pick the child that should come first
+            if child + 1 < length:
+                sibling_key = self._items[child + 1]
+                sibling_value = self._values[sibling_key]
+                if self._before(sibling_value, child_value):
+                    child, child_key, child_value = child + 1, sibling_key, sibling_value
+            if not self._before(child_value, value):
+                break
+            self._place(index, child_key)
+            index = child
+
+        if index != start:
+            self._place(index, key)
+
+    def _check_not_empty(self) -> None:
+        if len(self._items) == 0:
+            raise EmptyHeapError
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def contains(self, key) -> bool:
+        return self._positions[key] != 0
+
+    def value(self, key) -> int:
+        return self._values[key]
+
+    def items(self):
+        """ Iterate over the (key, value) pairs, in heap order """
+        for key in self._items:
+            yield key, self._values[key]
+
+    def top(self):
+        self._check_not_empty()
+        return self._items[0]
+
+    def top_value(self) -> int:
+        return self._values[self.top()]
+
+    def push(self, key, value: int) -> None:
+        self._values[key] = value
+        self._items.put(key)
+        self._positions[key] = len(self._items)
+        self._sift_up(len(self._items) - 1)
+
+    def update(self, key, value: int) -> None:
+        if not self.contains(key):
+            self.push(key, value)
+            return
+
+        previous = self._values[key]
+        if value == previous:
+            return
+
+        index = self._positions[key] - 1
+        self._values[key] = value
+
+        if self._before(value, previous):
+            self._sift_up(index)
+        else:
+            self._sift_down(index)
+
+    def remove(self, key) -> None:
+        index = self._positions[key] - 1
+        tail = self._items.pop()
+
+        self._positions.remove(key)
+        self._values.remove(key)
+
+        if tail == key:
+            return
+
+        # Move the tail into the free slot, then restore the heap order
+        self._place(index, tail)
+        self._sift_up(index)
+        self._sift_down(self._positions[tail] - 1)
+
+    def pop(self):
+        key = self.top()
+        self.remove(key)
+        return key
+
+    def rebuild(self, values: dict) -> None:
+        """ Replace the content of the heap with a key => value mapping in
+            O(n log n), only writing the entries that changed.
+            A sorted array already satisfies the heap order. """
+        previous = dict(self.items())
+        keys = list(previous)
+        length = len(keys)
+        order = sorted(values, key=values.get, reverse=self._is_max)
+
+        for index, key in enumerate(order):
+            if index >= length:
+                self._items.put(key)
+                self._positions[key] = index + 1
+            elif keys[index] != key:
+                self._place(index, key)
+            if previous.get(key) != values[key]:
+                self._values[key] = values[key]
+
+        for _ in range(length - len(order)):
+            self._items.pop()
+
+        for key in keys:
+            if key not in values:
+                self._positions.remove(key)
+                self._values.remove(key)
+
+
+class MedianHeap(object):
+    """ Order-statistic structure maintaining the median of a set of
+        keyed values with two heaps :
+         - lower : a max-heap containing the lower half of the values
+         - upper : a min-heap containing the upper half of the values
+
+        The lower heap contains as many values as the upper heap, or one more.
+        Inserting, updating or removing a value costs O(log n), and the median
+        is read from the top of the heaps in O(1).
+        The median is computed the same way than `Math.median`.
+    """
+
+    # ================================================
+    #  Initialization
+    # ================================================
+    def __init__(self, lower: IndexedHeap, upper: IndexedHeap) -> None:
+        self._lower = lower
+        self._upper = upper
+
+    @staticmethod
+    def in_memory() -> 'MedianHeap':
+        return MedianHeap(
+            IndexedHeap(MemoryArray(), MemoryDict(), MemoryDict(), is_max=True),
+            IndexedHeap(MemoryArray(), MemoryDict(), MemoryDict())
+        )
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    def _move(self, source: IndexedHeap, destination: IndexedHeap) -> None:
+        key = source.top()
+        value = source.value(key)
+        source.remove(key)
+        destination.push(key, value)
+
+    def _rebalance(self) -> None:
+        if len(self._lower) > len(self._upper) + 1:
+            self._move(self._lower, self._upper)
+        elif len(self._upper) > len(self._lower):
+            self._move(self._upper, self._lower)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    def __len__(self) -> int:
+        return len(self._lower) + len(self._upper)
+
+    def contains(self, key) -> bool:
+        return self._lower.contains(key) or self._upper.contains(key)
+
+    def update(self, key, value: int) -> None:
+        """ Insert a new value, or replace the value of an existing key """
+        if self._lower.contains(key):
+            # Update in place while the value stays in the lower half
+            if len(self._upper) == 0 or value <= self._upper.top_value():
+                self._lower.update(key, value)
+                return
+            self.remove(key)
+        elif self._upper.contains(key):
+            # Update in place while the value stays in the upper half
+            if value >= self._lower.top_value():
+                self._upper.update(key, value)
+                return
+            self.remove(key)
+
+        if len(self._lower) == 0 or value <= self._lower.top_value():
+            self._lower.push(key, value)
+        else:
+            self._upper.push(key, value)
+
+        self._rebalance()
+
+    def remove(self, key) -> None:
+        if self._lower.contains(key):
+            self._lower.remove(key)
+        else:
+            self._upper.remove(key)
+
+        self._rebalance()
+
+    def rebuild(self, values: dict) -> None:
+        """ Replace the content of the structure with a key => value mapping,
+            cheaper than updating many keys one at a time """
+        order = sorted(values, key=values.get)
+        half = (len(order) + 1) // 2
+        self._lower.rebuild({key: values[key] for key in order[:half]})
+        self._upper.rebuild({key: values[key] for key in order[half:]})
+
+    def items(self):
+        """ Iterate over the (key, value) pairs, in no particular order """
+        yield from self._lower.items()
+        yield from self._upper.items()
+
+    def median(self) -> int:
+        if len(self._lower) > len(self._upper):
+            return self._lower.top_value()
+
+        return (self._lower.top_value() + self._upper.top_value()) // 2
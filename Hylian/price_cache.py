@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .constants import *
+from .configuration import *
+from .aggregator import *
+from .feed.feed import *
+from .order_statistic import *
+from .time import *
+from .math import *
+
+
+class CachedValueNotAvailable(Exception):
+    pass
+
+
+class PriceCache(object):
+    # ================================================
+    #  DB Variables
+    # ================================================
+    # The latest aggregated value computed from the prices
+    # submitted by the feeds
+    _VALUE = 'PRICE_CACHE_VALUE'
+
+    # The time when the aggregated value has been computed
+    _TIMESTAMP = 'PRICE_CACHE_TIMESTAMP'
+
+    # Latest prices of the feeds, split in two heaps around the median
+    _LOWER_PRICES = 'PRICE_CACHE_LOWER_PRICES'
+    _UPPER_PRICES = 'PRICE_CACHE_UPPER_PRICES'
+
+    # Feeds ordered by the time of their latest price,
+    # so the expired prices can be evicted first
+    _EXPIRY = 'PRICE_CACHE_EXPIRY'
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    @staticmethod
+    def _value(db: IconScoreDatabase) -> VarDB:
+        return VarDB(PriceCache._VALUE, db, value_type=int)
+
+    @staticmethod
+    def _timestamp(db: IconScoreDatabase) -> VarDB:
+        return VarDB(PriceCache._TIMESTAMP, db, value_type=int)
+
+    @staticmethod
+    def _heap(db: IconScoreDatabase, name: str, is_max: bool = False) -> IndexedHeap:
+        return IndexedHeap(
+            ArrayDB(f'{name}_ITEMS', db, value_type=Address),
+            DictDB(f'{name}_POSITIONS', db, value_type=int),
+            DictDB(f'{name}_VALUES', db, value_type=int),
+            is_max
+        )
+
+    @staticmethod
+    def _prices(db: IconScoreDatabase) -> MedianHeap:
+        return MedianHeap(
+            PriceCache._heap(db, PriceCache._LOWER_PRICES, is_max=True),
+            PriceCache._heap(db, PriceCache._UPPER_PRICES)
+        )
+
+    @staticmethod
+    def _expiry(db: IconScoreDatabase) -> IndexedHeap:
+        return PriceCache._heap(db, PriceCache._EXPIRY)
+
+    @staticmethod
+    def _evict_expired(db: IconScoreDatabase,
+                       config: ConfigurationSnapshot,
+                       prices: MedianHeap,
+                       now: int) -> None:
+        expiry = PriceCache._expiry(db)
+        while len(expiry) > 0 and Time.is_timeout(now, expiry.top_value(), config.timeout_price_update):
+            prices.remove(expiry.pop())
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def _check_available(db: IconScoreDatabase) -> None:
+        if PriceCache._timestamp(db).get() == 0:
+            raise CachedValueNotAvailable
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def set(db: IconScoreDatabase, value: int, timestamp: int) -> None:
+        PriceCache._value(db).set(value)
+        PriceCache._timestamp(db).set(timestamp)
+
+    @staticmethod
+    def should_update(db: IconScoreDatabase, config: ConfigurationSnapshot, value: int, now: int) -> bool:
+        """ Check if a new aggregated value is worth storing : either it deviates
+            enough from the cached value, or the cached value is too old """
+        if config.deviation_threshold == 0:
+            return True
+
+        timestamp = PriceCache._timestamp(db).get()
+        if timestamp == 0 or Time.is_timeout(now, timestamp, config.heartbeat):
+            return True
+
+        return Math.deviates(PriceCache._value(db).get(), value, config.deviation_threshold)
+
+    @staticmethod
+    def submit(db: IconScoreDatabase, address: Address, value: int, timestamp: int) -> None:
+        """ Store the latest price of a feed in O(log n) """
+        PriceCache._prices(db).update(address, value)
+        PriceCache._expiry(db).update(address, timestamp)
+
+    @staticmethod
+    def submit_all(db: IconScoreDatabase, prices: list) -> None:
+        """ Store the latest prices of many feeds, given as (address, value, timestamp),
+            rebuilding the heaps once rather than updating them price by price """
+        heap = PriceCache._prices(db)
+        expiry = PriceCache._expiry(db)
+        values = dict(heap.items())
+        timestamps = dict(expiry.items())
+
+        for address, value, timestamp in prices:
+            values[address] = value
+            timestamps[address] = timestamp
+
+        heap.rebuild(values)
+        expiry.rebuild(timestamps)
+
+    @staticmethod
+    def discard(db: IconScoreDatabase, address: Address) -> None:
+        """ Forget the latest price of a feed """
+        expiry = PriceCache._expiry(db)
+        if expiry.contains(address):
+            expiry.remove(address)
+            PriceCache._prices(db).remove(address)
+
+    @staticmethod
+    def aggregate(db: IconScoreDatabase, config: ConfigurationSnapshot, prices: MedianHeap) -> int:
+        if config.aggregator == Aggregator.MEDIAN:
+            # The median is maintained incrementally
+            return prices.median()
+
+        addresses = []
+        values = []
+        for address, value in prices.items():
+            addresses.append(address)
+            values.append(value)
+
+        weights = None
+        if Aggregator.is_weighted(config.aggregator):
+            weights = [Feed(db, address).weight() for address in addresses]
+
+        return Aggregator.aggregate(config.aggregator, values, weights)
+
+    @staticmethod
+    def compute(db: IconScoreDatabase, config: ConfigurationSnapshot, now: int) -> tuple:
+        """ Evict the expired prices and aggregate the remaining ones.
+            Return the amount of prices and their aggregation, which
+            is None if there isn't enough prices available. """
+        prices = PriceCache._prices(db)
+        PriceCache._evict_expired(db, config, prices, now)
+
+        count = len(prices)
+        if count == 0 or count < config.minimum_feeds_available:
+            return count, None
+
+        return count, PriceCache.aggregate(db, config, prices)
+
+    @staticmethod
+    def serialize(db: IconScoreDatabase) -> dict:
+        PriceCache._check_available(db)
+        return {
+            'value': PriceCache._value(db).get(),
+            'timestamp': PriceCache._timestamp(db).get()
+        }
+
+    @staticmethod
+    def delete(db: IconScoreDatabase) -> None:
+        PriceCache._value(db).remove()
+        PriceCache._timestamp(db).remove()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .constants import *
+from .codec import *
+
+
+class HistoryNotAvailableError(Exception):
+    pass
+
+
+class InvalidWindowError(Exception):
+    pass
+
+
+class PriceHistory(object):
+    """ Fixed-capacity ring buffer of the aggregated values.
+
+        Each entry also stores the cumulative price, the sum of every value
+        multiplied by the time it has been the latest value, such as the time
+        weighted average price between two instants is the difference of their
+        cumulative prices divided by their interval, computed in O(log n).
+    """
+
+    # ================================================
+    #  DB Variables
+    # ================================================
+    # Entries are stored by slot, from 0 to PRICE_HISTORY_CAPACITY - 1
+    _ENTRIES = 'PRICE_HISTORY_ENTRIES'
+
+    # Amount of entries ever appended, the latest
+    # one being stored in the slot (count - 1) % capacity
+    _COUNT = 'PRICE_HISTORY_COUNT'
+
+    # ================================================
+    #  Entry Layout
+    # ================================================
+    _LAYOUT = (int, int, int)
+    _TIMESTAMP = 0
+    _VALUE = 1
+    _CUMULATIVE = 2
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    @staticmethod
+    def _entries(db: IconScoreDatabase) -> DictDB:
+        return DictDB(PriceHistory._ENTRIES, db, value_type=bytes)
+
+    @staticmethod
+    def _count(db: IconScoreDatabase) -> VarDB:
+        return VarDB(PriceHistory._COUNT, db, value_type=int)
+
+    @staticmethod
+    def _get(entries: DictDB, index: int) -> list:
+        return Codec.decode(PriceHistory._LAYOUT, entries[index % PRICE_HISTORY_CAPACITY])
+
+    @staticmethod
+    def _set(entries: DictDB, index: int, entry: list) -> None:
+        entries[index % PRICE_HISTORY_CAPACITY] = Codec.encode(PriceHistory._LAYOUT, entry)
+
+    @staticmethod
+    def _first(count: int) -> int:
+        """ Index of the oldest entry still stored """
+        return max(count - PRICE_HISTORY_CAPACITY, 0)
+
+    @staticmethod
+    def _cumulative_at(entry: list, timestamp: int) -> int:
+        """ Cumulative price at a given time, the entry being the
+            latest entry appended before this time """
+        return entry[PriceHistory._CUMULATIVE] + \
+            entry[PriceHistory._VALUE] * (timestamp - entry[PriceHistory._TIMESTAMP])
+
+    @staticmethod
+    def _search(entries: DictDB, first: int, last: int, timestamp: int) -> int:
+        """ Return the index of the latest entry appended before `timestamp`
+            between the indexes `first` and `last`, or `first - 1` if none """
+        low, high = first, last
+        while low <= high:
+            middle = (low + high) // 2
+            if PriceHistory._get(entries, middle)[PriceHistory._TIMESTAMP] <= timestamp:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return high
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def _check_window(window: int) -> None:
+        if window <= 0:
+            raise InvalidWindowError(window)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def append(db: IconScoreDatabase, timestamp: int, value: int) -> None:
+        entries = PriceHistory._entries(db)
+        count = PriceHistory._count(db)
+        length = count.get()
+
+        if length == 0:
+            PriceHistory._set(entries, 0, [timestamp, value, 0])
+            count.set(1)
+            return
+
+        last = PriceHistory._get(entries, length - 1)
+        if last[PriceHistory._TIMESTAMP] == timestamp:
+            # Several updates at the same time : only keep the latest value
+            last[PriceHistory._VALUE] = value
+            PriceHistory._set(entries, length - 1, last)
+            return
+
+        PriceHistory._set(entries, length, [timestamp, value, PriceHistory._cumulative_at(last, timestamp)])
+        count.set(length + 1)
+
+    @staticmethod
+    def twap(db: IconScoreDatabase, window: int, now: int) -> int:
+        """ Return the time weighted average of the aggregated values
+            over the last `window` microseconds """
+        PriceHistory._check_window(window)
+
+        entries = PriceHistory._entries(db)
+        length = PriceHistory._count(db).get()
+        first = PriceHistory._first(length)
+        start = now - window
+
+        index = PriceHistory._search(entries, first, length - 1, start)
+        if index < first:
+            # The history doesn't cover the whole window
+            raise HistoryNotAvailableError(start)
+
+        cumulative_start = PriceHistory._cumulative_at(PriceHistory._get(entries, index), start)
+        cumulative_now = PriceHistory._cumulative_at(PriceHistory._get(entries, length - 1), now)
+        return (cumulative_now - cumulative_start) // window
+
+    @staticmethod
+    def serialize(db: IconScoreDatabase, from_timestamp: int, to_timestamp: int) -> list:
+        """ Return the aggregated values appended between two timestamps """
+        entries = PriceHistory._entries(db)
+        length = PriceHistory._count(db).get()
+        first = PriceHistory._first(length)
+
+        # Start from the first entry appended at or after `from_timestamp`
+        index = PriceHistory._search(entries, first, length - 1, from_timestamp - 1) + 1
+
+        result = []
+        while index < length:
+            entry = PriceHistory._get(entries, index)
+            if entry[PriceHistory._TIMESTAMP] > to_timestamp:
+                break
+            result.append({
+                'timestamp': entry[PriceHistory._TIMESTAMP],
+                'value': entry[PriceHistory._VALUE]
+            })
+            index += 1
+
+        return result
+
+    @staticmethod
+    def delete(db: IconScoreDatabase) -> None:
+        entries = PriceHistory._entries(db)
+        count = PriceHistory._count(db)
+        length = count.get()
+        for index in range(PriceHistory._first(length), length):
+            entries.remove(index % PRICE_HISTORY_CAPACITY)
+        count.remove()
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .configuration import *
+from .price_cache import *
+from .price_history import *
+from .feed.feed_composite import *
+
+
+class TooMuchTickersError(Exception):
+    pass
+
+
+class TickerAlreadyExistsError(Exception):
+    pass
+
+
+class TickerNotExistsError(Exception):
+    pass
+
+
+class PrimaryTickerError(Exception):
+    pass
+
+
+class TickerComposite(object):
+    """ Hylian serves the price of its primary ticker, declared on install,
+        and of any additional ticker registered by the owner.
+        The primary ticker is stored at the root of the SCORE database so
+        the existing deployments keep their storage, while each additional
+        ticker has its own Configuration, FeedComposite and PriceCache
+        stored in a sub database namespaced by the ticker name. """
+
+    # ================================================
+    #  Constants
+    # ================================================
+    # Maximum amount of additional tickers
+    _MAXIMUM_TICKERS = 100
+
+    # ================================================
+    #  DB Variables
+    # ================================================
+    # Additional tickers are indexed by their name
+    _INDEX = 'TICKER_COMPOSITE_INDEX'
+
+    # Position of each additional ticker in the index, starting from 1
+    _POSITION = 'TICKER_COMPOSITE_POSITION'
+
+    # Prefix of the additional tickers sub databases
+    _NAMESPACE = 'TICKER'
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    @staticmethod
+    def tickers(db: IconScoreDatabase) -> ArrayDB:
+        return ArrayDB(TickerComposite._INDEX, db, value_type=str)
+
+    @staticmethod
+    def _positions(db: IconScoreDatabase) -> DictDB:
+        return DictDB(TickerComposite._POSITION, db, value_type=int)
+
+    @staticmethod
+    def _is_primary(db: IconScoreDatabase, ticker_name: str) -> bool:
+        return ticker_name == Configuration.ticker_name(db).get()
+
+    @staticmethod
+    def _namespace(db: IconScoreDatabase, ticker_name: str) -> IconScoreDatabase:
+        return db.get_sub_db(f'{TickerComposite._NAMESPACE}_{ticker_name}'.encode())
+
+    # ================================================
+    #  Checks
+    # ================================================
+    @staticmethod
+    def _check_maximum_amount_tickers(db: IconScoreDatabase) -> None:
+        tickers_count = len(TickerComposite.tickers(db))
+        if tickers_count >= TickerComposite._MAXIMUM_TICKERS:
+            raise TooMuchTickersError(tickers_count)
+
+    @staticmethod
+    def _check_ticker_not_already_exists(db: IconScoreDatabase, ticker_name: str) -> None:
+        if TickerComposite.exists(db, ticker_name):
+            raise TickerAlreadyExistsError(ticker_name)
+
+    @staticmethod
+    def _check_ticker_already_exists(db: IconScoreDatabase, ticker_name: str) -> None:
+        if not TickerComposite.exists(db, ticker_name):
+            raise TickerNotExistsError(ticker_name)
+
+    @staticmethod
+    def _check_not_primary(db: IconScoreDatabase, ticker_name: str) -> None:
+        if TickerComposite._is_primary(db, ticker_name):
+            raise PrimaryTickerError(ticker_name)
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def exists(db: IconScoreDatabase, ticker_name: str) -> bool:
+        return TickerComposite._is_primary(db, ticker_name) \
+            or TickerComposite._positions(db)[ticker_name] != 0
+
+    @staticmethod
+    def db(db: IconScoreDatabase, ticker_name: str = None) -> IconScoreDatabase:
+        """ Return the database of a ticker, or the database
+            of the primary ticker if no ticker is specified """
+        if not ticker_name or TickerComposite._is_primary(db, ticker_name):
+            return db
+
+        TickerComposite._check_ticker_already_exists(db, ticker_name)
+        return TickerComposite._namespace(db, ticker_name)
+
+    @staticmethod
+    def databases(db: IconScoreDatabase) -> list:
+        """ Return the databases of every ticker, starting with the primary ticker """
+        return [db] + [
+            TickerComposite._namespace(db, ticker_name)
+            for ticker_name in TickerComposite.tickers(db)
+        ]
+
+    @staticmethod
+    def add(db: IconScoreDatabase, ticker_name: str, minimum_feeds_available: int) -> None:
+        TickerComposite._check_maximum_amount_tickers(db)
+        TickerComposite._check_ticker_not_already_exists(db, ticker_name)
+
+        tickers = TickerComposite.tickers(db)
+        tickers.put(ticker_name)
+        TickerComposite._positions(db)[ticker_name] = len(tickers)
+
+        Configuration.initialize(TickerComposite._namespace(db, ticker_name),
+                                 ticker_name,
+                                 minimum_feeds_available)
+
+    @staticmethod
+    def remove(db: IconScoreDatabase, ticker_name: str) -> None:
+        TickerComposite._check_not_primary(db, ticker_name)
+        TickerComposite._check_ticker_already_exists(db, ticker_name)
+
+        tickers = TickerComposite.tickers(db)
+        positions = TickerComposite._positions(db)
+        position = positions[ticker_name]
+
+        # Replace the removed ticker with the tail of the index
+        tail = tickers.pop()
+        if tail != ticker_name:
+            tickers[position - 1] = tail
+            positions[tail] = position
+
+        positions.remove(ticker_name)
+
+        # Clear the ticker storage
+        namespace = TickerComposite._namespace(db, ticker_name)
+        for address in FeedComposite.feeds(namespace):
+            PriceCache.discard(namespace, address)
+        FeedComposite.delete(namespace)
+        PriceCache.delete(namespace)
+        PriceHistory.delete(namespace)
+        Configuration.delete(namespace)
+
+    @staticmethod
+    def rename_primary(db: IconScoreDatabase, ticker_name: str) -> None:
+        # The additional tickers are namespaced by their name,
+        # so only the primary ticker can be renamed
+        if not TickerComposite._is_primary(db, ticker_name):
+            TickerComposite._check_ticker_not_already_exists(db, ticker_name)
+        Configuration.ticker_name(db).set(ticker_name)
+
+    @staticmethod
+    def serialize(db: IconScoreDatabase) -> list:
+        return [Configuration.ticker_name(db).get()] + list(TickerComposite.tickers(db))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import *
+from .checks import *
+
+
+class TxCache(object):
+    """ Results computed during the current transaction, so the price feeds
+        are peeked only once when a SCORE calls Hylian several times in the
+        same transaction. The results are kept in memory on the execution
+        context of the transaction, so they never outlive it : a transaction
+        executed again, such as in a block proposed again, starts without any
+        result. They are never stored. Outside of a transaction, such as in a
+        readonly query, nothing is cached.
+        A price changed by a feed later in the same transaction is only
+        seen after a Hylian method changing its state has been called. """
+
+    # Attribute of the execution context holding the
+    # (transaction hash, results by name) of the cache
+    _ATTRIBUTE = '_hylian_tx_cache'
+
+    # ================================================
+    #  Private Methods
+    # ================================================
+    @staticmethod
+    def _results(score: IconScoreBase) -> dict:
+        """ Return the results cached in the current transaction,
+            or None outside of a transaction """
+        if score.tx is None:
+            return None
+
+        context = score._context
+        tx_hash, results = getattr(context, TxCache._ATTRIBUTE, (None, None))
+        if tx_hash != score.tx.hash:
+            # The same context executes every transaction of a block
+            results = {}
+            setattr(context, TxCache._ATTRIBUTE, (score.tx.hash, results))
+        return results
+
+    # ================================================
+    #  Public Methods
+    # ================================================
+    @staticmethod
+    def get(score: IconScoreBase, name: tuple, compute):
+        """ Return the result cached under `name` in the current transaction,
+            or compute and cache it """
+        results = TxCache._results(score)
+        if results is None:
+            return compute()
+
+        # Several Hylian SCOREs may be called in the same transaction
+        key = (score.address,) + name
+        if key not in results:
+            results[key] = compute()
+        return results[key]
+
+    @staticmethod
+    def invalidate(score: IconScoreBase) -> None:
+        results = TxCache._results(score)
+        if results is not None:
+            results.clear()
+
+
+def invalidates_cache(func):
+    """ Discard the results cached in the transaction before a method
+        changing the feeds, their health or the configuration """
+    if not isfunction(func):
+        raise NotAFunctionError
+
+    @wraps(func)
+    def __wrapper(self: object, *args, **kwargs):
+        TxCache.invalidate(self)
+        return func(self, *args, **kwargs)
+
+    return __wrapper
@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Backtest several Hylian configurations against recorded observations.
+
+    Usage: python -m backtest.engine <records.jsonl|records.csv> <scenarios.json>
+                                     [--step 60] [--reference <feed>]
+
+    The scenarios file is a JSON list of configurations :
+        [{"name": "current", "minimum_feeds_available": 3,
+          "timeout_price_update": 21600000000, "aggregator": "median",
+          "ticker_name": "ICXUSD", "weights": {"cx...": 2}}]
+
+    The records are replayed once. Every `step` seconds, each configuration
+    decides like Hylian does which feeds are operational, then either
+    aggregates their values or reverts with NotEnoughFeedsAvailable.
+    The aggregated value is compared with the reference price : the value
+    of the `reference` feed if any, otherwise the median of the latest
+    value of every feed of the ticker, whatever its age.
+
+    NumPy only vectorises, across the feeds of a single step, the selection
+    of the operational feeds : the ticker name and timeout checks. It is used
+    if it is installed and there are enough feeds for it to be faster than a
+    plain loop. The aggregation is not vectorised across the steps : it runs
+    step by step on Python integers with the Aggregator of Hylian, as the
+    prices may not fit in 64 bits and the rounding must match Hylian's.
+"""
+
+import argparse
+import json
+
+from Hylian.constants import *
+from Hylian.time import Time
+from Hylian.math import Math
+from Hylian.aggregator import Aggregator
+from .records import read
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class FeedsState(object):
+    """ Latest observation of each feed """
+
+    # Initial amount of feeds of the NumPy arrays, doubled when full
+    _CAPACITY = 64
+
+    # Below this amount of feeds, the overhead of NumPy outweighs the plain loop
+    _NUMPY_MINIMUM_FEEDS = 48
+
+    def __init__(self) -> None:
+        self._positions = {}
+        self.feeds = []
+        self.timestamps = []
+        self.values = []
+        self.tickers = []
+
+        # NumPy copies of the timestamps and of the tickers, encoded as integers,
+        # preallocated and updated in place so the scenarios share them
+        self._ticker_codes = {}
+        if numpy is not None:
+            self._timestamps = numpy.zeros(FeedsState._CAPACITY, dtype=numpy.int64)
+            self._tickers = numpy.zeros(FeedsState._CAPACITY, dtype=numpy.int32)
+
+    def _ticker_code(self, ticker: str) -> int:
+        code = self._ticker_codes.get(ticker)
+        if code is None:
+            code = self._ticker_codes[ticker] = len(self._ticker_codes)
+        return code
+
+    def _grow(self) -> None:
+        capacity = 2 * len(self._timestamps)
+        self._timestamps = numpy.resize(self._timestamps, capacity)
+        self._tickers = numpy.resize(self._tickers, capacity)
+
+    def update(self, record) -> None:
+        position = self._positions.get(record.feed)
+        if position is None:
+            position = self._positions[record.feed] = len(self.feeds)
+            self.feeds.append(record.feed)
+            self.timestamps.append(record.timestamp)
+            self.values.append(record.value)
+            self.tickers.append(record.ticker)
+        else:
+            self.timestamps[position] = record.timestamp
+            self.values[position] = record.value
+            self.tickers[position] = record.ticker
+
+        if numpy is not None:
+            if position == len(self._timestamps):
+                self._grow()
+            self._timestamps[position] = record.timestamp
+            self._tickers[position] = self._ticker_code(record.ticker)
+
+    def operational(self, now: int, ticker_name: str, timeout: int) -> list:
+        """ Positions of the feeds passing the ticker name and timeout checks of FeedEvaluator """
+        if numpy is not None and len(self.feeds) >= FeedsState._NUMPY_MINIMUM_FEEDS:
+            code = self._ticker_codes.get(ticker_name)
+            if code is None:
+                return []
+            count = len(self.feeds)
+            timestamps, tickers = self._timestamps[:count], self._tickers[:count]
+            mask = (tickers == code) & ~Time.is_timeout(now, timestamps, timeout)
+            return numpy.flatnonzero(mask).tolist()
+
+        return [
+            position for position in range(len(self.feeds))
+            if self.tickers[position] == ticker_name
+            and not Time.is_timeout(now, self.timestamps[position], timeout)
+        ]
+
+
+class Scenario(object):
+    """ A configuration to backtest, and its results """
+
+    def __init__(self,
+                 name: str,
+                 ticker_name: str,
+                 minimum_feeds_available: int,
+                 timeout_price_update: int = DEFAULT_TIMEOUT_PRICE_UPDATE,
+                 aggregator: str = DEFAULT_AGGREGATOR,
+                 weights: dict = None) -> None:
+        Aggregator.check_supported(aggregator)
+        self.name = name
+        self.ticker_name = ticker_name
+        self.minimum_feeds_available = minimum_feeds_available
+        self.timeout_price_update = timeout_price_update
+        self.aggregator = aggregator
+        self.weights = weights or {}
+
+        self.steps = 0
+        self.reverts = 0
+        self.compared = 0
+        self.total_error = 0
+        self.max_error = 0
+
+    def evaluate(self, now: int, state: FeedsState, reference: int) -> None:
+        self.steps += 1
+        operational = state.operational(now, self.ticker_name, self.timeout_price_update)
+
+        # Same condition as Hylian._check_enough_feeds_available
+        if len(operational) == 0 or len(operational) < self.minimum_feeds_available:
+            self.reverts += 1
+            return
+
+        weights = None
+        if Aggregator.is_weighted(self.aggregator):
+            weights = [self.weights.get(state.feeds[position], DEFAULT_FEED_WEIGHT) for position in operational]
+        value = Aggregator.aggregate(self.aggregator, [state.values[position] for position in operational], weights)
+
+        if reference:
+            error = abs(Math.deviation(value, reference))
+            self.compared += 1
+            self.total_error += error
+            self.max_error = max(self.max_error, error)
+
+    def report(self) -> dict:
+        available = self.steps - self.reverts
+        return {
+            'name': self.name,
+            'steps': self.steps,
+            'reverts': self.reverts,
+            'availability': available / self.steps if self.steps else 0,
+            'revert_rate': self.reverts / self.steps if self.steps else 0,
+            # Absolute error in basis points of the reference price
+            'mean_error': self.total_error / self.compared if self.compared else 0,
+            'max_error': self.max_error
+        }
+
+
+class Backtest(object):
+    def __init__(self, scenarios: list, step: int, reference: str = None) -> None:
+        self._scenarios = scenarios
+        # In microseconds, like the timestamps
+        self._step = step
+        self._reference = reference
+        self._state = FeedsState()
+        self._reference_value = None
+
+    def _reference_price(self, ticker_name: str) -> int:
+        if self._reference is not None:
+            return self._reference_value
+
+        values = [
+            value for value, ticker in zip(self._state.values, self._state.tickers)
+            if ticker == ticker_name
+        ]
+        return Math.median(values) if values else None
+
+    def _evaluate(self, now: int) -> None:
+        references = {}
+        for scenario in self._scenarios:
+            if scenario.ticker_name not in references:
+                references[scenario.ticker_name] = self._reference_price(scenario.ticker_name)
+            scenario.evaluate(now, self._state, references[scenario.ticker_name])
+
+    def run(self, records) -> list:
+        """ Replay the records in a single pass, and return the report of each scenario """
+        now = None
+        for record in records:
+            if now is None:
+                now = record.timestamp
+
+            # Evaluate every step elapsed before this observation
+            while record.timestamp > now:
+                self._evaluate(now)
+                now += self._step
+
+            if record.feed == self._reference:
+                self._reference_value = record.value
+            else:
+                self._state.update(record)
+
+        if now is not None:
+            self._evaluate(now)
+
+        return [scenario.report() for scenario in self._scenarios]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Backtest Hylian configurations against recorded observations')
+    parser.add_argument('records', help='JSONL or CSV file of the observations, sorted by time')
+    parser.add_argument('scenarios', help='JSON file of the configurations to backtest')
+    parser.add_argument('--step', type=int, default=60,
+                        help='Seconds between two evaluations of the configurations')
+    parser.add_argument('--reference', default=None,
+                        help='Feed whose values are the reference prices')
+    args = parser.parse_args()
+
+    scenarios = [Scenario(**scenario) for scenario in json.loads(open(args.scenarios, 'r').read())]
+    backtest = Backtest(scenarios, args.step * 1000 * 1000, args.reference)
+    print(json.dumps(backtest.run(read(args.records)), indent=2))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Streaming readers of recorded price feed observations.
+
+    Each observation has a timestamp in microseconds, the address of the
+    feed, its value and its ticker name, either as a JSON line :
+        {"timestamp": 1570000000000000, "feed": "cx...", "value": 1000, "ticker": "ICXUSD"}
+    or as a CSV line, with a "timestamp,feed,value,ticker" header.
+"""
+
+import csv
+import json
+
+
+class UnsortedRecordsError(Exception):
+    pass
+
+
+class Record(object):
+    __slots__ = ('timestamp', 'feed', 'value', 'ticker')
+
+    def __init__(self, timestamp: int, feed: str, value: int, ticker: str) -> None:
+        self.timestamp = timestamp
+        self.feed = feed
+        self.value = value
+        self.ticker = ticker
+
+
+def read_jsonl(source) -> iter:
+    for line in source:
+        line = line.strip()
+        if line:
+            record = json.loads(line)
+            yield Record(int(record['timestamp']), record['feed'], int(record['value']), record['ticker'])
+
+
+def read_csv(source) -> iter:
+    for row in csv.DictReader(source):
+        yield Record(int(row['timestamp']), row['feed'], int(row['value']), row['ticker'])
+
+
+def read(path: str) -> iter:
+    """ Stream the records of a file, checking they are sorted by time """
+    reader = read_csv if path.endswith('.csv') else read_jsonl
+    last = None
+    with open(path, 'r') as source:
+        for record in reader(source):
+            if last is not None and record.timestamp < last:
+                raise UnsortedRecordsError(record.timestamp)
+            last = record.timestamp
+            yield record
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Aggregate the price feeds of Hylian off-chain and cross-check Hylian.
+
+    Usage: python -m client.aggregator <JSON-RPC uri> <Hylian address> [ticker]
+
+    The price feeds are peeked concurrently and their prices are checked and
+    aggregated the same way as Hylian does it : the feeds skipped by Hylian
+    because their circuit breaker is open are left out, as told by the health
+    returned with the feeds, and no value is computed below the minimum
+    amount of feeds available. The result is compared with the
+    value returned by Hylian, which only matches when Hylian uses the median.
+"""
+
+import asyncio
+import json
+import sys
+
+from Hylian.math import Math
+from Hylian.time import Time
+from .jsonrpc import JsonRpcClient
+
+
+def hex_to_int(value: str) -> int:
+    return int(value, 16)
+
+
+class CrossCheck(object):
+    def __init__(self, local: int, onchain: int, aggregator: str, operational: dict, malfunctioning: dict) -> None:
+        # Median of the prices of the operational feeds, None if there isn't enough
+        self.local = local
+        # Value returned by Hylian, None if Hylian reverted
+        self.onchain = onchain
+        self.aggregator = aggregator
+        # Price by feed address
+        self.operational = operational
+        # Reason of the failure by feed address
+        self.malfunctioning = malfunctioning
+
+    def matches(self) -> bool:
+        return self.local == self.onchain
+
+    def serialize(self) -> dict:
+        return {
+            'local': self.local,
+            'onchain': self.onchain,
+            'aggregator': self.aggregator,
+            'matches': self.matches(),
+            'operational': self.operational,
+            'malfunctioning': self.malfunctioning
+        }
+
+
+class HylianClient(object):
+    def __init__(self, rpc: JsonRpcClient, address: str, ticker: str = None) -> None:
+        self._rpc = rpc
+        self._address = address
+        self._ticker = ticker
+        self._params = {'ticker': ticker} if ticker else {}
+
+    async def _hylian(self, method: str, params: dict = None):
+        return await self._rpc.icx_call(self._address, method, {**self._params, **(params or {})})
+
+    async def value(self) -> int:
+        return hex_to_int(await self._hylian('value'))
+
+    async def ticker_name(self) -> str:
+        # The additional tickers are identified by their name
+        return self._ticker or await self._rpc.icx_call(self._address, 'ticker_name')
+
+    async def feeds(self) -> list:
+        """ Return the registered feeds with their health """
+        return await self._hylian('feeds', {'fields': 'full'})
+
+    async def minimum_feeds_available(self) -> int:
+        return hex_to_int(await self._hylian('minimum_feeds_available'))
+
+    @staticmethod
+    def skipped_feeds(feeds: list, block_height: int) -> dict:
+        """ Return the reason why Hylian skips a feed, by feed address.
+            A feed is skipped while its circuit breaker waits for the next probe. """
+        return {
+            feed['address']: f"CircuitBreakerOpen('{feed['address']}')"
+            for feed in feeds
+            if block_height < hex_to_int(feed['feed']['health'].get('next_probe', '0x0'))
+        }
+
+    async def peek(self, address: str) -> dict:
+        return await self._rpc.icx_call(address, 'peek')
+
+    async def _evaluate(self, address: str, ticker_name: str, timeout: int, now: int) -> tuple:
+        """ Return the price of a feed and None, or None and the reason of its failure """
+        try:
+            result = await self.peek(address)
+        except Exception as error:
+            return None, repr(error)
+
+        if result['ticker_name'] != ticker_name:
+            return None, f'WrongTickerName({result["ticker_name"]!r})'
+        if Time.is_timeout(now, hex_to_int(result['timestamp']), timeout):
+            return None, f'PriceFeedTimeout({hex_to_int(result["timestamp"])})'
+        return hex_to_int(result['value']), None
+
+    async def _onchain_value(self):
+        try:
+            return await self.value()
+        except Exception:
+            return None
+
+    async def cross_check(self) -> CrossCheck:
+        """ Peek every price feed concurrently, aggregate their prices
+            and compare the result with the value returned by Hylian """
+        feeds, minimum, ticker_name, timeout, aggregator, block = await asyncio.gather(
+            self.feeds(),
+            self.minimum_feeds_available(),
+            self.ticker_name(),
+            self._hylian('timeout_price_update'),
+            self._hylian('aggregator'),
+            self._rpc.call('icx_getLastBlock'))
+
+        now = block['time_stamp']
+        # The health of the feeds tells which ones Hylian skips, without peeking them on-chain
+        skipped = HylianClient.skipped_feeds(feeds, block['height'])
+        feeds = [feed['address'] for feed in feeds if feed['address'] not in skipped]
+        evaluations, onchain = await asyncio.gather(
+            asyncio.gather(*[self._evaluate(address, ticker_name, hex_to_int(timeout), now) for address in feeds]),
+            self._onchain_value())
+
+        operational = {}
+        malfunctioning = dict(skipped)
+        for address, (value, reason) in zip(feeds, evaluations):
+            if reason is None:
+                operational[address] = value
+            else:
+                malfunctioning[address] = reason
+
+        local = None
+        if operational and len(operational) >= minimum:
+            local = Math.median(list(operational.values()))
+        return CrossCheck(local, onchain, aggregator, operational, malfunctioning)
+
+
+async def main(uri: str, address: str, ticker: str = None) -> dict:
+    rpc = JsonRpcClient(uri)
+    try:
+        return (await HylianClient(rpc, address, ticker).cross_check()).serialize()
+    finally:
+        await rpc.close()
+
+
+if __name__ == '__main__':
+    print(json.dumps(asyncio.run(main(*sys.argv[1:4])), indent=2))
@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Long-lived command line client of Hylian.
+
+    Usage: ./scripts/hylian-cli -n <network> <method> [params...]
+           ./scripts/hylian-cli -n <network> batch [file]
+
+    The params of a method are given in the order of the method signature,
+    or by name as name=value. In batch mode, each line of the file (or of
+    the standard input) is a command : the configuration and the connections
+    are loaded once, the transactions are submitted in order without waiting
+    for each other, then their results are polled concurrently.
+
+    Sending a transaction requires the iconsdk package, to sign it.
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import shlex
+import sys
+import time
+
+from .jsonrpc import JsonRpcClient, JsonRpcError
+
+# Step limit of the transactions, as in the calls templates
+DEFAULT_STEP_LIMIT = 0x1000000
+
+# Polling of the transaction results, in seconds
+POLL_INITIAL_DELAY = 0.25
+POLL_MAXIMUM_DELAY = 4
+POLL_TIMEOUT = 60
+
+# Errors of icx_getTransactionResult while the transaction isn't executed yet :
+# goloop answers with dedicated codes, loopchain with an invalid params error
+PENDING_ERROR_CODES = (-31002, -31003)
+PENDING_ERROR_MESSAGES = ('pending transaction', 'executing transaction')
+LEGACY_PENDING_ERROR_CODE = -32602
+
+
+def is_pending(error: JsonRpcError) -> bool:
+    """ Check if a transaction result error means that the transaction is still pending """
+    details = error.args[0] if error.args and isinstance(error.args[0], dict) else {}
+    code = details.get('code')
+    message = str(details.get('message', '')).lower()
+    if code in PENDING_ERROR_CODES:
+        return True
+    return code == LEGACY_PENDING_ERROR_CODE and message.startswith(PENDING_ERROR_MESSAGES)
+
+
+class UnknownMethodError(Exception):
+    pass
+
+
+class InvalidParamsError(Exception):
+    pass
+
+
+class TransactionTimeoutError(Exception):
+    pass
+
+
+# ================================================
+#  Hylian external methods
+# ================================================
+# (name, readonly, params) ; the params are (name, type) tuples
+METHODS = {name: (readonly, params) for name, readonly, params in (
+    ('add_ticker', False, (('ticker_name', str), ('minimum_feeds_available', int))),
+    ('remove_ticker', False, (('ticker_name', str),)),
+    ('add_feed', False, (('address', str), ('name', str), ('ticker', str))),
+    ('remove_feed', False, (('address', str), ('ticker', str))),
+    ('add_feeds', False, (('feeds', str), ('ticker', str))),
+    ('remove_feeds', False, (('addresses', str), ('ticker', str))),
+    ('replace_feeds', False, (('feeds', str), ('ticker', str))),
+    ('submit_value', False, (('value', int), ('ticker', str))),
+    ('refresh', False, (('ticker', str),)),
+    ('move_feed', False, (('address', str), ('position', int), ('ticker', str))),
+    ('set_feed_weight', False, (('address', str), ('weight', int), ('ticker', str))),
+    ('set_aggregator', False, (('aggregator', str), ('ticker', str))),
+    ('set_evaluation_mode', False, (('evaluation_mode', str), ('ticker', str))),
+    ('set_quorum_tolerance', False, (('quorum_tolerance', int), ('ticker', str))),
+    ('set_quorum_order', False, (('quorum_order', str), ('ticker', str))),
+    ('set_deviation_threshold', False, (('deviation_threshold', int), ('ticker', str))),
+    ('set_heartbeat', False, (('heartbeat', int), ('ticker', str))),
+    ('set_timeout_price_update', False, (('timeout_price_update', int), ('ticker', str))),
+    ('set_ticker_name', False, (('ticker_name', str),)),
+    ('set_minimum_feeds_available', False, (('minimum_feeds_available', int), ('ticker', str))),
+    ('tickers', True, ()),
+    ('feeds', True, (('ticker', str), ('offset', int), ('limit', int), ('fields', str))),
+    ('feeds_count', True, (('ticker', str),)),
+    ('feed', True, (('address', str), ('ticker', str))),
+    ('feed_stats', True, (('address', str), ('ticker', str))),
+    ('value', True, (('ticker', str),)),
+    ('values', True, (('tickers', str),)),
+    ('quantiles', True, (('points', str), ('ticker', str))),
+    ('cached_value', True, (('ticker', str),)),
+    ('twap', True, (('window', int), ('ticker', str))),
+    ('history', True, (('from_timestamp', int), ('to_timestamp', int), ('ticker', str))),
+    ('operational_feeds', True, (('ticker', str), ('offset', int), ('limit', int), ('fields', str))),
+    ('malfunctioning_feeds', True, (('ticker', str), ('offset', int), ('limit', int), ('fields', str))),
+    ('snapshot', True, (('ticker', str),)),
+    ('multicall', True, (('methods', str), ('ticker', str))),
+    ('state', True, (('ticker', str),)),
+    # Only available on the SCOREs built with INSTRUMENTATION_ENABLED
+    ('instrumentation', True, ()),
+    ('version', True, ()),
+    ('minimum_feeds_available', True, (('ticker', str),)),
+    ('timeout_price_update', True, (('ticker', str),)),
+    ('ticker_name', True, ()),
+    ('evaluation_mode', True, (('ticker', str),)),
+    ('quorum_tolerance', True, (('ticker', str),)),
+    ('quorum_order', True, (('ticker', str),)),
+    ('deviation_threshold', True, (('ticker', str),)),
+    ('heartbeat', True, (('ticker', str),)),
+    ('aggregator', True, (('ticker', str),)),
+)}
+
+
+def parse_command(args: list) -> tuple:
+    """ Return the method, whether it is readonly, and its JSON-RPC params """
+    if not args or args[0] not in METHODS:
+        raise UnknownMethodError(args[0] if args else '')
+
+    method = args[0]
+    readonly, signature = METHODS[method]
+    types = dict(signature)
+    params = {}
+
+    for index, arg in enumerate(args[1:]):
+        if '=' in arg and arg.split('=', 1)[0] in types:
+            name, value = arg.split('=', 1)
+        elif index < len(signature):
+            name, value = signature[index][0], arg
+        else:
+            raise InvalidParamsError(method, arg)
+        # The integers are hexadecimal strings in JSON-RPC
+        params[name] = hex(int(value, 0)) if types[name] is int else value
+
+    return method, readonly, params
+
+
+# ================================================
+#  Signature
+# ================================================
+class Signer(object):
+    """ Sign the transactions with the keystore of the network configuration """
+
+    def __init__(self, keystore: str, password: str) -> None:
+        # iconsdk is only needed to send transactions
+        from iconsdk.wallet.wallet import KeyWallet
+        from iconsdk.libs.serializer import serialize
+        from hashlib import sha3_256
+
+        self._wallet = KeyWallet.load(keystore, password)
+        self._serialize = serialize
+        self._sha3_256 = sha3_256
+
+    def address(self) -> str:
+        return self._wallet.get_address()
+
+    def sign(self, transaction: dict) -> dict:
+        tx_hash = self._sha3_256(self._serialize(transaction)).digest()
+        transaction['signature'] = base64.b64encode(self._wallet.sign(tx_hash)).decode()
+        return transaction
+
+
+# ================================================
+#  Client
+# ================================================
+class HylianCli(object):
+    def __init__(self, network: str) -> None:
+        self._config = json.loads(open(f'./config/{network}/tbears_cli_config.json', 'rb').read())
+        self._score = open(f'./config/{network}/score_address.txt', 'r').read().strip()
+        self._rpc = JsonRpcClient(self._config['uri'])
+        self._signer = None
+
+    def _get_signer(self) -> Signer:
+        if self._signer is None:
+            self._signer = Signer(self._config['keyStore'], self._config['password'])
+        return self._signer
+
+    def _transaction(self, method: str, params: dict) -> dict:
+        signer = self._get_signer()
+        transaction = {
+            'version': '0x3',
+            'from': signer.address(),
+            'to': self._score,
+            'stepLimit': hex(DEFAULT_STEP_LIMIT),
+            'timestamp': hex(int(time.time() * 1000 * 1000)),
+            'nid': self._config['nid'],
+            'nonce': '0x0',
+            'dataType': 'call',
+            'data': {'method': method, 'params': params}
+        }
+        return signer.sign(transaction)
+
+    async def send(self, method: str, params: dict) -> str:
+        """ Submit a transaction and return its hash, without waiting for its result """
+        return await self._rpc.call('icx_sendTransaction', self._transaction(method, params))
+
+    async def txresult(self, tx_hash: str) -> dict:
+        """ Poll the result of a transaction, with an exponential backoff """
+        delay = POLL_INITIAL_DELAY
+        deadline = time.monotonic() + POLL_TIMEOUT
+
+        while True:
+            try:
+                return await self._rpc.call('icx_getTransactionResult', {'txHash': tx_hash})
+            except JsonRpcError as error:
+                # Only wait for a pending transaction, fail on anything else
+                if not is_pending(error):
+                    raise
+                if time.monotonic() + delay > deadline:
+                    raise TransactionTimeoutError(tx_hash)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, POLL_MAXIMUM_DELAY)
+
+    async def call(self, method: str, params: dict):
+        return await self._rpc.icx_call(self._score, method, params)
+
+    async def run(self, commands: list) -> list:
+        """ Execute a list of commands and return their results in the same order.
+            The transactions are submitted in order, everything else is concurrent. """
+        # Reject the whole batch before sending anything if a command is invalid
+        parsed = [parse_command(command) for command in commands]
+        results = [None] * len(commands)
+        reads = []
+        tx_hashes = []
+
+        async def result(task):
+            try:
+                return await task
+            except Exception as error:
+                return {'error': repr(error)}
+
+        for index, (method, readonly, params) in enumerate(parsed):
+            if readonly:
+                reads.append((index, asyncio.ensure_future(result(self.call(method, params)))))
+                continue
+            try:
+                tx_hashes.append((index, await self.send(method, params)))
+            except Exception as error:
+                results[index] = {'error': repr(error)}
+
+        values = await asyncio.gather(
+            *[task for index, task in reads],
+            *[result(self.txresult(tx_hash)) for index, tx_hash in tx_hashes])
+
+        for (index, _), value in zip(reads + tx_hashes, values):
+            results[index] = value
+        return results
+
+    async def close(self) -> None:
+        await self._rpc.close()
+
+
+def read_commands(source) -> list:
+    commands = []
+    for line in source:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            commands.append(shlex.split(line))
+    return commands
+
+
+async def main(argv: list) -> None:
+    parser = argparse.ArgumentParser(prog='hylian-cli', description='Call the Hylian SCORE methods')
+    parser.add_argument('-n', '--network', required=True,
+                        help='Network to use (localhost, yeouido, euljiro or mainnet)')
+    parser.add_argument('command', nargs=argparse.REMAINDER,
+                        help='<method> [params...], or batch [file]')
+    args = parser.parse_args(argv)
+
+    if not args.command:
+        parser.error(f'a method is required : {", ".join(METHODS)}')
+
+    if args.command[0] == 'batch':
+        if len(args.command) > 1:
+            commands = read_commands(open(args.command[1], 'r'))
+        else:
+            commands = read_commands(sys.stdin)
+    else:
+        commands = [args.command]
+
+    cli = HylianCli(args.network)
+    try:
+        for command, result in zip(commands, await cli.run(commands)):
+            print(json.dumps({'command': ' '.join(command), 'result': result}, indent=2))
+    finally:
+        await cli.close()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(sys.argv[1:]))
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" JSON-RPC over a pool of keep-alive HTTP/1.1 connections, with asyncio """
+
+import asyncio
+import json
+import ssl
+from urllib.parse import urlsplit
+
+
+class JsonRpcError(Exception):
+    pass
+
+
+class HttpError(Exception):
+    pass
+
+
+class HttpConnection(object):
+    """ A single keep-alive HTTP/1.1 connection """
+
+    def __init__(self, host: str, port: int, tls: bool) -> None:
+        self._host = host
+        self._port = port
+        self._tls = tls
+        self._reader = None
+        self._writer = None
+
+    async def _connect(self) -> None:
+        context = ssl.create_default_context() if self._tls else None
+        self._reader, self._writer = await asyncio.open_connection(self._host, self._port, ssl=context)
+
+    async def _read_body(self, headers: dict) -> bytes:
+        if headers.get('transfer-encoding', '').lower() == 'chunked':
+            body = b''
+            while True:
+                size = int((await self._reader.readline()).split(b';')[0], 16)
+                if size == 0:
+                    await self._reader.readline()
+                    return body
+                body += await self._reader.readexactly(size)
+                await self._reader.readline()
+
+        return await self._reader.readexactly(int(headers.get('content-length', 0)))
+
+    async def request(self, path: str, body: bytes) -> bytes:
+        if self._writer is None:
+            await self._connect()
+
+        self._writer.write(
+            f'POST {path} HTTP/1.1\r\n'
+            f'Host: {self._host}:{self._port}\r\n'
+            'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n'
+            'Connection: keep-alive\r\n'
+            '\r\n'.encode() + body)
+        await self._writer.drain()
+
+        status = (await self._reader.readline()).decode()
+        if not status:
+            raise ConnectionResetError
+        code = int(status.split()[1])
+
+        headers = {}
+        while True:
+            line = (await self._reader.readline()).decode().strip()
+            if not line:
+                break
+            name, value = line.split(':', 1)
+            headers[name.strip().lower()] = value.strip()
+
+        body = await self._read_body(headers)
+        if headers.get('connection', '').lower() == 'close':
+            self.close()
+
+        if code != 200:
+            raise HttpError(code, body)
+        return body
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = self._writer = None
+
+    async def wait_closed(self) -> None:
+        writer = self._writer
+        self.close()
+        if writer is not None:
+            await writer.wait_closed()
+
+
+class JsonRpcClient(object):
+    """ JSON-RPC client of an ICON node. Up to `pool_size` requests
+        are sent concurrently, each on its own keep-alive connection. """
+
+    def __init__(self, uri: str, pool_size: int = 8) -> None:
+        url = urlsplit(uri)
+        tls = url.scheme == 'https'
+        self._path = url.path or '/'
+        self._pool = asyncio.LifoQueue()
+        for _ in range(pool_size):
+            self._pool.put_nowait(HttpConnection(url.hostname, url.port or (443 if tls else 80), tls))
+        self._id = 0
+
+    async def _send(self, body: bytes) -> bytes:
+        connection = await self._pool.get()
+        try:
+            try:
+                return await connection.request(self._path, body)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                # The server closed the idle connection : retry once on a new one
+                connection.close()
+                return await connection.request(self._path, body)
+        except Exception:
+            connection.close()
+            raise
+        finally:
+            self._pool.put_nowait(connection)
+
+    async def call(self, method: str, params: dict = None):
+        self._id += 1
+        payload = {'jsonrpc': '2.0', 'id': self._id, 'method': method}
+        if params is not None:
+            payload['params'] = params
+
+        response = json.loads(await self._send(json.dumps(payload).encode()))
+        if 'error' in response:
+            raise JsonRpcError(response['error'])
+        return response['result']
+
+    async def icx_call(self, to: str, method: str, params: dict = None):
+        """ Call a readonly method of a SCORE """
+        data = {'method': method}
+        if params:
+            data['params'] = params
+        return await self.call('icx_call', {'to': to, 'dataType': 'call', 'data': data})
+
+    async def close(self) -> None:
+        while not self._pool.empty():
+            await self._pool.get_nowait().wait_closed()
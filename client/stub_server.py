@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Local JSON-RPC server answering like an ICON node with Hylian and its
+    price feeds deployed, so the clients can be tried without any node.
+
+    Usage: python -m client.stub_server [port]
+"""
+
+import asyncio
+import json
+import sys
+import time
+
+from Hylian.math import Math
+from Hylian.constants import BREAKER_FAILURE_THRESHOLD
+from Hylian.feed.circuit_breaker import CircuitBreaker
+
+HYLIAN = 'cx' + '00' * 19 + '01'
+
+
+def feed_address(index: int) -> str:
+    return 'cx' + '%040x' % (index + 2)
+
+
+class StubNode(object):
+    """ The state of the chain served by the stub server """
+
+    def __init__(self,
+                 prices: list,
+                 ticker_name: str = 'ICXUSD',
+                 timeout: int = 5 * 60 * 1000 * 1000,
+                 minimum_feeds_available: int = 1,
+                 skipped: tuple = ()) -> None:
+        self.ticker_name = ticker_name
+        self.timeout = timeout
+        self.minimum_feeds_available = minimum_feeds_available
+        # Price feeds by address : a None price makes the feed revert
+        self.feeds = {feed_address(index): price for index, price in enumerate(prices)}
+        # Addresses of the feeds whose circuit breaker is open
+        self.skipped = set(skipped)
+        self.height = 1
+        self.requests = 0
+        # Names of the Hylian methods called
+        self.methods = []
+
+    @staticmethod
+    def now() -> int:
+        return int(time.time() * 1000 * 1000)
+
+    def _peek(self, address: str) -> dict:
+        price = self.feeds[address]
+        if price is None:
+            raise Exception('Price feed failure')
+        return {'value': hex(price), 'ticker_name': self.ticker_name, 'timestamp': hex(self.now())}
+
+    def _status(self, address: str) -> dict:
+        if address in self.skipped:
+            return {'status': 'SKIPPED', 'reason': f"CircuitBreakerOpen('{address}')"}
+        if self.feeds[address] is None:
+            return {'status': 'MALFUNCTIONING', 'reason': "IconScoreException('Price feed failure')"}
+        return {'status': 'OPERATIONAL', 'value': self.feeds[address]}
+
+    def _health(self, address: str) -> dict:
+        if address not in self.skipped:
+            return {'failures': '0x0', 'last_success': hex(self.height), 'last_failure': '0x0', 'tripped': '0x0'}
+
+        # The breaker opened at the current block, so it waits for the next probe
+        return {
+            'failures': hex(BREAKER_FAILURE_THRESHOLD),
+            'last_success': '0x0',
+            'last_failure': hex(self.height),
+            'tripped': '0x1',
+            'next_probe': hex(CircuitBreaker.next_probe(BREAKER_FAILURE_THRESHOLD, self.height))
+        }
+
+    def _feed(self, index: int, address: str) -> dict:
+        return {'address': address, 'feed': {'name': f'feed{index}', 'weight': '0x1', 'health': self._health(address)}}
+
+    def _hylian(self, method: str, params: dict):
+        self.methods.append(method)
+        if method == 'feeds':
+            if params.get('fields') == 'address':
+                return [{'address': address} for address in self.feeds]
+            return [self._feed(index, address) for index, address in enumerate(self.feeds)]
+        if method == 'malfunctioning_feeds':
+            statuses = [{'address': address, **self._status(address)} for address in self.feeds]
+            return [status for status in statuses if status['status'] != 'OPERATIONAL']
+        if method == 'minimum_feeds_available':
+            return hex(self.minimum_feeds_available)
+        if method == 'ticker_name':
+            return self.ticker_name
+        if method == 'timeout_price_update':
+            return hex(self.timeout)
+        if method == 'aggregator':
+            return 'median'
+        if method == 'value':
+            prices = [status['value'] for status in map(self._status, self.feeds) if status['status'] == 'OPERATIONAL']
+            if len(prices) == 0 or len(prices) < self.minimum_feeds_available:
+                raise Exception(f'NotEnoughFeedsAvailable({len(prices)}, {self.minimum_feeds_available})')
+            return hex(Math.median(prices))
+        raise Exception(f'Method not found: {method}')
+
+    def handle(self, request: dict) -> dict:
+        self.requests += 1
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        try:
+            if request['method'] == 'icx_getLastBlock':
+                response['result'] = {'height': self.height, 'time_stamp': self.now()}
+            elif request['method'] == 'icx_call':
+                params = request['params']
+                data = params['data']
+                if params['to'] == HYLIAN:
+                    response['result'] = self._hylian(data['method'], data.get('params', {}))
+                elif params['to'] in self.feeds and data['method'] == 'peek':
+                    response['result'] = self._peek(params['to'])
+                else:
+                    raise Exception(f'SCORE not found: {params["to"]}')
+            else:
+                raise Exception(f'Method not found: {request["method"]}')
+        except Exception as error:
+            response['error'] = {'code': -32000, 'message': str(error)}
+        return response
+
+
+class StubServer(object):
+    """ HTTP/1.1 keep-alive server of a StubNode """
+
+    def __init__(self, node: StubNode) -> None:
+        self.node = node
+        self.connections = 0
+        self._server = None
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                if not await reader.readline():
+                    break
+
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    name, value = line.split(':', 1)
+                    headers[name.strip().lower()] = value.strip()
+
+                request = json.loads(await reader.readexactly(int(headers.get('content-length', 0))))
+                body = json.dumps(self.node.handle(request)).encode()
+                writer.write(
+                    'HTTP/1.1 200 OK\r\n'
+                    'Content-Type: application/json\r\n'
+                    f'Content-Length: {len(body)}\r\n'
+                    'Connection: keep-alive\r\n'
+                    '\r\n'.encode() + body)
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0) -> str:
+        """ Start serving and return the JSON-RPC uri """
+        self._server = await asyncio.start_server(self._serve, host, port)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f'http://{host}:{port}/api/v3'
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+
+async def main(port: int) -> None:
+    server = StubServer(StubNode([100, 101, 102, 99, None]))
+    print(f'Hylian {HYLIAN} served on {await server.start(port=port)}')
+    await asyncio.Event().wait()
+
+
+if __name__ == '__main__':
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 9000))
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Rebuild the Hylian state incrementally from its event logs.
+
+    Usage: python ./scripts/events/consume_logs.py <network> <state file> [start height]
+
+    The state file keeps the last processed block height, so the consumer
+    resumes where it stopped instead of reading the whole Hylian state again.
+
+    Every transaction of a block is checked, whatever its recipient : the
+    price feeds push their prices with `submit_value` from their own SCORE,
+    so most PriceUpdated events are emitted during inter-SCORE calls.
+
+    Hylian emits its initial configuration when it is deployed and when a
+    ticker is added. A consumer starting after these events, or following
+    a deployment older than them, must seed its state file with the
+    `state` and `feeds` readonly methods first : the events of the feeds
+    it doesn't know yet still update them, with a name left unknown.
+"""
+
+import json
+import os
+import sys
+import time
+import urllib.request
+
+
+POLL_INTERVAL = 2
+
+
+class JsonRpc(object):
+    def __init__(self, uri):
+        self._uri = uri
+        self._id = 0
+
+    def call(self, method, params=None):
+        self._id += 1
+        payload = {"jsonrpc": "2.0", "id": self._id, "method": method}
+        if params is not None:
+            payload["params"] = params
+
+        request = urllib.request.Request(
+            self._uri,
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"})
+        response = json.loads(urllib.request.urlopen(request).read())
+
+        if "error" in response:
+            raise Exception(response["error"])
+        return response["result"]
+
+
+def ticker_state(state, ticker):
+    return state["tickers"].setdefault(ticker, {"config": {}, "feeds": {}, "price": None})
+
+
+def feed_state(state, ticker, address):
+    return ticker_state(state, ticker)["feeds"].setdefault(address, {"name": None, "weight": 1})
+
+
+def apply_event(state, name, indexed, data):
+    """ Apply a single Hylian event to the state """
+    values = indexed + data
+    ticker = values[0]
+
+    if name == "TickerAdded":
+        ticker_state(state, ticker)["config"]["minimum_feeds_available"] = int(values[1], 16)
+    elif name == "TickerRemoved":
+        state["tickers"].pop(ticker, None)
+    elif name == "FeedAdded":
+        ticker_state(state, ticker)["feeds"][values[1]] = {"name": values[2], "weight": 1}
+    elif name == "FeedRemoved":
+        ticker_state(state, ticker)["feeds"].pop(values[1], None)
+    elif name == "FeedMoved":
+        feed_state(state, ticker, values[1])
+        feeds = ticker_state(state, ticker)["feeds"]
+        order = [address for address in feeds if address != values[1]]
+        order.insert(int(values[2], 16), values[1])
+        ticker_state(state, ticker)["feeds"] = {address: feeds[address] for address in order}
+    elif name == "FeedWeightChanged":
+        feed_state(state, ticker, values[1])["weight"] = int(values[2], 16)
+    elif name == "ConfigChanged":
+        if values[1] == "ticker_name":
+            state["tickers"][values[2]] = state["tickers"].pop(ticker, ticker_state(state, ticker))
+        else:
+            ticker_state(state, ticker)["config"][values[1]] = values[2]
+    elif name == "PriceUpdated":
+        ticker_state(state, ticker)["price"] = {
+            "value": int(values[1], 16),
+            "timestamp": int(values[2], 16)
+        }
+
+
+def process_block(rpc, state, score_address, height):
+    block = rpc.call("icx_getBlockByHeight", {"height": hex(height)})
+
+    for tx in block["confirmed_transaction_list"]:
+        # Hylian may be called by another SCORE : look at the logs of every transaction
+        result = rpc.call("icx_getTransactionResult", {"txHash": tx["txHash"]})
+        for log in result.get("eventLogs", []):
+            if log["scoreAddress"] != score_address:
+                continue
+            signature = log["indexed"][0]
+            apply_event(state, signature[:signature.index("(")], log["indexed"][1:], log.get("data", []))
+
+    state["height"] = height
+
+
+def load_state(state_file, start_height):
+    if os.path.exists(state_file):
+        return json.loads(open(state_file, "r").read())
+    return {"height": start_height - 1, "tickers": {}}
+
+
+def save_state(state_file, state):
+    # Write then rename, so an interrupted consumer never corrupts its state
+    open(state_file + ".tmp", "w").write(json.dumps(state, indent=2))
+    os.replace(state_file + ".tmp", state_file)
+
+
+if __name__ == '__main__':
+    network = sys.argv[1]
+    state_file = sys.argv[2]
+    start_height = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    config = json.loads(open("./config/" + network + "/tbears_cli_config.json", "rb").read())
+    score_address = open("./config/" + network + "/score_address.txt", "r").read().strip()
+
+    rpc = JsonRpc(config["uri"])
+    state = load_state(state_file, start_height)
+
+    while True:
+        last_height = rpc.call("icx_getLastBlock")["height"]
+
+        if state["height"] >= last_height:
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        for height in range(state["height"] + 1, last_height + 1):
+            process_block(rpc, state, score_address, height)
+            save_state(state_file, state)
+            print(f"Block {height} processed")
@@ -0,0 +1,48 @@
+#!/bin/bash
+
+. ./scripts/utils/utils.sh
+
+function print_usage {
+    usage_header ${0}
+    usage_option " -n <network> : Network to use (localhost, yeouido, euljiro or mainnet)"
+    usage_option " -f <feeds file> : CSV file (address,name per line) or JSON file ([{\"address\", \"name\"}]) of the new price feeds"
+    usage_footer
+    exit 1
+}
+
+function process {
+    if [[ ("$network" == "") || ("$feeds" == "") ]]; then
+        print_usage
+    fi
+
+    command=$(cat <<-COMMAND
+    tbears sendtx <(
+        python ./scripts/score/dynamic_call/add_feeds.py
+            ${network@Q}
+            ${feeds@Q}
+        )
+        -c ./config/${network}/tbears_cli_config.json
+COMMAND
+)
+
+    txresult=$(./scripts/icon/txresult.sh -n "${network}" -c "${command}")
+    echo -e "${txresult}"
+}
+
+# Parameters
+while getopts "n:f:" option; do
+    case "${option}" in
+        n)
+            network=${OPTARG}
+            ;;
+        f)
+            feeds=${OPTARG}
+            ;;
+        *)
+            print_usage 
+            ;;
+    esac 
+done
+shift $((OPTIND-1))
+
+process
\ No newline at end of file
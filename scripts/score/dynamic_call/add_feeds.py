@@ -0,0 +1,31 @@
+import csv
+import json
+import sys
+
+
+def load_feeds(feeds_file):
+    # A JSON list of {"address": ..., "name": ...} objects
+    if feeds_file.endswith(".json"):
+        return json.loads(open(feeds_file, "rb").read())
+
+    # Otherwise a CSV file with an "address,name" line per feed
+    feeds = []
+    for row in csv.reader(open(feeds_file, "r")):
+        if not row or row[0].strip() in ("", "address"):
+            continue
+        feeds.append({"address": row[0].strip(), "name": row[1].strip()})
+    return feeds
+
+
+if __name__ == '__main__':
+    network = sys.argv[1]
+    feeds_file = sys.argv[2]
+
+    score_address_txt = "./config/" + network + "/score_address.txt"
+
+    call = json.loads(open("./calls/add_feeds.json", "rb").read())
+    call["params"]["to"] = open(score_address_txt, "r").read()
+
+    call["params"]["data"]["params"]["feeds"] = json.dumps(load_feeds(feeds_file))
+
+    print(json.dumps(call))
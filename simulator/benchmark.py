@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Measure how the Hylian methods scale with the amount of price feeds.
+
+    Usage: python -m simulator.benchmark [--feeds 1,10,100,1000] [--repeat 10]
+                                         [--latency 0] [--failure-rate 0]
+                                         [--instrument]
+
+    For each method, it reports the amount of calls per second,
+    and the average amount of storage reads, writes and price feeds peeks.
+    With --instrument, it also dumps the counters collected by the
+    Hylian instrumentation for each external method.
+"""
+
+import argparse
+import json
+import time
+
+from iconservice import Stats
+from Hylian.instrumentation import Instrumentation
+from .chain import Chain
+
+
+class Result(object):
+    def __init__(self, method: str, feeds: int) -> None:
+        self.method = method
+        self.feeds = feeds
+        self.calls = 0
+        self.elapsed = 0.0
+        self.reads = 0
+        self.writes = 0
+        self.peeks = 0
+
+    def add(self, elapsed: float) -> None:
+        self.calls += 1
+        self.elapsed += elapsed
+        self.reads += Stats.reads
+        self.writes += Stats.writes
+        self.peeks += Stats.calls
+
+    def row(self) -> tuple:
+        return (
+            self.method,
+            self.feeds,
+            self.calls / self.elapsed if self.elapsed > 0 else float('inf'),
+            self.reads / self.calls,
+            self.writes / self.calls,
+            self.peeks / self.calls
+        )
+
+
+def run(result: Result, method, *args) -> None:
+    Stats.reset()
+    start = time.perf_counter()
+    method(*args)
+    result.add(time.perf_counter() - start)
+
+
+def benchmark(feeds: int, repeat: int, latency: float, failure_rate: float, instrumented: bool) -> tuple:
+    chain = Chain(instrumented=instrumented)
+    addresses = chain.deploy_feeds(feeds, latency=latency, failure_rate=failure_rate)
+    score = chain.score
+
+    add_feed = Result('add_feed', feeds)
+    for index, address in enumerate(addresses):
+        run(add_feed, score.add_feed, address, f'feed{index}')
+
+    results = [add_feed]
+    for name, method, args in (
+        ('value', score.value, ()),
+        ('operational_feeds', score.operational_feeds, ()),
+        ('refresh', score.refresh, ()),
+        ('submit_value', score.submit_value, (10 ** 18,)),
+        ('cached_value', score.cached_value, ()),
+    ):
+        result = Result(name, feeds)
+        for _ in range(repeat):
+            chain.next_block()
+            if name == 'submit_value':
+                chain.sender(addresses[0])
+            run(result, method, *args)
+            chain.sender(Chain.OWNER)
+        results.append(result)
+
+    return chain, results
+
+
+def report(results: list) -> None:
+    header = ('method', 'feeds', 'ops/sec', 'reads', 'writes', 'peeks')
+    print('%-18s %6s %12s %10s %10s %8s' % header)
+    for result in results:
+        print('%-18s %6d %12.1f %10.1f %10.1f %8.1f' % result.row())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark Hylian against mock price feeds')
+    parser.add_argument('--feeds', default='1,10,100,1000',
+                        help='Comma-separated amounts of price feeds to benchmark')
+    parser.add_argument('--repeat', type=int, default=10,
+                        help='Calls of each method per amount of price feeds')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='Seconds spent by each price feed in peek()')
+    parser.add_argument('--failure-rate', type=float, default=0.0,
+                        help='Probability for a price feed peek() to fail')
+    parser.add_argument('--instrument', action='store_true',
+                        help='Dump the Hylian instrumentation counters of each amount of price feeds')
+    args = parser.parse_args()
+
+    if args.instrument:
+        Instrumentation.clock = time.perf_counter
+
+    results = []
+    for feeds in map(int, args.feeds.split(',')):
+        chain, feeds_results = benchmark(feeds, args.repeat, args.latency, args.failure_rate, args.instrument)
+        results += feeds_results
+        if args.instrument:
+            print(json.dumps({'feeds': feeds, 'instrumentation': chain.instrumentation()}, indent=2))
+    report(results)
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+from iconservice import Address, Context, ExecutionContext, IconScoreDatabase, Stats, EVENTS
+from Hylian.main import Hylian
+from Hylian.instrumentation import Instrumentation
+from .price_feed import MockPriceFeed
+
+# Block interval of the ICON network, in microseconds
+BLOCK_INTERVAL = 2 * 1000 * 1000
+
+
+def address(prefix: str, index: int) -> Address:
+    return Address.from_string(prefix + ('%040x' % index))
+
+
+class Chain(object):
+    """ A simulated chain with a single Hylian SCORE deployed """
+
+    OWNER = address('hx', 1)
+    HYLIAN = address('cx', 1)
+
+    def __init__(self, ticker_name: str = 'ICXUSD', minimum_feeds_available: int = 1, seed: int = 0,
+                 instrumented: bool = False) -> None:
+        Context.owner = Chain.OWNER
+        Context.address = Chain.HYLIAN
+        Context.sender = Chain.OWNER
+        Context.block_height = 1
+        Context.timestamp = 1_500_000_000 * 1000 * 1000
+        Context.tx = None
+        Context.execution = ExecutionContext()
+        Context.scores = {}
+        EVENTS.clear()
+
+        self.ticker_name = ticker_name
+        self.rng = random.Random(seed)
+        self.feeds = []
+        Instrumentation.enabled = instrumented
+        self.score = Hylian(IconScoreDatabase())
+        self.score.on_install(ticker_name, minimum_feeds_available)
+
+    def next_block(self, blocks: int = 1) -> None:
+        Context.block_height += blocks
+        Context.timestamp += blocks * BLOCK_INTERVAL
+        Context.execution = ExecutionContext()
+
+    def sender(self, sender: Address) -> 'Chain':
+        Context.sender = sender
+        return self
+
+    def deploy_feed(self, value: int, **kwargs) -> Address:
+        """ Deploy a mock price feed SCORE, without registering it to Hylian """
+        feed = address('cx', len(Context.scores) + 2)
+        Context.scores[feed] = MockPriceFeed(value, self.ticker_name, rng=self.rng, **kwargs)
+        self.feeds.append(feed)
+        return feed
+
+    def deploy_feeds(self, count: int, value: int = 10 ** 18, spread: int = 100, **kwargs) -> list:
+        """ Deploy `count` price feeds, with prices spread around `value` """
+        return [
+            self.deploy_feed(value + self.rng.randint(-spread, spread), **kwargs)
+            for _ in range(count)
+        ]
+
+    def instrumentation(self) -> dict:
+        """ Return the counters of the Hylian instrumentation, if the chain is instrumented """
+        return self.score._instrumentation.serialize()
+
+    @staticmethod
+    def measure(method, *args, **kwargs) -> tuple:
+        """ Call a Hylian method and return its result with the storage accesses it did """
+        Stats.reset()
+        result = method(*args, **kwargs)
+        return result, Stats.snapshot()
@@ -0,0 +1,351 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" In-memory replacement of the parts of iconservice used by Hylian.
+
+    It is only meant to run Hylian off-chain in the simulator : every
+    storage access is counted in `Stats`, and the chain context
+    (sender, block height, time, deployed SCOREs) is held in `Context`.
+"""
+
+import json
+from functools import wraps
+from inspect import isfunction
+
+
+# ================================================
+#  Errors
+# ================================================
+class IconScoreException(Exception):
+    pass
+
+
+def revert(message: str = None) -> None:
+    raise IconScoreException(message)
+
+
+def json_loads(src: str):
+    return json.loads(src)
+
+
+def json_dumps(obj) -> str:
+    return json.dumps(obj)
+
+
+# ================================================
+#  Address
+# ================================================
+class Address(object):
+    __slots__ = ('prefix', 'body')
+
+    def __init__(self, prefix: str, body: bytes) -> None:
+        self.prefix = prefix
+        self.body = body
+
+    @staticmethod
+    def from_string(address: str) -> 'Address':
+        if not isinstance(address, str) or len(address) != 42 or address[:2] not in ('hx', 'cx'):
+            raise ValueError(f'Invalid address: {address}')
+        return Address(address[:2], bytes.fromhex(address[2:]))
+
+    @property
+    def is_contract(self) -> bool:
+        return self.prefix == 'cx'
+
+    def __str__(self) -> str:
+        return self.prefix + self.body.hex()
+
+    def __repr__(self) -> str:
+        return str(self)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Address) and self.prefix == other.prefix and self.body == other.body
+
+    def __hash__(self) -> int:
+        return hash((self.prefix, self.body))
+
+
+# ================================================
+#  Storage
+# ================================================
+class Stats(object):
+    """ Amount of storage accesses and inter-SCORE calls """
+    reads = 0
+    writes = 0
+    calls = 0
+
+    @staticmethod
+    def reset() -> None:
+        Stats.reads = Stats.writes = Stats.calls = 0
+
+    @staticmethod
+    def snapshot() -> dict:
+        return {'reads': Stats.reads, 'writes': Stats.writes, 'calls': Stats.calls}
+
+
+class IconScoreDatabase(object):
+    def __init__(self, storage: dict = None, prefix: bytes = b'') -> None:
+        self._storage = {} if storage is None else storage
+        self._prefix = prefix
+
+    def get(self, key: bytes):
+        Stats.reads += 1
+        return self._storage.get(self._prefix + key)
+
+    def put(self, key: bytes, value) -> None:
+        Stats.writes += 1
+        self._storage[self._prefix + key] = value
+
+    def delete(self, key: bytes) -> None:
+        Stats.writes += 1
+        self._storage.pop(self._prefix + key, None)
+
+    def get_sub_db(self, prefix: bytes) -> 'IconScoreDatabase':
+        return IconScoreDatabase(self._storage, self._prefix + prefix + b'|')
+
+
+def _default(value_type: type):
+    return {int: 0, str: '', bool: False}.get(value_type)
+
+
+def _key(key) -> bytes:
+    if isinstance(key, bytes):
+        return key
+    return str(key).encode()
+
+
+class VarDB(object):
+    def __init__(self, key, db: IconScoreDatabase, value_type: type) -> None:
+        self._key = b'V|' + _key(key)
+        self._db = db
+        self._type = value_type
+
+    def set(self, value) -> None:
+        self._db.put(self._key, value)
+
+    def get(self):
+        value = self._db.get(self._key)
+        return _default(self._type) if value is None else value
+
+    def remove(self) -> None:
+        self._db.delete(self._key)
+
+
+class ArrayDB(object):
+    def __init__(self, key, db: IconScoreDatabase, value_type: type) -> None:
+        self._key = b'A|' + _key(key)
+        self._db = db
+        self._type = value_type
+
+    def _item(self, index: int) -> bytes:
+        return self._key + b'|' + _key(index)
+
+    def _index(self, index: int) -> int:
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError(index)
+        return index
+
+    def __len__(self) -> int:
+        return self._db.get(self._key + b'|size') or 0
+
+    def put(self, value) -> None:
+        size = len(self)
+        self._db.put(self._item(size), value)
+        self._db.put(self._key + b'|size', size + 1)
+
+    def pop(self):
+        size = len(self)
+        if size == 0:
+            return None
+        value = self._db.get(self._item(size - 1))
+        self._db.delete(self._item(size - 1))
+        self._db.put(self._key + b'|size', size - 1)
+        return value
+
+    def get(self, index: int = 0):
+        return self[index]
+
+    def __getitem__(self, index: int):
+        return self._db.get(self._item(self._index(index)))
+
+    def __setitem__(self, index: int, value) -> None:
+        self._db.put(self._item(self._index(index)), value)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._db.get(self._item(index))
+
+    def __contains__(self, item) -> bool:
+        for value in self:
+            if value == item:
+                return True
+        return False
+
+
+class DictDB(object):
+    def __init__(self, key, db: IconScoreDatabase, value_type: type, depth: int = 1) -> None:
+        self._key = b'D|' + _key(key)
+        self._db = db
+        self._type = value_type
+
+    def _item(self, key) -> bytes:
+        return self._key + b'|' + _key(key)
+
+    def __getitem__(self, key):
+        value = self._db.get(self._item(key))
+        return _default(self._type) if value is None else value
+
+    def __setitem__(self, key, value) -> None:
+        self._db.put(self._item(key), value)
+
+    def __delitem__(self, key) -> None:
+        self._db.delete(self._item(key))
+
+    def remove(self, key) -> None:
+        self._db.delete(self._item(key))
+
+    def __contains__(self, key) -> bool:
+        return self._db.get(self._item(key)) is not None
+
+
+# ================================================
+#  Logs
+# ================================================
+class Logger(object):
+    @staticmethod
+    def debug(msg: str, tag: str = '') -> None:
+        pass
+
+    info = warning = error = debug
+
+
+# Event logs emitted by the SCOREs, as (name, arguments) tuples
+EVENTS = []
+
+
+def eventlog(func=None, indexed: int = 0):
+    def decorator(event):
+        @wraps(event)
+        def __wrapper(self, *args, **kwargs):
+            EVENTS.append((event.__name__, args))
+        return __wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+# ================================================
+#  SCORE
+# ================================================
+def external(func=None, readonly: bool = False):
+    if func is None:
+        return lambda f: f
+    return func
+
+
+def payable(func):
+    return func
+
+
+def interface(func):
+    return func
+
+
+class InterfaceScore(object):
+    def __init__(self, address: Address = None) -> None:
+        self.address = address
+
+
+class Message(object):
+    def __init__(self, sender: Address, value: int = 0) -> None:
+        self.sender = sender
+        self.value = value
+
+
+class Transaction(object):
+    def __init__(self, hash: bytes) -> None:
+        self.hash = hash
+
+
+class ExecutionContext(object):
+    """ Context of an execution, replaced for every block executed """
+    pass
+
+
+class Context(object):
+    """ State of the simulated chain, shared by every SCORE """
+    owner = None
+    address = None
+    sender = None
+    block_height = 1
+    # In microseconds, as returned by IconScoreBase.now()
+    timestamp = 0
+    tx = None
+    execution = ExecutionContext()
+    # SCOREs reachable with create_interface_score, by address
+    scores = {}
+
+
+class IconScoreBase(object):
+    def __init__(self, db: IconScoreDatabase) -> None:
+        self.db = db
+
+    def on_install(self, **kwargs) -> None:
+        pass
+
+    def on_update(self, **kwargs) -> None:
+        pass
+
+    @property
+    def msg(self) -> Message:
+        return Message(Context.sender)
+
+    @property
+    def _context(self) -> ExecutionContext:
+        return Context.execution
+
+    @property
+    def tx(self) -> Transaction:
+        return Context.tx
+
+    @property
+    def owner(self) -> Address:
+        return Context.owner
+
+    @property
+    def address(self) -> Address:
+        return Context.address
+
+    @property
+    def block_height(self) -> int:
+        return Context.block_height
+
+    def now(self) -> int:
+        return Context.timestamp
+
+    def create_interface_score(self, address: Address, interface_cls: type):
+        Stats.calls += 1
+        score = Context.scores.get(address)
+        if score is None:
+            raise IconScoreException(f'SCORE not found: {address}')
+        return score
+
+
+__all__ = [name for name in dir() if not name.startswith('_') and name != 'json'] + ['wraps', 'isfunction']
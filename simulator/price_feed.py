@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+import time
+
+from iconservice import Context, IconScoreException
+
+
+class MockPriceFeed(object):
+    """ Price feed SCORE answering PriceFeedInterface.peek
+
+        latency : seconds spent in each peek
+        failure_rate : probability for a peek to revert
+        stale : the timestamp returned is the time of the creation of the feed
+    """
+
+    def __init__(self,
+                 value: int,
+                 ticker_name: str,
+                 latency: float = 0.0,
+                 failure_rate: float = 0.0,
+                 stale: bool = False,
+                 rng: random.Random = None) -> None:
+        self.value = value
+        self.ticker_name = ticker_name
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.timestamp = Context.timestamp if stale else None
+        self.peeks = 0
+        self._rng = rng or random.Random(0)
+
+    def peek(self) -> dict:
+        self.peeks += 1
+
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        if self.failure_rate > 0 and self._rng.random() < self.failure_rate:
+            raise IconScoreException('Price feed failure')
+
+        return {
+            'value': self.value,
+            'ticker_name': self.ticker_name,
+            'timestamp': Context.timestamp if self.timestamp is None else self.timestamp
+        }
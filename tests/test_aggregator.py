@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from iconservice import IconScoreException
+from simulator.chain import Chain
+
+
+def median(values: list) -> int:
+    ordered = sorted(values)
+    middle = (len(ordered) - 1) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle] + ordered[middle + 1]) // 2
+
+
+PRICES = [1000, 1010, 990, 1005, 2000, 995, 1002, 998, 1001, 1003, 600]
+WEIGHTS = [1, 3, 6, 2, 1, 1, 1, 4, 1, 1, 1]
+
+
+def expected(aggregator: str) -> int:
+    if aggregator == 'median':
+        return median(PRICES)
+    if aggregator == 'weighted_median':
+        # The median of the values repeated by their weight
+        return median([price for price, weight in zip(PRICES, WEIGHTS) for _ in range(weight)])
+    if aggregator == 'weighted_mean':
+        return sum(price * weight for price, weight in zip(PRICES, WEIGHTS)) // sum(WEIGHTS)
+    if aggregator == 'trimmed_mean':
+        # 10% of 11 values : one value trimmed on each side
+        return sum(sorted(PRICES)[1:-1]) // (len(PRICES) - 2)
+    if aggregator == 'mad_filtered_mean':
+        center = median(PRICES)
+        mad = median([abs(price - center) for price in PRICES])
+        kept = [price for price in PRICES if abs(price - center) <= 3 * mad]
+        return sum(kept) // len(kept)
+
+
+@pytest.fixture
+def chain():
+    chain = Chain()
+    for price, weight in zip(PRICES, WEIGHTS):
+        feed = chain.deploy_feed(price)
+        chain.score.add_feed(feed, 'feed')
+        chain.score.set_feed_weight(feed, weight)
+    return chain
+
+
+@pytest.mark.parametrize('aggregator', [
+    'median', 'weighted_median', 'weighted_mean', 'trimmed_mean', 'mad_filtered_mean'
+])
+def test_aggregators(chain, aggregator):
+    chain.score.set_aggregator(aggregator)
+    assert chain.score.aggregator() == aggregator
+    assert chain.score.value() == expected(aggregator)
+
+
+def test_unsupported_aggregator(chain):
+    with pytest.raises(IconScoreException, match='AggregatorNotSupportedError'):
+        chain.score.set_aggregator('mode')
+    assert chain.score.aggregator() == 'median'
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from backtest import engine
+from backtest.records import Record
+
+
+def replay(records: list, checks: list) -> list:
+    state = engine.FeedsState()
+    results = []
+    for record, (now, ticker_name, timeout) in zip(records, checks):
+        state.update(record)
+        results.append(state.operational(now, ticker_name, timeout))
+    return results
+
+
+def test_operational_numpy_matches_pure(monkeypatch):
+    pytest.importorskip('numpy')
+    rng = random.Random(0)
+    records = [
+        Record(index * 10, f'feed{rng.randrange(300)}', rng.randrange(100), rng.choice(['ICXUSD', 'BTCUSD']))
+        for index in range(3000)
+    ]
+    checks = [
+        (record.timestamp, rng.choice(['ICXUSD', 'BTCUSD', 'ETHUSD']), rng.randrange(1, 5000))
+        for record in records
+    ]
+
+    expected = replay(records, checks)
+    monkeypatch.setattr(engine, 'numpy', None)
+    assert replay(records, checks) == expected
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from client.cli import is_pending
+from client.jsonrpc import JsonRpcError
+
+
+@pytest.mark.parametrize('error, pending', [
+    ({'code': -31002, 'message': 'Pending'}, True),
+    ({'code': -31003, 'message': 'Executing'}, True),
+    ({'code': -32602, 'message': 'Pending transaction'}, True),
+    ({'code': -32602, 'message': 'Executing transaction'}, True),
+    ({'code': -32602, 'message': 'Invalid params txHash'}, False),
+    ({'code': -31004, 'message': 'NotFound'}, False),
+    ({'code': -32000, 'message': 'Server error'}, False),
+])
+def test_is_pending(error, pending):
+    assert is_pending(JsonRpcError(error)) == pending
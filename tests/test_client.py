@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+
+from client.aggregator import HylianClient
+from client.jsonrpc import JsonRpcClient
+from client.stub_server import HYLIAN, StubNode, StubServer, feed_address
+
+
+def cross_check(node: StubNode):
+    async def run():
+        server = StubServer(node)
+        rpc = JsonRpcClient(await server.start())
+        try:
+            return await HylianClient(rpc, HYLIAN).cross_check()
+        finally:
+            await rpc.close()
+            await server.stop()
+
+    return asyncio.run(run())
+
+
+def test_cross_check_matches():
+    result = cross_check(StubNode([100, 101, 102, 99, None]))
+    assert result.local == result.onchain == 100
+    assert result.matches()
+    assert list(result.malfunctioning) == [feed_address(4)]
+
+
+def test_cross_check_excludes_skipped_feeds():
+    # The outlier would move the median if it was not skipped like Hylian does
+    result = cross_check(StubNode([100, 101, 102, 10 ** 6], skipped=[feed_address(3)]))
+    assert result.local == result.onchain == 101
+    assert result.matches()
+    assert feed_address(3) not in result.operational
+    assert 'CircuitBreakerOpen' in result.malfunctioning[feed_address(3)]
+
+
+def test_cross_check_reads_the_skipped_feeds_from_their_health():
+    node = StubNode([100, 101, 102, 10 ** 6], skipped=[feed_address(3)])
+    cross_check(node)
+    # Hylian is not asked to peek its feeds a second time
+    assert 'malfunctioning_feeds' not in node.methods
+    assert node.methods.count('feeds') == 1
+
+
+def test_skipped_feeds_probe():
+    node = StubNode([100], skipped=[feed_address(0)])
+    feeds = [node._feed(0, feed_address(0))]
+    next_probe = int(feeds[0]['feed']['health']['next_probe'], 16)
+    assert list(HylianClient.skipped_feeds(feeds, next_probe - 1)) == [feed_address(0)]
+    # The feed is peeked again once the probe is due
+    assert HylianClient.skipped_feeds(feeds, next_probe) == {}
+
+
+def test_cross_check_minimum_feeds_available():
+    result = cross_check(StubNode([100, None, None], minimum_feeds_available=2))
+    assert result.local is None
+    assert result.onchain is None
+    assert result.matches()
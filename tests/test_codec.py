@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from Hylian.codec import Codec, InvalidRecordError
+from Hylian.feed.feed import Feed
+
+FIELDS = {
+    int: [0, 1, -1, 127, 128, -128, -129, 255, 256, 2 ** 64, -2 ** 64, 10 ** 30, None],
+    str: ['', 'a', 'ICXUSD', 'é' * 200, 'x' * 1000, None]
+}
+
+
+def default(value_type: type):
+    return '' if value_type == str else 0
+
+
+def test_feed_record_round_trip():
+    """ Every field of the feed record, with each special value """
+    for field, value_type in enumerate(Feed._LAYOUT):
+        for value in FIELDS[value_type]:
+            record = [default(item_type) for item_type in Feed._LAYOUT]
+            record[field] = value
+            decoded = Codec.decode(Feed._LAYOUT, Codec.encode(Feed._LAYOUT, record))
+            assert decoded[field] == (default(value_type) if value is None else value)
+            assert decoded[:field] + decoded[field + 1:] == record[:field] + record[field + 1:]
+
+
+def test_round_trip_fuzz():
+    rng = random.Random(0)
+    for _ in range(1000):
+        layout = tuple(rng.choice((int, str)) for _ in range(rng.randrange(1, 15)))
+        record = [rng.choice(FIELDS[value_type]) for value_type in layout]
+        expected = [default(value_type) if value is None else value for value_type, value in zip(layout, record)]
+        assert Codec.decode(layout, Codec.encode(layout, record)) == expected
+
+
+def test_appended_fields_take_their_default():
+    encoded = Codec.encode((int, str), [-5, 'name'])
+    assert Codec.decode((int, str, int, str), encoded) == [-5, 'name', 0, '']
+    assert Codec.decode(Feed._LAYOUT, None) == [default(value_type) for value_type in Feed._LAYOUT]
+
+
+def test_truncated_record():
+    encoded = Codec.encode((int, str), [2 ** 40, 'name'])
+    with pytest.raises(InvalidRecordError):
+        Codec.decode((int, str), encoded[:-1])
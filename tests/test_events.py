@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+import json
+import os
+
+from iconservice import EVENTS
+from simulator.chain import Chain
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+spec = importlib.util.spec_from_file_location('consume_logs', os.path.join(ROOT, 'scripts', 'events', 'consume_logs.py'))
+consume_logs = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(consume_logs)
+
+
+def encode(value) -> str:
+    """ Format an event argument as in the event logs of a transaction result """
+    if isinstance(value, int):
+        return hex(value)
+    return str(value)
+
+
+def consume(state: dict, events: list) -> dict:
+    for name, args in events:
+        consume_logs.apply_event(state, name, [encode(arg) for arg in args], [])
+    return state
+
+
+def test_rebuild_state_from_events():
+    chain = Chain(ticker_name='ICXUSD', minimum_feeds_available=2)
+    chain.score.add_ticker('BTCUSD', 1)
+    chain.score.set_aggregator('trimmed_mean')
+    chain.score.set_quorum_tolerance(50, 'BTCUSD')
+    feeds = chain.deploy_feeds(3)
+    chain.score.add_feeds(json.dumps([{'address': str(feed), 'name': f'feed{index}'} for index, feed in enumerate(feeds)]))
+    chain.score.set_feed_weight(feeds[1], 4)
+    chain.score.move_feed(feeds[2], 0)
+    chain.score.refresh()
+
+    state = consume({'height': 0, 'tickers': {}}, EVENTS)
+
+    for ticker in ('ICXUSD', 'BTCUSD'):
+        configuration = chain.score.state(ticker)['configuration']
+        expected = {name: str(value) for name, value in configuration.items() if name != 'ticker_name'}
+        expected['minimum_feeds_available'] = configuration['minimum_feeds_available']
+        config = state['tickers'][ticker]['config']
+        config['minimum_feeds_available'] = int(config['minimum_feeds_available'])
+        assert config == expected
+
+    icx = state['tickers']['ICXUSD']
+    assert list(icx['feeds']) == [str(feed['address']) for feed in chain.score.feeds(fields='address')]
+    assert icx['feeds'][str(feeds[1])] == {'name': 'feed1', 'weight': 4}
+    assert icx['price']['value'] == chain.score.cached_value()['value']
+
+
+def test_consume_from_a_later_block():
+    """ The events of the feeds added before the first consumed block don't fail """
+    chain = Chain()
+    feed = chain.deploy_feed(100)
+    chain.score.add_feed(feed, 'feed')
+    del EVENTS[:]
+
+    chain.score.set_feed_weight(feed, 3)
+    chain.score.move_feed(feed, 0)
+    state = consume({'height': 0, 'tickers': {}}, EVENTS)
+    assert state['tickers']['ICXUSD']['feeds'] == {str(feed): {'name': None, 'weight': 3}}
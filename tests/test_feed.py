@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import statistics
+
+from iconservice import Context, IconScoreDatabase
+from Hylian.constants import BREAKER_FAILURE_THRESHOLD, BREAKER_PROBE_INTERVAL, DEVIATION_STATS_PRECISION
+from Hylian.feed.feed import Feed
+from simulator.chain import Chain
+
+
+def test_failures_counted_once_per_block():
+    chain = Chain()
+    healthy = chain.deploy_feed(10 ** 18)
+    failing = chain.deploy_feed(10 ** 18, failure_rate=1.0)
+    chain.score.add_feed(healthy, 'healthy')
+    chain.score.add_feed(failing, 'failing')
+
+    chain.next_block()
+    for _ in range(3):
+        chain.score.refresh()
+    assert Feed(chain.score.db, failing).failures() == 1
+
+    chain.next_block()
+    chain.score.refresh()
+    assert Feed(chain.score.db, failing).failures() == 2
+
+
+def test_circuit_breaker():
+    chain = Chain()
+    healthy = chain.deploy_feed(10 ** 18)
+    failing = chain.deploy_feed(10 ** 18, failure_rate=1.0)
+    chain.score.add_feed(healthy, 'healthy')
+    chain.score.add_feed(failing, 'failing')
+    mock = Context.scores[failing]
+
+    # CLOSED -> OPEN after BREAKER_FAILURE_THRESHOLD failures
+    for _ in range(BREAKER_FAILURE_THRESHOLD):
+        chain.next_block()
+        chain.score.refresh()
+    health = chain.score.feed(failing)['health']
+    assert health['tripped']
+    assert health['next_probe'] == health['last_failure'] + BREAKER_PROBE_INTERVAL
+
+    # An open feed isn't peeked
+    peeks = mock.peeks
+    chain.next_block()
+    chain.score.refresh()
+    assert chain.score.value() == 10 ** 18
+    assert mock.peeks == peeks
+    assert [feed['status'] for feed in chain.score.malfunctioning_feeds()] == ['SKIPPED']
+
+    # HALF_OPEN once the probe interval elapsed : a failed probe doubles the interval
+    chain.next_block(BREAKER_PROBE_INTERVAL)
+    chain.score.refresh()
+    assert mock.peeks == peeks + 1
+    health = chain.score.feed(failing)['health']
+    assert health['next_probe'] == health['last_failure'] + 2 * BREAKER_PROBE_INTERVAL
+
+    # HALF_OPEN -> CLOSED once a probe succeeds
+    mock.failure_rate = 0
+    chain.next_block(2 * BREAKER_PROBE_INTERVAL)
+    chain.score.refresh()
+    health = chain.score.feed(failing)['health']
+    assert not health['tripped']
+    assert health['failures'] == 0
+    assert chain.score.malfunctioning_feeds() == []
+
+
+def test_deviation_stats(monkeypatch):
+    chain = Chain()
+    feeds = chain.deploy_feeds(3, spread=10 ** 16)
+    for index, feed in enumerate(feeds):
+        chain.score.add_feed(feed, f'feed{index}')
+
+    # Count the writes of each feed record
+    records = []
+    put = IconScoreDatabase.put
+
+    def counting_put(db, key, value):
+        if b'FEED_RECORD' in db._prefix + key:
+            records.append(key)
+        put(db, key, value)
+
+    monkeypatch.setattr(IconScoreDatabase, 'put', counting_put)
+
+    deviations = {feed: [] for feed in feeds}
+    for _ in range(20):
+        chain.next_block()
+        for feed in feeds:
+            Context.scores[feed].value = 10 ** 18 + chain.rng.randint(-10 ** 16, 10 ** 16)
+        del records[:]
+        chain.score.refresh()
+        # A single write per feed, with its price and its deviation
+        assert len(records) == len(set(records)) == len(feeds)
+
+        aggregated = chain.score.cached_value()['value']
+        for feed in feeds:
+            deviations[feed].append((Context.scores[feed].value - aggregated) * 10000 // aggregated)
+
+    for feed in feeds:
+        stats = chain.score.feed_stats(feed)
+        assert stats['count'] == 20
+        assert stats['max'] == max(map(abs, deviations[feed]))
+        assert stats['precision'] == DEVIATION_STATS_PRECISION
+        # The fixed point rounding errors stay below one unit per value
+        assert abs(stats['mean'] - statistics.mean(deviations[feed]) * DEVIATION_STATS_PRECISION) <= 20
+        variance = statistics.pvariance(deviations[feed]) * DEVIATION_STATS_PRECISION
+        assert abs(stats['variance'] - variance) <= 20 * max(map(abs, deviations[feed]))
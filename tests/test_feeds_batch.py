@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from iconservice import EVENTS, IconScoreException
+from Hylian.feed.feed_composite import FeedComposite
+from simulator.chain import Chain
+
+
+def feeds_json(addresses: list) -> str:
+    return json.dumps([{'address': str(address), 'name': f'feed{index}'} for index, address in enumerate(addresses)])
+
+
+def registry(chain: Chain) -> list:
+    return [feed['address'] for feed in chain.score.feeds(fields='address')]
+
+
+@pytest.fixture
+def chain():
+    chain = Chain()
+    chain.addresses = chain.deploy_feeds(6)
+    return chain
+
+
+def test_add_and_remove_feeds(chain):
+    first, second, third = chain.addresses[:3]
+    chain.score.add_feeds(feeds_json([first, second, third]))
+    assert registry(chain) == [first, second, third]
+    assert [feed['name'] for feed in chain.score.feeds(fields='name')] == ['feed0', 'feed1', 'feed2']
+    assert [args[1] for name, args in EVENTS if name == 'FeedAdded'] == [first, second, third]
+
+    chain.score.remove_feeds(json.dumps([str(first), str(third)]))
+    assert registry(chain) == [second]
+    assert [args[1] for name, args in EVENTS if name == 'FeedRemoved'] == [first, third]
+
+
+def test_replace_feeds(chain):
+    first, second, third, fourth = chain.addresses[:4]
+    chain.score.add_feeds(feeds_json([first, second, third]))
+    chain.score.set_feed_weight(second, 5)
+    del EVENTS[:]
+
+    chain.score.replace_feeds(feeds_json([second, fourth]))
+    # The kept feed keeps its record, the new feed is appended
+    assert registry(chain) == [second, fourth]
+    assert chain.score.feed(second)['weight'] == 5
+    assert [name for name, args in EVENTS if name in ('FeedRemoved', 'FeedAdded')] == \
+        ['FeedRemoved', 'FeedRemoved', 'FeedAdded']
+
+
+def test_replace_feeds_keeps_the_registry_order(chain):
+    a = chain.addresses
+    chain.score.add_feeds(feeds_json(a[:4]))
+    chain.score.move_feed(a[3], 0)
+
+    # The kept feeds stay in the registry order, not in the order of the list
+    chain.score.replace_feeds(feeds_json([a[4], a[2], a[3]]))
+    assert registry(chain) == [a[3], a[2], a[4]]
+
+
+def test_replace_feeds_checks_the_maximum_amount(chain, monkeypatch):
+    monkeypatch.setattr(FeedComposite, '_MAXIMUM_FEEDS', 4)
+    chain.score.add_feeds(feeds_json(chain.addresses[:3]))
+    storage = dict(chain.score.db._storage)
+
+    # One feed removed, three added
+    with pytest.raises(IconScoreException, match='TooMuchFeedsError'):
+        chain.score.replace_feeds(feeds_json(chain.addresses[1:6]))
+    assert chain.score.db._storage == storage
+
+    # The feeds removed make room for the feeds added
+    chain.score.replace_feeds(feeds_json(chain.addresses[2:6]))
+    assert registry(chain) == chain.addresses[2:6]
+
+
+@pytest.mark.parametrize('batch, error', [
+    # A duplicate in the batch
+    (lambda a: ('add_feeds', feeds_json([a[3], a[4], a[3]])), 'DuplicateFeedError'),
+    # A feed already registered at the end of the batch
+    (lambda a: ('add_feeds', feeds_json([a[3], a[4], a[0]])), 'FeedAlreadyExistsError'),
+    # An unknown feed at the end of the batch
+    (lambda a: ('remove_feeds', json.dumps([str(a[0]), str(a[1]), str(a[5])])), 'FeedNotExistsError'),
+    (lambda a: ('remove_feeds', json.dumps([str(a[0]), str(a[0])])), 'DuplicateFeedError'),
+    (lambda a: ('replace_feeds', feeds_json([a[3], a[3]])), 'DuplicateFeedError'),
+])
+def test_batch_is_all_or_nothing(chain, batch, error):
+    chain.score.add_feeds(feeds_json(chain.addresses[:3]))
+    storage = dict(chain.score.db._storage)
+
+    method, params = batch(chain.addresses)
+    with pytest.raises(IconScoreException, match=error):
+        getattr(chain.score, method)(params)
+
+    # Rejected before any write
+    assert chain.score.db._storage == storage
+    assert registry(chain) == chain.addresses[:3]
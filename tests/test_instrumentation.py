@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import IconScoreDatabase
+from simulator.chain import Chain
+from Hylian.main import Hylian
+
+
+def test_instrumentation_counts_the_storage_accesses():
+    chain = Chain(instrumented=True)
+    feeds = chain.deploy_feeds(5)
+    expected = {}
+
+    def call(name: str, *args) -> None:
+        _, stats = Chain.measure(getattr(chain.score, name), *args)
+        counter = expected.setdefault(name, {'calls': 0, 'reads': 0, 'writes': 0, 'score_calls': 0})
+        counter['calls'] += 1
+        counter['reads'] += stats['reads']
+        counter['writes'] += stats['writes']
+        counter['score_calls'] += stats['calls']
+
+    for index, feed in enumerate(feeds):
+        call('add_feed', feed, f'feed{index}')
+    for _ in range(3):
+        chain.next_block()
+        call('value')
+        call('refresh')
+        call('cached_value')
+
+    # The counters match every access of the simulated database
+    counters = chain.instrumentation()
+    for counter in counters.values():
+        del counter['time']
+    assert counters == expected
+    assert expected['refresh']['writes'] > 0
+    assert expected['value']['score_calls'] == 3 * 5
+
+
+def test_instrumentation_is_disabled_by_default():
+    chain = Chain()
+    db = IconScoreDatabase()
+    assert Hylian(db).db is db
+    assert chain.score._instrumentation is None
+
+    # Only the debug builds expose the counters
+    assert not hasattr(chain.score, 'instrumentation')
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from iconservice import IconScoreDatabase
+from Hylian.linked_list import InvalidPositionError, ItemAlreadyExistsError, ItemNotExistsError, LinkedList
+from simulator.chain import address
+
+
+def check(items: LinkedList, model: list) -> None:
+    assert list(items) == model
+    assert len(items) == len(model)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_linked_list_against_a_list(seed):
+    rng = random.Random(seed)
+    db = IconScoreDatabase()
+    items = LinkedList('ITEMS', db)
+    universe = [address('cx', index) for index in range(12)]
+    model = []
+
+    for _ in range(400):
+        item = rng.choice(universe)
+        operation = rng.choice(('append', 'remove', 'move', 'range', 'contains'))
+
+        if operation == 'append':
+            if item in model:
+                with pytest.raises(ItemAlreadyExistsError):
+                    items.append(item)
+            else:
+                items.append(item)
+                model.append(item)
+        elif operation == 'remove':
+            if item in model:
+                items.remove(item)
+                model.remove(item)
+            else:
+                with pytest.raises(ItemNotExistsError):
+                    items.remove(item)
+        elif operation == 'move':
+            position = rng.randint(-1, len(model))
+            if item not in model:
+                with pytest.raises(ItemNotExistsError):
+                    items.move(item, position)
+            elif not 0 <= position < len(model):
+                with pytest.raises(InvalidPositionError):
+                    items.move(item, position)
+            else:
+                items.move(item, position)
+                model.remove(item)
+                model.insert(position, item)
+        elif operation == 'range':
+            offset, limit = rng.randint(0, len(model) + 1), rng.randint(0, len(model) + 1)
+            assert items.range(offset, limit) == model[offset:offset + limit if limit else None]
+        else:
+            assert (item in items) == (item in model)
+
+        check(items, model)
+
+    # Clearing the list leaves nothing in the database
+    items.clear()
+    check(items, [])
+    assert db._storage == {}
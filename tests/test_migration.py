@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import Address, ArrayDB, DictDB, IconScoreDatabase, VarDB
+from Hylian.codec import Codec
+from Hylian.constants import DEFAULT_FEED_WEIGHT, VERSION
+from Hylian.feed.feed import Feed
+from Hylian.main import Hylian
+from simulator.chain import Chain
+
+LEGACY_VARIABLES = tuple(b'V|FEED_' + name + b'_' for name in (b'REGISTRATION', b'NAME', b'WEIGHT', b'VALUE', b'TIMESTAMP'))
+
+
+def legacy_score(version: str) -> tuple:
+    """ An empty Hylian SCORE, with the configuration of its first version """
+    chain = Chain()
+    db = IconScoreDatabase()
+    VarDB('VERSION', db, value_type=str).set(version)
+    VarDB('TICKER_NAME', db, value_type=str).set('ICXUSD')
+    VarDB('MINIMUM_FEEDS_AVAILABLE', db, value_type=int).set(1)
+    VarDB('TIMEOUT_PRICE_UPDATE', db, value_type=int).set(6 * 60 * 60 * 1000 * 1000)
+    chain.score = Hylian(db)
+    return chain, db
+
+
+def test_update_from_per_field_variables():
+    """ Before 1.4.0, each field of a feed had its own VarDB """
+    chain, db = legacy_score('1.3.0')
+    addresses = chain.deploy_feeds(4)
+    index = ArrayDB('FEED_COMPOSITE_INDEX', db, value_type=Address)
+    positions = DictDB('FEED_COMPOSITE_POSITION', db, value_type=int)
+    for position, address in enumerate(addresses):
+        index.put(address)
+        positions[address] = position + 1
+        VarDB(f'FEED_REGISTRATION_{address}', db, value_type=int).set(1000 + position)
+        VarDB(f'FEED_NAME_{address}', db, value_type=str).set(f'feed{position}')
+        # The first feeds were registered before the weights and the prices
+        if position >= 2:
+            VarDB(f'FEED_WEIGHT_{address}', db, value_type=int).set(position)
+            VarDB(f'FEED_VALUE_{address}', db, value_type=int).set(-position)
+            VarDB(f'FEED_TIMESTAMP_{address}', db, value_type=int).set(2000 + position)
+
+    chain.score.on_update()
+
+    assert chain.score.version() == VERSION
+    assert [feed['address'] for feed in chain.score.feeds(fields='address')] == addresses
+    for position, address in enumerate(addresses):
+        feed = chain.score.feed(address)
+        assert feed['registration'] == 1000 + position
+        assert feed['name'] == f'feed{position}'
+        assert feed['weight'] == (position if position >= 2 else DEFAULT_FEED_WEIGHT)
+        assert feed['last_value'] == (-position if position >= 2 else 0)
+        assert feed['last_timestamp'] == (2000 + position if position >= 2 else 0)
+
+    # Only the packed records and the registry remain
+    assert not [key for key in db._storage if key.startswith(LEGACY_VARIABLES)]
+    assert not [key for key in db._storage if b'FEED_COMPOSITE_POSITION' in key]
+    assert not [key for key, value in db._storage.items() if b'FEED_COMPOSITE_INDEX' in key and value != 0]
+
+    # The migrated feeds keep working
+    chain.score.refresh()
+    assert chain.score.cached_value()['value'] > 0
+
+
+def test_update_from_feeds_array():
+    """ Before 1.5.0, the packed records were indexed in an array, with their positions in a DictDB """
+    chain, db = legacy_score('1.4.0')
+    addresses = chain.deploy_feeds(5)
+    # The order of the array is not the order of the addresses
+    order = [addresses[index] for index in (3, 0, 4, 1, 2)]
+    index = ArrayDB('FEED_COMPOSITE_INDEX', db, value_type=Address)
+    positions = DictDB('FEED_COMPOSITE_POSITION', db, value_type=int)
+    records = DictDB('FEED_RECORD', db, value_type=bytes)
+    for position, address in enumerate(order):
+        index.put(address)
+        positions[address] = position + 1
+        record = [1000 + position, f'feed{position}', position + 1] + [0] * (len(Feed._LAYOUT) - 3)
+        records[address] = Codec.encode(Feed._LAYOUT, record)
+
+    chain.score.on_update()
+
+    assert chain.score.version() == VERSION
+    assert [feed['name'] for feed in chain.score.feeds(fields='name')] == [f'feed{position}' for position in range(5)]
+    assert [feed['address'] for feed in chain.score.feeds(fields='address')] == order
+    assert [chain.score.feed(address)['weight'] for address in order] == [1, 2, 3, 4, 5]
+
+    # The legacy array and positions are removed
+    assert not [key for key in db._storage if b'FEED_COMPOSITE_POSITION' in key]
+    assert not [key for key, value in db._storage.items() if b'FEED_COMPOSITE_INDEX' in key and value != 0]
+
+    # The registry works as usual after the update
+    chain.score.move_feed(order[4], 0)
+    chain.score.remove_feed(order[0])
+    assert [feed['address'] for feed in chain.score.feeds(fields='address')] == [order[4]] + order[1:4]
+    chain.score.refresh()
+    assert chain.score.cached_value()['value'] > 0
+
+
+def test_update_from_first_version():
+    """ Version 1.2.0 only stored the registration and the name of the feeds """
+    chain, db = legacy_score('1.2.0')
+    addresses = chain.deploy_feeds(3)
+    index = ArrayDB('FEED_COMPOSITE_INDEX', db, value_type=Address)
+    for position, address in enumerate(addresses):
+        index.put(address)
+        VarDB(f'FEED_REGISTRATION_{address}', db, value_type=int).set(1000 + position)
+        VarDB(f'FEED_NAME_{address}', db, value_type=str).set(f'feed{position}')
+
+    chain.score.on_update()
+
+    assert [feed['name'] for feed in chain.score.feeds(fields='name')] == ['feed0', 'feed1', 'feed2']
+    assert chain.score.aggregator() == 'median'
+    assert chain.score.value() > 0
+    assert not [key for key in db._storage if key.startswith(LEGACY_VARIABLES)]
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from iconservice import IconScoreException
+from Hylian.constants import VERSION
+from simulator.chain import Chain
+
+
+def multicall_chain(count: int = 3) -> Chain:
+    chain = Chain(minimum_feeds_available=2)
+    for index, feed in enumerate(chain.deploy_feeds(count)):
+        chain.score.add_feed(feed, f'feed{index}')
+    chain.next_block()
+    return chain
+
+
+def test_multicall_matches_the_getters():
+    chain = multicall_chain()
+    chain.score.refresh()
+    methods = ['ticker_name', 'minimum_feeds_available', 'timeout_price_update',
+               'version', 'feeds_count', 'cached_value', 'value']
+    result = chain.score.multicall(json.dumps(methods))
+    assert list(result) == methods
+    for method in methods:
+        assert result[method] == getattr(chain.score, method)()
+    assert result['version'] == VERSION
+    assert result['feeds_count'] == 3
+
+
+def test_multicall_reads_the_configuration_once():
+    chain = multicall_chain()
+    _, one = Chain.measure(chain.score.multicall, json.dumps(['ticker_name']))
+    _, many = Chain.measure(chain.score.multicall, json.dumps(
+        ['ticker_name', 'minimum_feeds_available', 'timeout_price_update', 'configuration']))
+    assert many['reads'] == one['reads']
+
+
+def test_multicall_rejects_unsupported_methods():
+    chain = multicall_chain()
+    with pytest.raises(IconScoreException, match='MulticallMethodNotSupportedError'):
+        chain.score.multicall(json.dumps(['ticker_name', 'add_feed']))
+
+
+def test_state():
+    chain = multicall_chain()
+    state = chain.score.state()
+    assert state['configuration'] == chain.score.multicall(json.dumps(['configuration']))['configuration']
+    assert state['version'] == VERSION
+    assert state['value'] == chain.score.value()
+    assert 'reason' not in state
+
+    # The configuration is still returned below the minimum amount of feeds
+    chain.score.set_minimum_feeds_available(4)
+    state = chain.score.state()
+    assert 'value' not in state
+    assert 'NotEnoughFeedsAvailable' in state['reason']
+    assert state['configuration']['minimum_feeds_available'] == 4
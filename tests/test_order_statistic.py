@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+from Hylian.math import Math
+from Hylian.order_statistic import IndexedHeap, MedianHeap, MemoryArray, MemoryDict
+
+
+def check_heap(heap: IndexedHeap, expected: dict) -> None:
+    assert len(heap) == len(expected)
+    for index, key in enumerate(heap._items):
+        assert heap._positions[key] == index + 1
+        assert heap.value(key) == expected[key]
+        for child in (2 * index + 1, 2 * index + 2):
+            if child < len(heap):
+                assert not heap._before(heap.value(heap._items[child]), heap.value(key))
+
+
+def check_median(heap: MedianHeap, expected: dict) -> None:
+    assert dict(heap.items()) == expected
+    check_heap(heap._lower, dict(heap._lower.items()))
+    check_heap(heap._upper, dict(heap._upper.items()))
+    assert len(heap._upper) <= len(heap._lower) <= len(heap._upper) + 1
+    if expected:
+        assert heap.median() == Math.median(list(expected.values()))
+
+
+def test_indexed_heap_fuzz():
+    rng = random.Random(0)
+    for is_max in (False, True):
+        heap = IndexedHeap(MemoryArray(), MemoryDict(), MemoryDict(), is_max)
+        expected = {}
+        for _ in range(2000):
+            key = rng.randrange(50)
+            action = rng.random()
+            if action < 0.6:
+                expected[key] = rng.randrange(100)
+                heap.update(key, expected[key])
+            elif action < 0.8 and key in expected:
+                heap.remove(key)
+                del expected[key]
+            elif action < 0.9 and expected:
+                top = heap.pop()
+                best = max(expected.values()) if is_max else min(expected.values())
+                assert expected.pop(top) == best
+            else:
+                expected = {k: rng.randrange(100) for k in rng.sample(range(50), rng.randrange(50))}
+                heap.rebuild(expected)
+            check_heap(heap, expected)
+
+
+def test_median_heap_fuzz():
+    rng = random.Random(1)
+    for _ in range(300):
+        heap = MedianHeap.in_memory()
+        expected = {}
+        for _ in range(200):
+            key = rng.randrange(30)
+            action = rng.random()
+            if action < 0.7:
+                expected[key] = rng.randrange(-1000, 1000)
+                heap.update(key, expected[key])
+            elif action < 0.95:
+                if key in expected:
+                    heap.remove(key)
+                    del expected[key]
+            else:
+                expected = {k: rng.randrange(-1000, 1000) for k in rng.sample(range(30), rng.randrange(30))}
+                heap.rebuild(expected)
+            check_median(heap, expected)
+
+
+def test_median_heap_unchanged_value_is_free():
+    heap = MedianHeap.in_memory()
+    for key in range(10):
+        heap.update(key, key * 10)
+
+    items = list(heap._lower._items), list(heap._upper._items)
+    heap.update(3, 30)
+    heap.update(8, 80)
+    assert (list(heap._lower._items), list(heap._upper._items)) == items
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from iconservice import EVENTS, Context, IconScoreException
+from Hylian.constants import DEFAULT_HEARTBEAT
+from simulator.chain import BLOCK_INTERVAL, Chain
+
+
+def price_updates() -> list:
+    return [args[1] for name, args in EVENTS if name == 'PriceUpdated']
+
+
+@pytest.fixture
+def chain():
+    chain = Chain()
+    chain.feed = chain.deploy_feed(10_000)
+    chain.score.add_feed(chain.feed, 'feed')
+    return chain
+
+
+def test_deviation_threshold_and_heartbeat(chain):
+    chain.score.set_deviation_threshold(50)
+    chain.score.set_heartbeat(10 * BLOCK_INTERVAL)
+    chain.score.refresh()
+
+    # A change below 50 basis points is ignored until the heartbeat
+    Context.scores[chain.feed].value = 10_040
+    chain.next_block()
+    chain.score.refresh()
+    assert chain.score.cached_value()['value'] == 10_000
+
+    # A change of 50 basis points is stored
+    Context.scores[chain.feed].value = 10_050
+    chain.next_block()
+    chain.score.refresh()
+    assert chain.score.cached_value()['value'] == 10_050
+
+    # The heartbeat stores the value even if it didn't change
+    chain.next_block(11)
+    chain.score.refresh()
+    assert price_updates() == [10_000, 10_050, 10_050]
+
+
+@pytest.mark.parametrize('method, value, error', [
+    ('set_heartbeat', 0, 'InvalidHeartbeatError'),
+    ('set_heartbeat', -1, 'InvalidHeartbeatError'),
+    ('set_deviation_threshold', -1, 'InvalidDeviationThresholdError'),
+])
+def test_invalid_settings(chain, method, value, error):
+    del EVENTS[:]
+    with pytest.raises(IconScoreException, match=error):
+        getattr(chain.score, method)(value)
+    assert not [name for name, args in EVENTS if name == 'ConfigChanged']
+    assert chain.score.heartbeat() == DEFAULT_HEARTBEAT
+    assert chain.score.deviation_threshold() == 0
+
+
+def test_null_deviation_threshold_stores_every_value(chain):
+    chain.score.set_deviation_threshold(0)
+    for _ in range(3):
+        chain.next_block()
+        chain.score.refresh()
+    assert price_updates() == [10_000] * 3
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import random
+
+import pytest
+
+from iconservice import Context, IconScoreDatabase, IconScoreException
+from Hylian.constants import PRICE_HISTORY_CAPACITY
+from Hylian.price_history import HistoryNotAvailableError, InvalidWindowError, PriceHistory
+from simulator.chain import BLOCK_INTERVAL, Chain
+
+
+def brute_force_twap(entries: list, window: int, now: int) -> int:
+    """ Integrate the latest value over each microsecond range of the window """
+    start = now - window
+    total = 0
+    for index, (timestamp, value) in enumerate(entries):
+        end = entries[index + 1][0] if index + 1 < len(entries) else now
+        total += value * max(0, min(end, now) - max(timestamp, start))
+    return total // window
+
+
+def test_twap_and_history_fuzz():
+    rng = random.Random(0)
+    db = IconScoreDatabase()
+    entries = []
+    now = 1_000_000
+    for _ in range(3 * PRICE_HISTORY_CAPACITY):
+        now += rng.choice((0, 1, rng.randrange(1, 10_000)))
+        value = rng.randrange(1, 10 ** 6)
+        PriceHistory.append(db, now, value)
+        if entries and entries[-1][0] == now:
+            # Several values at the same time : the latest one is kept
+            entries[-1] = (now, value)
+        else:
+            entries.append((now, value))
+
+        kept = entries[-PRICE_HISTORY_CAPACITY:]
+        query = now + rng.randrange(0, 1000)
+        window = rng.randrange(1, query - kept[0][0] + 1000)
+        if query - window < kept[0][0]:
+            with pytest.raises(HistoryNotAvailableError):
+                PriceHistory.twap(db, window, query)
+        else:
+            assert PriceHistory.twap(db, window, query) == brute_force_twap(kept, window, query)
+
+    low, high = sorted(rng.choice(kept)[0] for _ in range(2))
+    assert PriceHistory.serialize(db, low, high) == [
+        {'timestamp': timestamp, 'value': value} for timestamp, value in kept if low <= timestamp <= high
+    ]
+
+
+def test_invalid_window():
+    with pytest.raises(InvalidWindowError):
+        PriceHistory.twap(IconScoreDatabase(), 0, 1)
+
+
+def test_twap_external():
+    chain = Chain()
+    feed = chain.deploy_feed(100)
+    chain.score.add_feed(feed, 'feed')
+    chain.score.refresh()
+    start = chain.score.now()
+
+    chain.next_block(3)
+    Context.scores[feed].value = 200
+    chain.score.refresh()
+    chain.next_block(1)
+
+    # 100 during 3 blocks, then 200 during 1 block
+    assert chain.score.twap(4 * BLOCK_INTERVAL) == (100 * 3 + 200) // 4
+    assert [entry['value'] for entry in chain.score.history(start, chain.score.now())] == [100, 200]
+    with pytest.raises(IconScoreException, match='HistoryNotAvailableError'):
+        chain.score.twap(5 * BLOCK_INTERVAL)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import random
+
+import pytest
+
+from Hylian.math import InvalidQuantilePointError, Math
+from simulator.chain import Chain
+
+
+def quantile(values: list, point: int) -> int:
+    """ Reference quantile, read from the sorted values """
+    ordered = sorted(values)
+    rank, remainder = divmod(point * (len(ordered) - 1), 100)
+    if remainder == 0:
+        return ordered[rank]
+    return ordered[rank] + (ordered[rank + 1] - ordered[rank]) * remainder // 100
+
+
+def test_quantiles_fuzz():
+    rng = random.Random(0)
+    for _ in range(500):
+        values = [rng.randrange(-1000, 1000) for _ in range(rng.randrange(1, 40))]
+        points = [rng.randrange(101) for _ in range(rng.randrange(1, 6))]
+        assert Math.quantiles(list(values), points) == [quantile(values, point) for point in points]
+        assert Math.median(list(values)) == quantile(values, 50)
+
+
+def test_quantiles_invalid_point():
+    with pytest.raises(InvalidQuantilePointError):
+        Math.quantiles([1, 2, 3], [101])
+
+
+def test_quantiles_external():
+    chain = Chain()
+    prices = [10 ** 18 + delta for delta in (-30, -10, 0, 20, 50)]
+    for price in prices:
+        chain.score.add_feed(chain.deploy_feed(price), 'feed')
+
+    result = chain.score.quantiles(json.dumps([0, 25, 50, 90, 100]))
+    assert result == {str(point): quantile(prices, point) for point in (0, 25, 50, 90, 100)}
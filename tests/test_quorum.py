@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from iconservice import Context, IconScoreException
+from Hylian.constants import DEFAULT_QUORUM_TOLERANCE
+from Hylian.feed.feed import Feed
+from simulator.chain import Chain
+from test_migration import legacy_score
+
+
+def peeked(chain: Chain, feeds: list) -> list:
+    return [feed for feed in feeds if Context.scores[feed].peeks > 0]
+
+
+def reset_peeks(feeds: list) -> None:
+    for feed in feeds:
+        Context.scores[feed].peeks = 0
+
+
+def quorum_chain(count: int = 10, minimum: int = 3) -> tuple:
+    chain = Chain(minimum_feeds_available=minimum)
+    feeds = chain.deploy_feeds(count, spread=100)
+    for feed in feeds:
+        chain.score.add_feed(feed, 'feed')
+    chain.score.set_evaluation_mode('quorum')
+    reset_peeks(feeds)
+    return chain, feeds
+
+
+def test_quorum_stops_early():
+    chain, feeds = quorum_chain()
+    _, stats = Chain.measure(chain.score.value)
+    assert stats['calls'] == 3
+    assert peeked(chain, feeds) == feeds[:3]
+
+
+def test_quorum_falls_back_to_every_feed():
+    chain, feeds = quorum_chain()
+    Context.scores[feeds[1]].value *= 2
+    _, stats = Chain.measure(chain.score.value)
+    assert stats['calls'] == 10
+
+
+def test_quorum_tolerance_after_update():
+    """ The deployments older than the tolerance setting get its default value """
+    chain, db = legacy_score('1.3.0')
+    chain.score.on_update()
+    assert chain.score.quorum_tolerance() == DEFAULT_QUORUM_TOLERANCE
+
+    feeds = chain.deploy_feeds(10, spread=100)
+    for feed in feeds:
+        chain.score.add_feed(feed, 'feed')
+    chain.score.set_minimum_feeds_available(3)
+    chain.score.set_evaluation_mode('quorum')
+    reset_peeks(feeds)
+    _, stats = Chain.measure(chain.score.value)
+    assert stats['calls'] == 3
+
+
+def test_negative_quorum_tolerance():
+    chain, feeds = quorum_chain()
+    with pytest.raises(IconScoreException, match='InvalidQuorumToleranceError'):
+        chain.score.set_quorum_tolerance(-1)
+    chain.score.set_quorum_tolerance(0)
+    assert chain.score.quorum_tolerance() == 0
+
+
+@pytest.mark.parametrize('order, expected', [
+    # Decreasing weight, then increasing failures
+    ('weight', [5, 8, 2]),
+    # Increasing failures, then decreasing weight
+    ('health', [5, 9, 0]),
+    # Registry order, after moving the last feed first
+    ('registry', [9, 0, 1]),
+])
+def test_quorum_order(order, expected):
+    chain, feeds = quorum_chain()
+    chain.score.set_feed_weight(feeds[5], 3)
+    chain.score.set_feed_weight(feeds[8], 2)
+    chain.score.set_feed_weight(feeds[2], 2)
+    Feed(chain.score.db, feeds[8]).record_failure(1)
+    Feed(chain.score.db, feeds[2]).record_failure(1)
+    chain.score.move_feed(feeds[9], 0)
+    chain.score.set_quorum_order(order)
+    assert chain.score.quorum_order() == order
+
+    chain.score.value()
+    assert set(peeked(chain, feeds)) == set(feeds[index] for index in expected)
+
+
+def test_unsupported_quorum_order():
+    chain, feeds = quorum_chain()
+    with pytest.raises(IconScoreException, match='QuorumOrderNotSupportedError'):
+        chain.score.set_quorum_order('random')
+    assert chain.score.quorum_order() == 'weight'
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import pytest
+
+from iconservice import IconScoreException
+from simulator.chain import Chain
+
+
+def test_tickers():
+    chain = Chain(ticker_name='ICXUSD')
+    chain.score.add_ticker('BTCUSD', 2)
+    assert chain.score.tickers() == ['ICXUSD', 'BTCUSD']
+
+    chain.score.add_feed(chain.deploy_feed(100), 'icx')
+    chain.ticker_name = 'BTCUSD'
+    for price in (50_000, 50_010, 49_990):
+        chain.score.add_feed(chain.deploy_feed(price), 'btc', 'BTCUSD')
+
+    assert chain.score.feeds_count() == 1
+    assert chain.score.feeds_count('BTCUSD') == 3
+    assert chain.score.minimum_feeds_available('BTCUSD') == 2
+    assert chain.score.value() == 100
+    assert chain.score.value('BTCUSD') == 50_000
+    assert chain.score.values(json.dumps(['ICXUSD', 'BTCUSD'])) == {'ICXUSD': 100, 'BTCUSD': 50_000}
+
+
+def test_remove_ticker_clears_its_storage():
+    chain = Chain(ticker_name='ICXUSD')
+    chain.score.add_ticker('BTCUSD', 1)
+    chain.ticker_name = 'BTCUSD'
+    chain.score.add_feed(chain.deploy_feed(50_000), 'btc', 'BTCUSD')
+    chain.score.refresh('BTCUSD')
+
+    chain.score.remove_ticker('BTCUSD')
+    assert chain.score.tickers() == ['ICXUSD']
+    # Only the sizes of the emptied arrays may remain
+    storage = chain.score.db._storage
+    assert not [key for key in storage if key.startswith(b'TICKER_BTCUSD|') and storage[key] != 0]
+    with pytest.raises(IconScoreException, match='TickerNotExistsError'):
+        chain.score.value('BTCUSD')
+
+
+def test_ticker_errors():
+    chain = Chain(ticker_name='ICXUSD')
+    chain.score.add_ticker('BTCUSD', 1)
+    with pytest.raises(IconScoreException, match='TickerAlreadyExistsError'):
+        chain.score.add_ticker('BTCUSD', 1)
+    with pytest.raises(IconScoreException, match='TickerAlreadyExistsError'):
+        chain.score.add_ticker('ICXUSD', 1)
+    with pytest.raises(IconScoreException, match='PrimaryTickerError'):
+        chain.score.remove_ticker('ICXUSD')
+    with pytest.raises(IconScoreException, match='TickerNotExistsError'):
+        chain.score.remove_ticker('ETHUSD')
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from iconservice import Context, ExecutionContext, Transaction
+from simulator.chain import Chain
+
+
+def test_tx_cache_is_scoped_to_the_execution():
+    chain = Chain()
+    feed = chain.deploy_feed(100)
+    chain.score.add_feed(feed, 'feed')
+    chain.next_block()
+    Context.tx = Transaction(b'\x01' * 32)
+
+    # The feed is peeked once in the transaction
+    assert chain.score.value() == 100
+    Context.scores[feed].value = 200
+    assert chain.score.value() == 100
+    assert Context.scores[feed].peeks == 1
+
+    # The same transaction executed again in a new context sees the new price
+    Context.execution = ExecutionContext()
+    assert chain.score.value() == 200
+
+    # A method changing the state discards the cached results
+    Context.scores[feed].value = 300
+    chain.score.refresh()
+    assert chain.score.value() == 300
+    Context.tx = None
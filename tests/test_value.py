@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+# Copyright 2019 ICONation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+
+from simulator.chain import Chain
+
+
+@pytest.mark.parametrize('count', [1, 10, 100])
+def test_value_reads(count):
+    """ value() reads each feed record twice, plus a constant overhead :
+        a regression of this count is a regression of the cost of value() """
+    chain = Chain()
+    for feed in chain.deploy_feeds(count):
+        chain.score.add_feed(feed, 'feed')
+    chain.next_block()
+
+    value, stats = Chain.measure(chain.score.value)
+    assert value > 0
+    assert stats['reads'] == 2 * count + 11
+    assert stats['writes'] == 0
+    assert stats['calls'] == count